@@ -0,0 +1,57 @@
+"""Compare the compiled `BracketTable` lookup against the original linear bracket walk.
+
+Run with `python -m benchmarks.bench_brackets`. Exits with status 1 if the table is slower than
+the linear walk for any province and year.
+"""
+import sys
+import timeit
+from decimal import Decimal, ROUND_HALF_UP
+
+from canatax.calculators import BaseCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.tax_rates import rates_2024, rates_2025
+from canatax.utils import percent_to_decimal
+
+INCOMES = [Decimal(n) + Decimal('0.25') for n in (12_000, 48_000, 75_000, 105_000, 160_000, 240_000, 480_000)]
+
+
+def linear_calculate_tax(brackets, income: Decimal) -> Decimal:
+    tax_owed = Decimal(0)
+    previous_threshold = Decimal(0)
+    for rate, threshold in brackets:
+        if income > threshold:
+            tax_owed += (Decimal(threshold) - Decimal(previous_threshold)) * percent_to_decimal(rate)
+            previous_threshold = threshold
+        else:
+            tax_owed += (income - Decimal(previous_threshold)) * percent_to_decimal(rate)
+            break
+    return tax_owed.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def rate_classes():
+    for year, module in ((2024, rates_2024), (2025, rates_2025)):
+        yield year, "FED", module.FederalIncomeTaxRate
+        for province in ProvinceOrTerritory:
+            yield year, province.value, BaseCalculator.get_income_rate_class(province, year)
+
+
+def main(number: int = 2000) -> int:
+    slower = []
+    print(f"{'year':<6}{'rate':<6}{'linear us':>12}{'table us':>12}{'speedup':>10}")
+    for year, name, klass in rate_classes():
+        rate = klass()
+        brackets = klass.brackets
+        linear = timeit.timeit(lambda: [linear_calculate_tax(brackets, i) for i in INCOMES], number=number)
+        table = timeit.timeit(lambda: [rate.calculate_tax(i) for i in INCOMES], number=number)
+        per_call = number * len(INCOMES) / 1e6
+        print(f"{year:<6}{name:<6}{linear / per_call:>12.3f}{table / per_call:>12.3f}{linear / table:>9.2f}x")
+        if table >= linear:
+            slower.append((year, name))
+    if slower:
+        print(f"Table lookup was slower for: {slower}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Measure memory per estimate and `to_dict` speed of the slotted, frozen estimate types.
+
+Run with `python -m benchmarks.bench_estimate_memory`. The "before" numbers use a replica of the previous
+plain dataclasses, whose `to_dict` went through `dataclasses.asdict` and a second prettify pass.
+"""
+import gc
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+
+from canatax.calculators import IncomeTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.tax_estimate import IncomeTaxEstimate, _pretty
+
+COUNT = 100_000
+
+
+@dataclass
+class LegacyIncomeTaxEstimate:
+    province: ProvinceOrTerritory
+    gross_income: Decimal
+    federal_tax: Decimal
+    provincial_tax: Decimal
+    cpp: Decimal
+    ei: Decimal
+    qpip: Decimal
+    qpp: Decimal
+    total_tax: Decimal
+    after_tax_income: Decimal
+
+    def to_dict(self, prettify: bool = False):
+        d = asdict(self)
+        if prettify:
+            d = {k: _pretty(v) for k, v in d.items()}
+        return d
+
+
+def bytes_per_estimate(klass: type, values: tuple) -> float:
+    """Memory held by the estimate objects themselves; the field values are shared between all of them."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    estimates = [klass(*values) for _ in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del estimates
+    return (after - before) / COUNT
+
+
+def main(number: int = 20_000) -> dict[str, float]:
+    values = IncomeTaxCalculator.calculate(91_234.56, 5_000, "QC").to_tuple()
+    legacy, current = LegacyIncomeTaxEstimate(*values), IncomeTaxEstimate(*values)
+    results = {
+        "bytes_before": bytes_per_estimate(LegacyIncomeTaxEstimate, values),
+        "bytes_after": bytes_per_estimate(IncomeTaxEstimate, values),
+        "to_dict_before_us": timeit.timeit(lambda: legacy.to_dict(prettify=True), number=number) / number * 1e6,
+        "to_dict_after_us": timeit.timeit(lambda: current.to_dict(prettify=True), number=number) / number * 1e6,
+        "to_tuple_us": timeit.timeit(current.to_tuple, number=number) / number * 1e6,
+    }
+    print(f"bytes per estimate: {results['bytes_before']:.0f} before, {results['bytes_after']:.0f} after")
+    print(f"to_dict(prettify=True): {results['to_dict_before_us']:.2f} us before, {results['to_dict_after_us']:.2f} us after")
+    print(f"to_tuple(): {results['to_tuple_us']:.2f} us")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""Benchmark suite for canatax, stdlib only.
+
+Times the hot paths for every province and territory and every supported year, writes the results as
+JSON, and compares them with a saved baseline:
+
+    python -m benchmarks.run --save                 # record benchmarks/baseline.json on this machine
+    python -m benchmarks.run --threshold 20         # exit 1 if any case got more than 20% slower
+    python -m benchmarks.run --only income.calculate --years 2025
+
+Each case is timed `--repeat` times and the fastest run is kept, in microseconds per call. Income
+profiles are drawn from a seeded log-normal distribution with a share of self-employed filers, so
+CPP/QPP self-employment, QPIP and the BPA phase-outs are all exercised.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.registry import SUPPORTED_YEARS, rate_registry
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 25.0
+
+
+def income_profiles(count: int = 64, seed: int = 2025) -> list[tuple[float, float, float, float]]:
+    """Return (employment, self-employment, RRSP/FHSA, other) income profiles with a realistic spread."""
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        income = round(rng.lognormvariate(11.0, 0.65), 2)
+        if rng.random() < 0.2:
+            split = rng.random()
+            employment, self_employment = round(income * split, 2), round(income * (1 - split), 2)
+        else:
+            employment, self_employment = income, 0.0
+        rrsp_fhsa = round(min(income * 0.18, 32_490) * rng.random(), 2) if rng.random() < 0.3 else 0.0
+        other = round(rng.expovariate(1 / 2_000), 2) if rng.random() < 0.25 else 0.0
+        profiles.append((employment, self_employment, rrsp_fhsa, other))
+    return profiles
+
+
+def sales_amounts(count: int = 64, seed: int = 2025) -> list[float]:
+    rng = random.Random(seed)
+    return [round(rng.lognormvariate(3.5, 1.2), 2) for _ in range(count)]
+
+
+def cases(years: tuple[int, ...]) -> dict[str, tuple[Callable[[], object], int]]:
+    """Return {case name: (function timing one pass, calls per pass)}."""
+    profiles = income_profiles()
+    amounts = sales_amounts()
+    net_incomes = [Decimal(str(e + s + o)) for e, s, _, o in profiles]
+    result: dict[str, tuple[Callable[[], object], int]] = {}
+    for year in years:
+        for province in ProvinceOrTerritory:
+            suffix = f"{year}.{province.value}"
+            income_rate = rate_registry.income_rate(province, year)
+            estimate = IncomeTaxCalculator.calculate(*profiles[0][:2], province, year, *profiles[0][2:])
+
+            def income_calculate(province=province, year=year):
+                for employment, self_employment, rrsp_fhsa, other in profiles:
+                    IncomeTaxCalculator.calculate(employment, self_employment, province, year, rrsp_fhsa, other)
+
+            def income_construct(province=province, year=year):
+                for employment, self_employment, rrsp_fhsa, other in profiles:
+                    IncomeTaxCalculator(employment, self_employment, province, year, rrsp_fhsa, other)
+
+            def sales_calculate(province=province, year=year):
+                for amount in amounts:
+                    SalesTaxCalculator.calculate(amount, province, year)
+
+            def sales_construct(province=province, year=year):
+                for _ in amounts:
+                    SalesTaxCalculator(province, year)
+
+            def calculate_tax(rate=income_rate):
+                for income in net_incomes:
+                    rate.calculate_tax(income)
+
+            def get_bpa(rate=income_rate):
+                for income in net_incomes:
+                    rate.get_bpa(income)
+
+            def to_dict(estimate=estimate):
+                for _ in amounts:
+                    estimate.to_dict(prettify=True)
+
+            result[f"income.calculate.{suffix}"] = (income_calculate, len(profiles))
+            result[f"income.construct.{suffix}"] = (income_construct, len(profiles))
+            result[f"sales.calculate.{suffix}"] = (sales_calculate, len(amounts))
+            result[f"sales.construct.{suffix}"] = (sales_construct, len(amounts))
+            result[f"rate.calculate_tax.{suffix}"] = (calculate_tax, len(net_incomes))
+            result[f"rate.get_bpa.{suffix}"] = (get_bpa, len(net_incomes))
+            result[f"estimate.to_dict.{suffix}"] = (to_dict, len(amounts))
+        federal_rate = rate_registry.federal_rate(year)
+        result[f"rate.calculate_tax.{year}.FED"] = (lambda rate=federal_rate: [rate.calculate_tax(i) for i in net_incomes], len(net_incomes))
+        result[f"rate.get_bpa.{year}.FED"] = (lambda rate=federal_rate: [rate.get_bpa(i) for i in net_incomes], len(net_incomes))
+    return result
+
+
+def run(only: str | None = None, years: tuple[int, ...] = SUPPORTED_YEARS, repeat: int = 5, number: int = 3) -> dict[str, float]:
+    """Run the selected cases and return microseconds per call for each."""
+    results = {}
+    for name, (func, calls) in cases(years).items():
+        if only and only not in name:
+            continue
+        func()  # warm up registries and compiled tables
+        best = min(timeit.repeat(func, repeat=repeat, number=number))
+        results[name] = best / (number * calls) * 1e6
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[tuple[str, float, float]]:
+    """Return (name, baseline us, current us) for every case more than `threshold` percent slower than its baseline."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous and current > previous * (1 + threshold / 100):
+            regressions.append((name, previous, current))
+    return regressions
+
+
+def _document(results: dict[str, float]) -> dict:
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "unit": "us_per_call",
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare with or save to.")
+    parser.add_argument("--save", action="store_true", help="Write this run as the new baseline instead of comparing.")
+    parser.add_argument("--output", type=Path, help="Also write this run's results to a JSON file.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help=f"Allowed slowdown in percent (default {DEFAULT_THRESHOLD:g}).")
+    parser.add_argument("--only", help="Only run cases whose name contains this text, e.g. income.calculate or .QC.")
+    parser.add_argument("--years", type=int, nargs="+", default=list(SUPPORTED_YEARS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run(args.only, tuple(args.years), args.repeat, args.number)
+    for name, us in results.items():
+        print(f"{name:<40}{us:>10.2f} us")
+    print(f"{len(results)} cases in {time.perf_counter() - started:.1f}s")
+
+    document = _document(results)
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2))
+    if args.save:
+        args.baseline.write_text(json.dumps(document, indent=2))
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save to create one.")
+        return 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.threshold)
+    for name, previous, current in regressions:
+        print(f"REGRESSION {name}: {previous:.2f} us -> {current:.2f} us (+{(current / previous - 1) * 100:.0f}%)")
+    if regressions:
+        return 1
+    print(f"No case regressed by more than {args.threshold:g}% against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
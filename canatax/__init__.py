@@ -1,3 +1,29 @@
-from canatax.calculators import IncomeTaxCalculator
-from canatax.calculators import SalesTaxCalculator
-from canatax.exc import InvalidDollarAmount, InvalidProvinceError
\ No newline at end of file
+"""Canadian income and sales tax estimates.
+
+The calculators are imported on first use (PEP 562 module `__getattr__`), so `import canatax` stays cheap
+for command-line tools and short-lived workers that may only need part of the package.
+"""
+from importlib import import_module
+
+_LAZY = {
+    "IncomeTaxCalculator": "canatax.calculators.income_calculator",
+    "SalesTaxCalculator": "canatax.calculators.sales_calculator",
+    "PayrollCalculator": "canatax.calculators.payroll_calculator",
+    "InvalidDollarAmount": "canatax.exc",
+    "InvalidProvinceError": "canatax.exc",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,217 @@
+"""Stream CSV or JSONL rows through the tax calculators.
+
+Examples:
+    python -m canatax income payroll.csv -o estimates.csv --column employment_income=salary --keep employee_id
+    python -m canatax sales orders.jsonl --province ON --column amount=subtotal
+
+Rows are read, estimated and written one at a time, so memory use does not depend on the input size.
+A throughput summary is printed to stderr when the run finishes.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterator, TextIO
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.enums import Engine, ProvinceOrTerritory
+from canatax.exc import CanataxError
+from canatax.rates.registry import SUPPORTED_YEARS
+
+
+INCOME_FIELDS = ("employment_income", "self_employment_income", "province", "rrsp_fhsa_contributions", "other_income")
+SALES_FIELDS = ("amount", "province")
+OPTIONAL_DEFAULTS = {"self_employment_income": 0, "rrsp_fhsa_contributions": 0, "other_income": 0}
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _read_csv(stream: TextIO) -> Iterator[dict[str, Any]]:
+    yield from csv.DictReader(stream)
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[str]:
+    # Lines are decoded by `_decode_row` inside the row loop, so a malformed line only fails its own row
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+def _decode_row(row: dict[str, Any] | str) -> dict[str, Any]:
+    """Return a row as a dict, decoding JSONL lines.
+
+    Raises:
+        ValueError: If a JSONL line is not a JSON object.
+    """
+    if not isinstance(row, str):
+        return row
+    row = json.loads(row)
+    if not isinstance(row, dict):
+        raise ValueError(f"Expected a JSON object, got {type(row).__name__}")
+    return row
+
+
+class _CsvWriter:
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.writer = None
+
+    def write(self, row: dict[str, Any]):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.stream, fieldnames=list(row))
+            self.writer.writeheader()
+        self.writer.writerow(row)
+
+
+class _JsonlWriter:
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write(self, row: dict[str, Any]):
+        self.stream.write(json.dumps(row))
+        self.stream.write("\n")
+
+
+READERS = {"csv": _read_csv, "jsonl": _read_jsonl}
+WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter}
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _detect_format(path: str | None, default: str = "csv") -> str:
+    if path and path.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path and path.lower().endswith(".csv"):
+        return "csv"
+    return default
+
+
+def _parse_columns(pairs: list[str], fields: tuple[str, ...]) -> dict[str, str]:
+    mapping = {field: field for field in fields}
+    for pair in pairs:
+        field, sep, column = pair.partition("=")
+        if not sep or field not in mapping:
+            raise argparse.ArgumentTypeError(f"Invalid column mapping `{pair}`; expected FIELD=COLUMN with FIELD one of {', '.join(fields)}")
+        mapping[field] = column
+    return mapping
+
+
+def _estimator(args: argparse.Namespace, columns: dict[str, str]) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return a function turning one input row into one output row."""
+    engine = Engine(args.engine)
+
+    def field(row: dict[str, Any], name: str) -> Any:
+        value = row.get(columns[name])
+        if value in (None, ""):
+            if name == "province" and args.province:
+                return args.province
+            return OPTIONAL_DEFAULTS.get(name, value)
+        return value
+
+    def province(row: dict[str, Any]) -> ProvinceOrTerritory:
+        # Coerced before the cached lookups below, which would choke on an unhashable JSON value
+        return BaseCalculator._coerce_province(field(row, "province"))
+
+    if args.tax_type == "income":
+        @lru_cache(maxsize=None)
+        def plan(province: ProvinceOrTerritory):
+            return IncomeTaxCalculator.compile(province, args.year, engine)
+
+        def estimate(row: dict[str, Any]):
+            return plan(province(row))(
+                field(row, "employment_income"),
+                field(row, "self_employment_income"),
+                field(row, "rrsp_fhsa_contributions"),
+                field(row, "other_income"),
+            )
+    else:
+        @lru_cache(maxsize=None)
+        def calculator(province: ProvinceOrTerritory):
+            return SalesTaxCalculator.compile(province, args.year, engine)
+
+        def estimate(row: dict[str, Any]):
+            return calculator(province(row))(field(row, "amount"))
+
+    def process(row: dict[str, Any]) -> dict[str, Any]:
+        out = {name: row.get(name) for name in args.keep}
+        for key, value in estimate(row).to_dict().items():
+            out[key] = _serialize(value)
+        return out
+
+    return process
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m canatax", description="Estimate Canadian income or sales tax for every row of a CSV or JSONL file.")
+    parser.add_argument("tax_type", choices=("income", "sales"), help="Which calculator to run.")
+    parser.add_argument("input", nargs="?", default="-", help="Input file, or - for stdin (default).")
+    parser.add_argument("-o", "--output", default="-", help="Output file, or - for stdout (default).")
+    parser.add_argument("--input-format", choices=sorted(READERS), help="Input format. Detected from the file extension, csv otherwise.")
+    parser.add_argument("--output-format", choices=sorted(WRITERS), help="Output format. Defaults to the input format.")
+    parser.add_argument("--column", action="append", default=[], metavar="FIELD=COLUMN", help="Read FIELD from input column COLUMN. Repeatable.")
+    parser.add_argument("--keep", action="append", default=[], metavar="COLUMN", help="Copy an input column to the output, e.g. an employee id. Repeatable.")
+    parser.add_argument("--province", help="Province to use for rows without one.")
+    parser.add_argument("--year", type=int, default=2025, help=f"Tax year (default 2025). Income estimates support {', '.join(map(str, SUPPORTED_YEARS))}.")
+    parser.add_argument("--engine", choices=[e.value for e in Engine], default=Engine.DECIMAL.value, help="Arithmetic engine (default decimal).")
+    parser.add_argument("--skip-invalid", action="store_true", help="Skip malformed rows and rows with invalid amounts or provinces instead of stopping.")
+    parser.add_argument("--quiet", action="store_true", help="Don't print the throughput summary.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.tax_type == "income" and args.year not in SUPPORTED_YEARS:
+        parser.error(f"no income tax rates for {args.year}; supported years are {', '.join(map(str, SUPPORTED_YEARS))}")
+    fields = INCOME_FIELDS if args.tax_type == "income" else SALES_FIELDS
+    try:
+        columns = _parse_columns(args.column, fields)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    input_format = args.input_format or _detect_format(None if args.input == "-" else args.input)
+    output_format = args.output_format or _detect_format(None if args.output == "-" else args.output, input_format)
+    process = _estimator(args, columns)
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+    writer = WRITERS[output_format](sink)
+    rows = skipped = 0
+    started = time.perf_counter()
+    try:
+        for line_number, row in enumerate(READERS[input_format](source), start=1):
+            try:
+                out = process(_decode_row(row))
+            except (CanataxError, ValueError) as e:
+                if not args.skip_invalid:
+                    print(f"Row {line_number}: {e}", file=sys.stderr)
+                    return 1
+                skipped += 1
+                continue
+            writer.write(out)
+            rows += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is sys.stdout:
+            sink.flush()
+        else:
+            sink.close()
+    elapsed = time.perf_counter() - started
+    if not args.quiet:
+        rate = rows / elapsed if elapsed else float("inf")
+        print(f"Processed {rows} rows ({skipped} skipped) in {elapsed:.2f}s: {rate:,.0f} rows/s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Asyncio front end for the calculators.
+
+Single estimates run inline on the event loop: an estimate takes microseconds, far less than a hop to an
+executor and back. Batches take an iterable or async iterable of rows and yield estimates as an async
+iterator; rows are cut into chunks and each chunk is estimated with `calculate_many` in an executor, so a
+large batch never blocks the loop for more than the time it takes to hand over a chunk. At most
+`max_in_flight` chunks are submitted at once and no more rows are read until the consumer has taken the
+oldest chunk's estimates, so memory stays flat however long the input is.
+
+Pass a `ProcessPoolExecutor` to use several cores; by default chunks run in the loop's default thread pool,
+which keeps the loop responsive but shares one core with it.
+
+Example:
+    async for estimate in iter_income_batch(rows_from_request(), executor=pool):
+        await send(estimate.to_dict())
+"""
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping, Sequence
+from concurrent.futures import Executor
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Callable
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.enums import Engine, ProvinceOrTerritory
+from canatax.parallel import DEFAULT_CHUNK_SIZE, _income_chunk, _sales_chunk
+from canatax.tax_estimate import (
+    BaseEstimateColumns,
+    BaseTaxEstimate,
+    IncomeTaxEstimate,
+    IncomeTaxEstimateColumns,
+    SalesTaxEstimate,
+    SalesTaxEstimateColumns,
+)
+
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+Rows = AsyncIterable[Sequence[Any] | Mapping[str, Any]] | Iterable[Sequence[Any] | Mapping[str, Any]]
+
+
+async def calculate_income(
+    employment_income: float | int | Decimal,
+    self_employment_income: float | int | Decimal,
+    province: str | ProvinceOrTerritory,
+    year: int = 2025,
+    rrsp_fhsa_contributions: float | int | Decimal = 0,
+    other_income: float | int | Decimal = 0,
+    engine: str | Engine = Engine.DECIMAL,
+) -> IncomeTaxEstimate:
+    """Awaitable `IncomeTaxCalculator.calculate`, run inline on the event loop."""
+    return IncomeTaxCalculator.calculate(
+        employment_income, self_employment_income, province, year, rrsp_fhsa_contributions, other_income, engine
+    )
+
+
+async def calculate_sales(
+    amount: float | int | Decimal,
+    province: str | ProvinceOrTerritory,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+) -> SalesTaxEstimate:
+    """Awaitable `SalesTaxCalculator.calculate`, run inline on the event loop."""
+    return SalesTaxCalculator.calculate(amount, province, year, engine)
+
+
+async def _chunks(rows: Rows, chunk_size: int) -> AsyncIterator[list[Any]]:
+    if not isinstance(rows, AsyncIterable):
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield chunk
+        return
+    chunk = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _run(
+    func: Callable[[list, int, str], BaseEstimateColumns],
+    rows: Rows,
+    chunk_size: int,
+    year: int,
+    engine: str | Engine,
+    executor: Executor | None,
+    max_in_flight: int,
+) -> AsyncIterator[BaseEstimateColumns]:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    year, engine = int(year), Engine(engine).value
+    loop = asyncio.get_running_loop()
+    pending: deque[asyncio.Future] = deque()
+    chunks = _chunks(rows, chunk_size)
+    try:
+        async for chunk in chunks:
+            pending.append(loop.run_in_executor(executor, func, chunk, year, engine))
+            if len(pending) == max_in_flight:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        await chunks.aclose()
+
+
+async def _estimates(chunks: AsyncIterator[BaseEstimateColumns]) -> AsyncIterator[BaseTaxEstimate]:
+    try:
+        async for columns in chunks:
+            for estimate in columns:
+                yield estimate
+    finally:
+        await chunks.aclose()
+
+
+def iter_income_chunks(
+    rows: Rows,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> AsyncIterator[IncomeTaxEstimateColumns]:
+    """Estimate income tax for `rows` in an executor, yielding each chunk's results in input order.
+
+    Args:
+        rows: An iterable or async iterable of `(employment_income, self_employment_income, province[,
+            rrsp_fhsa_contributions[, other_income]])` tuples or mappings keyed by those names.
+        chunk_size (int): Rows per executor job.
+        year (int): Tax year for every row.
+        engine (str | Engine): "decimal" or "int".
+        executor (Executor | None): Where chunks run. Defaults to the event loop's default executor.
+        max_in_flight (int): Most chunks submitted and not yet consumed at any time.
+
+    Raises:
+        ValueError: If `chunk_size` or `max_in_flight` is below 1.
+        InvalidDollarAmount: If any amount is invalid.
+        InvalidProvinceError: If any province is invalid.
+    """
+    return _run(_income_chunk, rows, chunk_size, year, engine, executor, max_in_flight)
+
+
+def iter_sales_chunks(
+    rows: Rows,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> AsyncIterator[SalesTaxEstimateColumns]:
+    """Like `iter_income_chunks`, for rows of `(amount, province)` or mappings with those keys."""
+    return _run(_sales_chunk, rows, chunk_size, year, engine, executor, max_in_flight)
+
+
+def iter_income_batch(
+    rows: Rows,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> AsyncIterator[IncomeTaxEstimate]:
+    """Like `iter_income_chunks`, yielding one `IncomeTaxEstimate` per row."""
+    return _estimates(iter_income_chunks(rows, chunk_size, year, engine, executor, max_in_flight))
+
+
+def iter_sales_batch(
+    rows: Rows,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> AsyncIterator[SalesTaxEstimate]:
+    """Like `iter_sales_chunks`, yielding one `SalesTaxEstimate` per row."""
+    return _estimates(iter_sales_chunks(rows, chunk_size, year, engine, executor, max_in_flight))
+
+
+async def calculate_income_batch(
+    rows: Rows,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    executor: Executor | None = None,
+) -> IncomeTaxEstimateColumns:
+    """Estimate income tax for every row in an executor and return all results in input order."""
+    return IncomeTaxEstimateColumns.concat([columns async for columns in iter_income_chunks(rows, chunk_size, year, engine, executor)])
+
+
+async def calculate_sales_batch(
+    rows: Rows,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    executor: Executor | None = None,
+) -> SalesTaxEstimateColumns:
+    """Estimate sales tax for every `(amount, province)` row in an executor and return all results in input order."""
+    return SalesTaxEstimateColumns.concat([columns async for columns in iter_sales_chunks(rows, chunk_size, year, engine, executor)])
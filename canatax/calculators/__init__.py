@@ -1,3 +1,23 @@
-from canatax.calculators.income_calculator import IncomeTaxCalculator
-from canatax.calculators.sales_calculator import SalesTaxCalculator
-from canatax.calculators.base_calculator import BaseCalculator
\ No newline at end of file
+from importlib import import_module
+
+_LAZY = {
+    "IncomeTaxCalculator": "canatax.calculators.income_calculator",
+    "SalesTaxCalculator": "canatax.calculators.sales_calculator",
+    "PayrollCalculator": "canatax.calculators.payroll_calculator",
+    "BaseCalculator": "canatax.calculators.base_calculator",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
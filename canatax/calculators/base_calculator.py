@@ -1,70 +1,77 @@
 from abc import ABC
 from decimal import Decimal, InvalidOperation
-from typing import Type
+from typing import TYPE_CHECKING, Type
 
+from canatax.cache import CacheInfo, EstimateCache
 from canatax.enums import *
 from canatax.exc import InvalidProvinceError, InvalidDollarAmount
 
-from importlib import import_module
+from canatax.rates.registry import rate_registry
 from canatax.rates.sales.base import BaseSalesTaxRate
-from canatax.rates.income.current_tax import *
+from canatax.rates.income.base import ProvincialIncomeTaxRate
 
+if TYPE_CHECKING:
+    from canatax.metrics import MetricsRegistry
 
 
 class BaseCalculator(ABC):
 
+    _cache: EstimateCache | None = None
+    _metrics: "MetricsRegistry | None" = None
+
+    @classmethod
+    def enable_cache(cls, maxsize: int = 4096) -> None:
+        """Memoize `calculate` results for this calculator in a bounded, thread-safe LRU cache.
+
+        Inputs are normalized before lookup, so e.g. `80000`, `80000.0` and `"80000.001"` share an entry.
+        """
+        cls._cache = EstimateCache(maxsize)
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        cls._cache = None
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo | None:
+        """Return hit/miss counts and size of the cache, or None if caching is disabled."""
+        return cls._cache.cache_info() if cls._cache is not None else None
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        if cls._cache is not None:
+            cls._cache.cache_clear()
+
+    @classmethod
+    def enable_metrics(cls, registry: "MetricsRegistry | None" = None) -> "MetricsRegistry":
+        """Count this calculator's `calculate` calls, time them and count validation failures.
+
+        Args:
+            registry (MetricsRegistry | None): Where to record. Defaults to the shared `canatax.metrics.metrics`.
+
+        Returns:
+            MetricsRegistry: The registry being recorded into, to export from.
+        """
+        if registry is None:
+            from canatax.metrics import metrics as registry
+        cls._metrics = registry
+        return registry
+
+    @classmethod
+    def disable_metrics(cls) -> None:
+        cls._metrics = None
+
     @staticmethod
     def get_income_rate_class(province: ProvinceOrTerritory, year: int = 2025):
-        """Dynamically import and return the correct income tax rate class for the province and year."""
-        year = int(year)
-        if year == 2024:
-            mod = import_module('canatax.rates.income.tax_rates.rates_2024')
-        else:
-            mod = import_module('canatax.rates.income.tax_rates.rates_2025')
-        class_map = {
-            ProvinceOrTerritory.ALBERTA: mod.AlbertaIncomeTaxRate,
-            ProvinceOrTerritory.BRITISH_COLUMBIA: mod.BritishColumbiaIncomeTaxRate,
-            ProvinceOrTerritory.MANITOBA: mod.ManitobaIncomeTaxRate,
-            ProvinceOrTerritory.ONTARIO: mod.OntarioIncomeTaxRate,
-            ProvinceOrTerritory.NEW_BRUNSWICK: mod.NewBrunswickIncomeTaxRate,
-            ProvinceOrTerritory.NEWFOUNDLAND: mod.NewfoundlandIncomeTaxRate,
-            ProvinceOrTerritory.NORTHWEST_TERRITORIES: mod.NorthwestTerritoriesIncomeTaxRate,
-            ProvinceOrTerritory.NOVA_SCOTIA: mod.NovaScotiaIncomeTaxRate,
-            ProvinceOrTerritory.NUNAVUT: mod.NunavutIncomeTaxRate,
-            ProvinceOrTerritory.PRINCE_EDWARD_ISLAND: mod.PEIIncomeTaxRate,
-            ProvinceOrTerritory.QUEBEC: mod.QuebecIncomeTaxRate,
-            ProvinceOrTerritory.SASKATCHEWAN: mod.SaskatchewanIncomeTaxRate,
-            ProvinceOrTerritory.YUKON: mod.YukonIncomeTaxRate,
-        }
-        return class_map[province]
+        """Return the correct income tax rate class for the province and year."""
+        return type(rate_registry.income_rate(province, year))
 
     province: ProvinceOrTerritory
 
 
     @staticmethod
     def get_sales_rate_class(province: ProvinceOrTerritory, year: int = 2025):
-        """Dynamically import and return the correct sales tax rate class for the province and year."""
-        year = int(year)
-        if year == 2024:
-            mod = import_module('canatax.rates.sales.sales_tax_rates.rates_2024')
-        else:
-            mod = import_module('canatax.rates.sales.sales_tax_rates.rates_2025')
-        class_map = {
-            ProvinceOrTerritory.ALBERTA: mod.AlbertaSalesTaxRate,
-            ProvinceOrTerritory.BRITISH_COLUMBIA: mod.BritishColumbiaSalesTaxRate,
-            ProvinceOrTerritory.MANITOBA: mod.ManitobaSalesTaxRate,
-            ProvinceOrTerritory.ONTARIO: mod.OntarioSalesTaxRate,
-            ProvinceOrTerritory.NEW_BRUNSWICK: mod.NewBrunswickSalesTaxRate,
-            ProvinceOrTerritory.NEWFOUNDLAND: mod.NewfoundlandSalesTaxRate,
-            ProvinceOrTerritory.NORTHWEST_TERRITORIES: mod.NorthwestTerritoriesSalesTaxRate,
-            ProvinceOrTerritory.NOVA_SCOTIA: mod.NovaScotiaSalesTaxRate,
-            ProvinceOrTerritory.NUNAVUT: mod.NunavutSalesTaxRate,
-            ProvinceOrTerritory.PRINCE_EDWARD_ISLAND: mod.PEISalesTaxRate,
-            ProvinceOrTerritory.QUEBEC: mod.QuebecSalesTaxRate,
-            ProvinceOrTerritory.SASKATCHEWAN: mod.SaskatchewanSalesTaxRate,
-            ProvinceOrTerritory.YUKON: mod.YukonSalesTaxRate,
-        }
-        return class_map[province]
+        """Return the correct sales tax rate class for the province and year."""
+        return type(rate_registry.sales_rate(province, year))
 
     def __init__(self, province: str | ProvinceOrTerritory, year: int = 2025):
         """Initializes the calculator with a province or territory.
@@ -79,7 +86,8 @@ class BaseCalculator(ABC):
         self.year = int(year)
 
 
-    def _coerce_province(self, province: str | ProvinceOrTerritory) -> ProvinceOrTerritory:
+    @staticmethod
+    def _coerce_province(province: str | ProvinceOrTerritory) -> ProvinceOrTerritory:
         if province is None:
             raise InvalidProvinceError(province)
         if not isinstance(province, ProvinceOrTerritory):
@@ -89,7 +97,8 @@ class BaseCalculator(ABC):
                 raise InvalidProvinceError(province) from e
         return province
 
-    def _decimalize(self, amount:int|float|Decimal) -> Decimal:
+    @staticmethod
+    def _decimalize(amount:int|float|Decimal) -> Decimal:
         try:
             decimal_amount = Decimal(amount)
         except (ValueError, TypeError, InvalidOperation) as e:
@@ -110,11 +119,9 @@ class BaseCalculator(ABC):
 
     def _get_tax_rate(self, tax_type:TaxType) -> ProvincialIncomeTaxRate | BaseSalesTaxRate:
         if tax_type == TaxType.INCOME:
-            klass = self.get_income_rate_class(self.province, self.year)
-            return klass()
+            return rate_registry.income_rate(self.province, self.year)
         elif tax_type == TaxType.SALES:
-            klass = self.get_sales_rate_class(self.province, self.year)
-            return klass()
+            return rate_registry.sales_rate(self.province, self.year)
         else:
             raise ValueError(f"Invalid param tax_type: `{tax_type}` ")
 
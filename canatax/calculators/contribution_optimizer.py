@@ -0,0 +1,139 @@
+"""Tax saved by RRSP/FHSA contributions, as an exact piecewise-linear function of the contribution.
+
+Contributions only lower taxable income: contributions, net income, basic personal amounts and provincial
+credits stay where they are. So the tax saved by contributing `c` is the income tax on taxable income
+`net - c` subtracted from the tax on `net`, and its breakpoints are where `net - c` crosses a bracket
+threshold or the tax reaches zero. `SavingsCurve` builds that function once per income profile, so the
+best contribution is read off its segments and confirmed with two estimates instead of a scan.
+
+Example:
+    curve = IncomeTaxCalculator.rrsp_fhsa_savings_curve(120000, 0, "ON")
+    curve.breakpoints                 # contributions where the tax saved per dollar changes
+    curve.optimal(cap=31560).tax_saved
+"""
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_CEILING
+from fractions import Fraction
+from functools import lru_cache
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.calculators.tax_curve import PiecewiseLinear
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.base import BracketTable
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal(0)
+
+
+@dataclass(frozen=True)
+class ContributionAdvice:
+    """The contribution `SavingsCurve.optimal()` recommends and what it saves, to the cent."""
+
+    province: ProvinceOrTerritory
+    contribution: Decimal
+    tax_saved: Decimal
+    marginal_rate: Decimal
+    """Tax saved by the last dollar of `contribution`; 0 if nothing is contributed."""
+    total_tax: Decimal
+    after_tax_income: Decimal
+
+
+@dataclass(frozen=True)
+class SavingsCurve:
+    """Tax saved as a function of the RRSP/FHSA contribution, for one income profile.
+
+    `savings` is unrounded, so it can differ from the difference of two `IncomeTaxCalculator.calculate`
+    estimates by the cents those round away. Build one with `IncomeTaxCalculator.rrsp_fhsa_savings_curve()`.
+    """
+
+    plan: IncomeTaxPlan
+    incomes: tuple[Decimal, Decimal, Decimal]
+    """`(employment, self-employment, other)` income."""
+    net_income: Decimal
+    savings: PiecewiseLinear
+
+    @classmethod
+    def build(
+        cls,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        other_income: float | int | Decimal = 0,
+    ) -> "SavingsCurve":
+        """Build the savings curve for an income profile.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        plan = IncomeTaxPlan.compile(province, year)
+        part = plan.federal_part(employment_income, self_employment_income, 0, other_income)
+        incomes = tuple(BaseCalculator._decimalize(amount) for amount in (employment_income, self_employment_income, other_income))
+        net = part.net_income
+        tax = _income_tax(plan.federal_brackets, plan.federal_bpa.credit(net), part.cpp_qpp_nrtc_base * plan.federal_bpa.lowest_rate)
+        tax += _income_tax(plan.provincial_brackets, plan.provincial_bpa.credit(net), part.cpp_qpp_nrtc_base * plan.provincial_bpa.lowest_rate)
+        # savings(c) = tax(net) - tax(max(0, net - c)); it stops growing once c reaches net income
+        net = Fraction(net)
+        if not net:
+            return cls(plan, incomes, part.net_income, PiecewiseLinear.line())
+        xs = sorted({Fraction(0), net} | {net - x for x in tax.xs if 0 < x < net})
+        top = tax(net)
+        return cls(plan, incomes, part.net_income, PiecewiseLinear.from_points(xs, [top - tax(net - x) for x in xs], Fraction(0)))
+
+    @property
+    def breakpoints(self) -> tuple[Decimal, ...]:
+        """Contributions where the tax saved per extra dollar changes."""
+        return self.savings.decimal_segments[0][1:]
+
+    @property
+    def marginal_rates(self) -> tuple[Decimal, ...]:
+        """Tax saved per extra dollar contributed: from 0 to the first breakpoint, then after each one."""
+        return self.savings.decimal_segments[2]
+
+    def evaluate(self, contributions: list[float | int | Decimal]) -> list[Decimal]:
+        """Return the (unrounded) tax saved by each contribution, in input order."""
+        return self.savings.evaluate([BaseCalculator._decimalize(contribution) for contribution in contributions])
+
+    def optimal(self, cap: float | int | Decimal | None = None, min_rate: float | int | Decimal = 0) -> ContributionAdvice:
+        """Return the contribution that saves the most tax per dollar, up to `cap`.
+
+        That is the start of the first segment where each extra dollar saves less than `min_rate`, or saves
+        nothing at all, capped at `cap`. The amounts saved are then worked out with two exact estimates.
+
+        Args:
+            cap (float | int | Decimal | None): Most that can be contributed, e.g. the remaining RRSP room.
+            min_rate (float | int | Decimal): Stop where a dollar saves less than this, e.g. 0.3 for 30 cents.
+
+        Raises:
+            InvalidDollarAmount: If `cap` or `min_rate` is invalid.
+        """
+        decimalize = BaseCalculator._decimalize
+        min_rate = decimalize(min_rate)
+        xs, _, slopes = self.savings.decimal_segments
+        limit = next(x for x, slope in zip(xs, slopes) if not slope or slope < min_rate)
+        contribution = limit.quantize(CENT, rounding=ROUND_CEILING)
+        if cap is not None:
+            contribution = min(contribution, decimalize(cap).quantize(CENT, rounding=ROUND_CEILING))
+        employment, self_employment, other = self.incomes
+        baseline = self.plan.row(employment, self_employment, 0, other)
+        row = self.plan.row(employment, self_employment, contribution, other)
+        # The segment the last dollar falls in: the one ending at `contribution` if that is a breakpoint
+        point = Fraction(contribution)
+        segment = self.savings.segment_index(point) - (point in self.savings.xs and point > 0)
+        return ContributionAdvice(
+            province=self.plan.province,
+            contribution=contribution,
+            tax_saved=baseline[-2] - row[-2],
+            marginal_rate=slopes[segment] if contribution else ZERO,
+            total_tax=row[-2],
+            after_tax_income=row[-1],
+        )
+
+
+@lru_cache(maxsize=1024)
+def _income_tax(table: BracketTable, bpa_credit: Decimal, cpp_qpp_credit: Decimal) -> PiecewiseLinear:
+    """Federal or provincial tax as a function of taxable income, for fixed credits (as in `IncomeTaxPlan`)."""
+    return ((PiecewiseLinear.from_bracket_table(table) - bpa_credit).maximum(0) - cpp_qpp_credit).maximum(0)
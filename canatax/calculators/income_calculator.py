@@ -1,41 +1,54 @@
 from decimal import Decimal
+from typing import TYPE_CHECKING, Iterable
 from canatax.calculators.base_calculator import BaseCalculator
-from canatax.enums import ProvinceOrTerritory, TaxType
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.enums import Engine, ProvinceOrTerritory, TaxType
 from canatax.exc import CanataxError
-from canatax.rates.income.current_tax import ProvincialIncomeTaxRate
-from canatax.tax_estimate import IncomeTaxEstimate
-from canatax.rates.income.current_tax import *
-from canatax.utils import decimal_round
+from canatax.rates.income.base import ProvincialIncomeTaxRate
+from canatax.tax_estimate import IncomeTaxEstimate, IncomeTaxEstimateColumns, IncomeTaxMatrix
+from canatax.utils import canonical_amount, decimal_round, to_columns
 from canatax.rates.income.current_contributions import Contributions
+from canatax.rates.registry import rate_registry
+
+if TYPE_CHECKING:
+    # The integer engine and tax curves are imported on first use to keep `import canatax` cheap.
+    from canatax.calculators.contribution_optimizer import ContributionAdvice, SavingsCurve
+    from canatax.calculators.int_engine import IntIncomeTaxPlan
+    from canatax.calculators.tax_curve import IncomeTaxCurve
 
 
 class IncomeTaxCalculator(BaseCalculator):
 
+    # Set through canatax.profiling.add_hook(); empty unless a stage profiler is active
+    _stage_hooks: tuple = ()
+
     def __init__(self, employment_income: int | float | Decimal, self_employment_income: int | float | Decimal, province: ProvinceOrTerritory | str, year: int = 2025, rrsp_fhsa_contributions: int | float | Decimal = 0, other_income: int | float | Decimal = 0):
+        self._set_incomes(employment_income, self_employment_income, rrsp_fhsa_contributions, other_income)
+        super().__init__(province=province, year=year)
+        self.federal_tax_rate = rate_registry.federal_rate(self.year)
+        self.provincial_tax_rate = self._get_tax_rate(TaxType.INCOME)
+        self.contributions = rate_registry.contributions(self.year)
+
+    def _set_incomes(self, employment_income: int | float | Decimal, self_employment_income: int | float | Decimal, rrsp_fhsa_contributions: int | float | Decimal = 0, other_income: int | float | Decimal = 0):
         employment_income = self._decimalize(employment_income)
         self_employment_income = self._decimalize(self_employment_income)
         rrsp_fhsa_contributions = self._decimalize(rrsp_fhsa_contributions)
         other_income = self._decimalize(other_income)
-        super().__init__(province=province, year=year)
         self.employment_income = decimal_round(employment_income)
         self.self_employment_income = decimal_round(self_employment_income)
         self.other_income = decimal_round(other_income)
         self.gross_income = self.employment_income + self.self_employment_income + self.other_income
         self.rrsp_fhsa_contributions = decimal_round(rrsp_fhsa_contributions)
-        # Dynamically import correct FederalIncomeTaxRate for year
-        if int(year) == 2024:
-            from canatax.rates.income.tax_rates.rates_2024 import FederalIncomeTaxRate as FedRate
-        else:
-            from canatax.rates.income.tax_rates.rates_2025 import FederalIncomeTaxRate as FedRate
-        self.federal_tax_rate = FedRate()
-        self.provincial_tax_rate = self._get_tax_rate(TaxType.INCOME)
-        self.contributions = Contributions(year)
 
     def _get_tax_rate(self, tax_type: TaxType) -> ProvincialIncomeTaxRate:
         tax_rate = super()._get_tax_rate(tax_type)
         return tax_rate
 
     def _calculate(self) -> IncomeTaxEstimate:
+        return IncomeTaxEstimate(*self._calculate_row())
+
+    def _calculate_row(self) -> tuple:
+        """Run the estimate and return its values in `IncomeTaxEstimate` field order."""
         ei = self._ei()
         # Calculate CPP/QPP and track employment/self-employment portions
         if self.is_quebec():
@@ -72,17 +85,17 @@ class IncomeTaxCalculator(BaseCalculator):
         provincial_tax = decimal_round(max(Decimal(0), provincial_tax_base - prov_cpp_nrtc))
         total_tax = federal_tax + provincial_tax + ei + cpp + qpip - prov_tax_credits
         after_tax_income = net_income - total_tax
-        return IncomeTaxEstimate(
-            province=self.province,
-            gross_income=self.gross_income,
-            federal_tax=federal_tax,
-            provincial_tax=provincial_tax,
-            ei=ei,
-            cpp=cpp,
-            qpp=qpp,
-            qpip=qpip,
-            total_tax=total_tax,
-            after_tax_income=after_tax_income,
+        return (
+            self.province,
+            self.gross_income,
+            federal_tax,
+            provincial_tax,
+            cpp,
+            ei,
+            qpip,
+            qpp,
+            canonical_amount(total_tax),
+            canonical_amount(after_tax_income),
         )
 
     def _self_employed_cpp_qpp_components(self) -> tuple[Decimal, Decimal, Decimal]:
@@ -115,7 +128,66 @@ class IncomeTaxCalculator(BaseCalculator):
         year: int = 2025,
         rrsp_fhsa_contributions: float | int | Decimal = 0,
         other_income: float | int | Decimal = 0,
+        engine: str | Engine = Engine.DECIMAL,
+    ) -> IncomeTaxEstimate:
+        """Calculate an income tax estimate.
+
+        `engine="int"` runs the estimate in integer cents instead of `Decimal`. Both engines round half up
+        at the same points and return the same estimate. Results are memoized if `enable_cache()` was called,
+        and calls are counted and timed if `enable_metrics()` was.
+        """
+        engine = Engine(engine)
+        if cls._metrics is not None:
+            return cls._metrics.measure(
+                cls.__name__, year, engine, cls._cached_estimate,
+                employment_income, self_employment_income, province, year, rrsp_fhsa_contributions, other_income, engine,
+            )
+        return cls._cached_estimate(employment_income, self_employment_income, province, year, rrsp_fhsa_contributions, other_income, engine)
+
+    @classmethod
+    def _cached_estimate(
+        cls,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int,
+        rrsp_fhsa_contributions: float | int | Decimal,
+        other_income: float | int | Decimal,
+        engine: Engine,
+    ) -> IncomeTaxEstimate:
+        if cls._cache is not None:
+            key = (
+                decimal_round(cls._decimalize(employment_income)),
+                decimal_round(cls._decimalize(self_employment_income)),
+                cls._coerce_province(province),
+                int(year),
+                decimal_round(cls._decimalize(rrsp_fhsa_contributions)),
+                decimal_round(cls._decimalize(other_income)),
+                engine,
+            )
+            return cls._cache.get(key, lambda: cls._estimate(*key))
+        return cls._estimate(employment_income, self_employment_income, province, year, rrsp_fhsa_contributions, other_income, engine)
+
+    @classmethod
+    def _estimate(
+        cls,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+        engine: Engine = Engine.DECIMAL,
     ) -> IncomeTaxEstimate:
+        if cls._stage_hooks:
+            from canatax.profiling import timed_estimate
+            return timed_estimate(
+                cls, cls._stage_hooks, employment_income, self_employment_income, province, year, rrsp_fhsa_contributions, other_income, engine
+            )
+        if engine == Engine.INT:
+            from canatax.calculators.int_engine import IntIncomeTaxPlan
+            plan = IntIncomeTaxPlan.compile(province, year)
+            return plan(employment_income, self_employment_income, rrsp_fhsa_contributions, other_income)
         calculator = cls(
             employment_income=employment_income,
             self_employment_income=self_employment_income,
@@ -126,6 +198,326 @@ class IncomeTaxCalculator(BaseCalculator):
         )
         return calculator._calculate()
 
+    @classmethod
+    def calculate_many(
+        cls,
+        employment_income: Iterable[float | int | Decimal] | float | int | Decimal,
+        self_employment_income: Iterable[float | int | Decimal] | float | int | Decimal,
+        province: Iterable[str | ProvinceOrTerritory] | str | ProvinceOrTerritory,
+        year: int = 2025,
+        rrsp_fhsa_contributions: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+        other_income: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+        engine: str | Engine = Engine.DECIMAL,
+    ) -> IncomeTaxEstimateColumns:
+        """Calculate income tax estimates for whole columns of incomes at once.
+
+        Each argument may be a single value, which is applied to every row, or a column (a list, tuple
+        or NumPy array). Rate tables and contributions are loaded once per province rather than once
+        per row, which is where most of the time goes when calling `calculate` in a loop.
+
+        Args:
+            employment_income: Employment income per row.
+            self_employment_income: Self-employment income per row.
+            province: Province or territory per row.
+            year (int): Tax year shared by every row. Defaults to 2025.
+            rrsp_fhsa_contributions: RRSP/FHSA contributions per row. Defaults to 0.
+            other_income: Other income per row. Defaults to 0.
+            engine (str | Engine): "decimal" or "int". Defaults to "decimal".
+
+        Returns:
+            IncomeTaxEstimateColumns: One list per estimate field, in input order.
+
+        Raises:
+            ValueError: If the columns passed have different lengths.
+            InvalidDollarAmount: If any amount is invalid.
+            InvalidProvinceError: If any province is invalid.
+        """
+        _, columns = to_columns(
+            employment_income=employment_income,
+            self_employment_income=self_employment_income,
+            province=province,
+            rrsp_fhsa_contributions=rrsp_fhsa_contributions,
+            other_income=other_income,
+        )
+        plans = {}
+        results = []
+        for employment, self_employment, prov, rrsp_fhsa, other in zip(
+            columns["employment_income"],
+            columns["self_employment_income"],
+            columns["province"],
+            columns["rrsp_fhsa_contributions"],
+            columns["other_income"],
+        ):
+            plan = plans.get(prov)
+            if plan is None:
+                plan = plans[prov] = cls.compile(prov, year, engine)
+            results.append(plan.row(employment, self_employment, rrsp_fhsa, other))
+        return IncomeTaxEstimateColumns.from_rows(results)
+
+    @classmethod
+    def compare_provinces(
+        cls,
+        employment_income: Iterable[float | int | Decimal] | float | int | Decimal,
+        self_employment_income: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+        year: int = 2025,
+        rrsp_fhsa_contributions: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+        other_income: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+        provinces: Iterable[str | ProvinceOrTerritory] | str | ProvinceOrTerritory | None = None,
+    ) -> IncomeTaxMatrix:
+        """Estimate the same income profiles in every province, or in `provinces`, in one pass.
+
+        Arguments other than `year` and `provinces` may be single values or columns, as in `calculate_many`;
+        each row is one profile. `provinces` may be a single province. Contributions, net income and federal tax don't depend on the provincial
+        rates, so they are computed once per profile for Quebec and once for everywhere else, and only the
+        provincial tax is computed per province. The estimates are the ones `calculate` returns.
+
+        Example:
+            matrix = IncomeTaxCalculator.compare_provinces([60000, 120000], provinces=["ON", "AB", "QC"])
+            matrix.field("after_tax_income")  # 3 provinces x 2 profiles
+
+        Returns:
+            IncomeTaxMatrix: One `IncomeTaxEstimateColumns` per province, in the order given (enum order by default).
+
+        Raises:
+            ValueError: If the columns passed have different lengths.
+            InvalidDollarAmount: If any amount is invalid.
+            InvalidProvinceError: If any province is invalid.
+        """
+        if provinces is None:
+            provinces = ProvinceOrTerritory
+        elif isinstance(provinces, (str, ProvinceOrTerritory)):
+            provinces = (provinces,)
+        provinces = tuple(dict.fromkeys(cls._coerce_province(p) for p in provinces))
+        plans = [IncomeTaxPlan.compile(province, year) for province in provinces]
+        _, columns = to_columns(
+            employment_income=employment_income,
+            self_employment_income=self_employment_income,
+            rrsp_fhsa_contributions=rrsp_fhsa_contributions,
+            other_income=other_income,
+        )
+        profiles = list(zip(*columns.values()))
+        parts = {}
+        for plan in plans:
+            if plan.shared_key not in parts:
+                parts[plan.shared_key] = [plan.federal_part(*profile) for profile in profiles]
+        rows = tuple(
+            IncomeTaxEstimateColumns.from_rows([plan.provincial_row(part) for part in parts[plan.shared_key]])
+            for plan in plans
+        )
+        return IncomeTaxMatrix(provinces, rows)
+
+    @staticmethod
+    def compile(province: str | ProvinceOrTerritory, year: int = 2025, engine: str | Engine = Engine.DECIMAL) -> "IncomeTaxPlan | IntIncomeTaxPlan":
+        """Return a reusable, immutable `IncomeTaxPlan` for the province and year.
+
+        The plan holds every rate and cap already converted to Decimal, so calling it with incomes skips
+        the setup `calculate` repeats on every call. Plans are compiled once and shared. With `engine="int"`
+        an `IntIncomeTaxPlan` working in integer cents is returned instead.
+
+        Example:
+            plan = IncomeTaxCalculator.compile("ON", 2025)
+            estimate = plan(employment_income=80000, self_employment_income=0)
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+        """
+        if Engine(engine) == Engine.INT:
+            from canatax.calculators.int_engine import IntIncomeTaxPlan
+            return IntIncomeTaxPlan.compile(province, year)
+        return IncomeTaxPlan.compile(province, year)
+
+    @staticmethod
+    def tax_curve(
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        employment_share: float | int | Decimal = 1,
+        self_employment_share: float | int | Decimal = 0,
+        other_share: float | int | Decimal = 0,
+        employment_income: float | int | Decimal = 0,
+        self_employment_income: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> "IncomeTaxCurve":
+        """Return every estimate amount as an exact piecewise-linear function of one income `x`.
+
+        Each income source is its fixed amount plus its share of `x`. With the defaults `x` is employment
+        income; `employment_share=0.7, self_employment_share=0.3` makes it gross income split 70/30.
+        The curve's breakpoints are the bracket thresholds, contribution caps, BPA phase-outs and
+        provincial credit phase-outs, so totals and marginal rates for a whole range of incomes are read
+        off its segments without running an estimate per point. Curves are built once and shared.
+
+        Example:
+            curve = IncomeTaxCalculator.tax_curve("ON", 2025)
+            chart = curve.evaluate(range(0, 500_001, 1_000))  # total_tax, marginal_rate, ...
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            InvalidDollarAmount: If any share or amount is invalid.
+            ValueError: If every share is zero.
+        """
+        from canatax.calculators.tax_curve import IncomeTaxCurve
+        return IncomeTaxCurve.build(
+            province,
+            year,
+            employment_share,
+            self_employment_share,
+            other_share,
+            employment_income,
+            self_employment_income,
+            other_income,
+            rrsp_fhsa_contributions,
+        )
+
+    @classmethod
+    def gross_up(
+        cls,
+        after_tax_income: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        employment_share: float | int | Decimal = 1,
+        self_employment_share: float | int | Decimal = 0,
+        other_share: float | int | Decimal = 0,
+        employment_income: float | int | Decimal = 0,
+        self_employment_income: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> Decimal:
+        """Return the income needed to keep `after_tax_income` after tax.
+
+        The income mix works as in `tax_curve`: by default the answer is the employment income whose
+        estimate has an `after_tax_income` of at least the target, to the cent. It is found by inverting
+        the tax curve on one segment and confirming with an estimate or two, instead of searching.
+
+        Example:
+            salary = IncomeTaxCalculator.gross_up(50000, "ON")  # Decimal('65644.53')
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            InvalidDollarAmount: If any amount is invalid.
+            ValueError: If every share is zero.
+        """
+        curve = cls.tax_curve(
+            province,
+            year,
+            employment_share,
+            self_employment_share,
+            other_share,
+            employment_income,
+            self_employment_income,
+            other_income,
+            rrsp_fhsa_contributions,
+        )
+        return curve.gross_up(after_tax_income)
+
+    @classmethod
+    def gross_up_many(
+        cls,
+        after_tax_income: Iterable[float | int | Decimal],
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        employment_share: float | int | Decimal = 1,
+        self_employment_share: float | int | Decimal = 0,
+        other_share: float | int | Decimal = 0,
+        employment_income: float | int | Decimal = 0,
+        self_employment_income: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> list[Decimal]:
+        """Like `gross_up`, for a column of after-tax targets (a list, tuple or NumPy array) sharing one income mix."""
+        curve = cls.tax_curve(
+            province,
+            year,
+            employment_share,
+            self_employment_share,
+            other_share,
+            employment_income,
+            self_employment_income,
+            other_income,
+            rrsp_fhsa_contributions,
+        )
+        _, columns = to_columns(after_tax_income=after_tax_income)
+        return [curve.gross_up(target) for target in columns["after_tax_income"]]
+
+    @staticmethod
+    def rrsp_fhsa_savings_curve(
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        other_income: float | int | Decimal = 0,
+    ) -> "SavingsCurve":
+        """Return the tax an RRSP/FHSA contribution saves as an exact piecewise-linear function of the contribution.
+
+        Contributions only lower taxable income, so the curve's breakpoints are where taxable income crosses
+        a bracket threshold or tax reaches zero; past net income a contribution saves nothing more.
+
+        Example:
+            curve = IncomeTaxCalculator.rrsp_fhsa_savings_curve(120000, 0, "ON")
+            curve.breakpoints, curve.marginal_rates
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        from canatax.calculators.contribution_optimizer import SavingsCurve
+        return SavingsCurve.build(employment_income, self_employment_income, province, year, other_income)
+
+    @classmethod
+    def optimize_rrsp_fhsa(
+        cls,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        other_income: float | int | Decimal = 0,
+        cap: float | int | Decimal | None = None,
+        min_rate: float | int | Decimal = 0,
+    ) -> "ContributionAdvice":
+        """Return the RRSP/FHSA contribution, up to `cap`, past which each dollar saves less than `min_rate`.
+
+        With the default `min_rate=0` that is the smallest contribution saving the most tax. The tax saved is
+        the difference between two exact estimates, to the cent.
+
+        Example:
+            advice = IncomeTaxCalculator.optimize_rrsp_fhsa(95000, 0, "BC", cap=20000, min_rate=0.3)
+            advice.contribution, advice.tax_saved
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        return cls.rrsp_fhsa_savings_curve(employment_income, self_employment_income, province, year, other_income).optimal(cap, min_rate)
+
+    @classmethod
+    def optimize_rrsp_fhsa_many(
+        cls,
+        employment_income: Iterable[float | int | Decimal] | float | int | Decimal,
+        self_employment_income: Iterable[float | int | Decimal] | float | int | Decimal,
+        province: Iterable[str | ProvinceOrTerritory] | str | ProvinceOrTerritory,
+        year: int = 2025,
+        other_income: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+        cap: Iterable[float | int | Decimal | None] | float | int | Decimal | None = None,
+        min_rate: float | int | Decimal = 0,
+    ) -> list["ContributionAdvice"]:
+        """Like `optimize_rrsp_fhsa`, for columns of clients (lists, tuples or NumPy arrays) or single values.
+
+        Raises:
+            ValueError: If the columns passed have different lengths.
+            InvalidDollarAmount: If any amount is invalid.
+            InvalidProvinceError: If any province is invalid.
+        """
+        _, columns = to_columns(
+            employment_income=employment_income,
+            self_employment_income=self_employment_income,
+            province=province,
+            other_income=other_income,
+            cap=cap,
+        )
+        return [
+            cls.optimize_rrsp_fhsa(employment, self_employment, client_province, year, other, client_cap, min_rate)
+            for employment, self_employment, client_province, other, client_cap in zip(*columns.values())
+        ]
+
     def _cpp(self):
         """
         Year-specific CPP calculation for employment and self-employment income.
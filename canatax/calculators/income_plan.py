@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Callable, NamedTuple
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.base import BaseContribution, BpaCredit, BracketTable
+from canatax.rates.registry import rate_registry
+from canatax.tax_estimate import IncomeTaxEstimate
+from canatax.utils import canonical_amount
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal(0)
+HALF = Decimal('0.5')
+
+
+@dataclass(frozen=True)
+class PensionPlan:
+    """CPP or QPP constants, converted to Decimal fractions once."""
+
+    max_earnings: Decimal
+    exemption: Decimal
+    additional_min: Decimal
+    additional_max: Decimal
+    base_rate: Decimal
+    first_additional_rate: Decimal
+    second_additional_rate: Decimal
+    base_rate_se: Decimal
+    first_additional_rate_se: Decimal
+    second_additional_rate_se: Decimal
+
+    @classmethod
+    def from_contribution(cls, contribution: BaseContribution) -> "PensionPlan":
+        return cls(
+            max_earnings=Decimal(contribution.max_earnings),
+            exemption=Decimal(contribution.exemption),
+            additional_min=Decimal(contribution.additional_min),
+            additional_max=Decimal(contribution.additional_max),
+            base_rate=contribution.base_rate_decimal,
+            first_additional_rate=contribution.first_additional_rate_decimal,
+            second_additional_rate=contribution.second_additional_rate_decimal,
+            base_rate_se=contribution.base_rate_se_decimal,
+            first_additional_rate_se=contribution.first_additional_rate_se_decimal,
+            second_additional_rate_se=contribution.second_additional_rate_se_decimal,
+        )
+
+    def employment(self, employment_income: Decimal) -> Decimal:
+        """Return the rounded contribution owed on employment income."""
+        base_first_income = max(ZERO, min(employment_income, self.max_earnings) - self.exemption)
+        second_income = max(ZERO, min(employment_income, self.additional_max) - self.additional_min)
+        contribution = base_first_income * self.base_rate + base_first_income * self.first_additional_rate + second_income * self.second_additional_rate
+        return contribution.quantize(CENT, rounding=ROUND_HALF_UP)
+
+    def self_employment_components(self, employment_income: Decimal, self_employment_income: Decimal) -> tuple[Decimal, Decimal, Decimal]:
+        """Return the unrounded (base, first additional, second additional) self-employed contributions."""
+        total_income = employment_income + self_employment_income
+        base_first_income = max(ZERO, min(total_income, self.max_earnings) - self.exemption)
+        base_first_income -= max(ZERO, min(employment_income, self.max_earnings) - self.exemption)
+        second_income = max(ZERO, min(total_income, self.additional_max) - self.additional_min)
+        second_income -= max(ZERO, min(employment_income, self.additional_max) - self.additional_min)
+        return (
+            base_first_income * self.base_rate_se,
+            base_first_income * self.first_additional_rate_se,
+            second_income * self.second_additional_rate_se,
+        )
+
+
+@dataclass(frozen=True)
+class IncomeTaxPlan:
+    """Every constant `IncomeTaxCalculator` needs for one province and year, compiled once.
+
+    Calling the plan with incomes returns the same `IncomeTaxEstimate` as `IncomeTaxCalculator.calculate`
+    without building a calculator, looking up rates or converting constants on every call. Plans are
+    immutable and can be shared between threads. Use `IncomeTaxCalculator.compile()` to get one.
+    """
+
+    province: ProvinceOrTerritory
+    year: int
+    federal_brackets: BracketTable
+    provincial_brackets: BracketTable
+    federal_bpa: BpaCredit
+    provincial_bpa: BpaCredit
+    pension: PensionPlan
+    ei_max_earnings: Decimal
+    ei_rate: Decimal
+    qpip_max_earnings: Decimal | None
+    qpip_rate: Decimal | None
+    provincial_credits: Callable[[Decimal], Decimal]
+
+    @property
+    def is_quebec(self) -> bool:
+        return self.province == ProvinceOrTerritory.QUEBEC
+
+    @classmethod
+    def compile(cls, province: str | ProvinceOrTerritory, year: int = 2025) -> "IncomeTaxPlan":
+        """Return the shared plan for the province and year, compiling it on first use.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+        """
+        return _compile(BaseCalculator._coerce_province(province), int(year))
+
+    def __call__(
+        self,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+    ) -> IncomeTaxEstimate:
+        return IncomeTaxEstimate(*self.row(employment_income, self_employment_income, rrsp_fhsa_contributions, other_income))
+
+    def row(
+        self,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+    ) -> tuple:
+        """Calculate an estimate and return its values in `IncomeTaxEstimate` field order.
+
+        Raises:
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        return self.provincial_row(self.federal_part(employment_income, self_employment_income, rrsp_fhsa_contributions, other_income))
+
+    def federal_part(
+        self,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+    ) -> "FederalPart":
+        """Compute everything that doesn't depend on the provincial rates: contributions, net income and federal tax.
+
+        The result is the same for every plan with the same `shared_key`, and `provincial_row` of any of those
+        plans finishes it into an estimate.
+
+        Raises:
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        decimalize = BaseCalculator._decimalize
+        employment_income = decimalize(employment_income).quantize(CENT, rounding=ROUND_HALF_UP)
+        self_employment_income = decimalize(self_employment_income).quantize(CENT, rounding=ROUND_HALF_UP)
+        rrsp_fhsa_contributions = decimalize(rrsp_fhsa_contributions).quantize(CENT, rounding=ROUND_HALF_UP)
+        other_income = decimalize(other_income).quantize(CENT, rounding=ROUND_HALF_UP)
+        gross_income = employment_income + self_employment_income + other_income
+
+        ei = (min(employment_income, self.ei_max_earnings) * self.ei_rate).quantize(CENT, rounding=ROUND_HALF_UP)
+        pension = self.pension
+        if self_employment_income > 0:
+            se_base_contrib, se_first_addl_contrib, se_second_addl_contrib = pension.self_employment_components(employment_income, self_employment_income)
+        else:
+            se_base_contrib = se_first_addl_contrib = se_second_addl_contrib = ZERO
+        pension_total = pension.employment(employment_income) + (se_base_contrib + se_first_addl_contrib + se_second_addl_contrib).quantize(CENT, rounding=ROUND_HALF_UP)
+        if self.qpip_rate is None:
+            cpp, qpp, qpip = pension_total, ZERO, ZERO
+        else:
+            cpp, qpp = ZERO, pension_total
+            qpip = (min(gross_income, self.qpip_max_earnings) * self.qpip_rate).quantize(CENT, rounding=ROUND_HALF_UP)
+
+        cpp_qpp_nrtc_base = se_base_contrib * HALF
+        cpp_qpp_deduction = cpp_qpp_nrtc_base + se_first_addl_contrib + se_second_addl_contrib
+        net_income = max(ZERO, gross_income - cpp_qpp_deduction)
+        taxable_income = max(ZERO, net_income - rrsp_fhsa_contributions)
+
+        federal_tax_base = self.federal_brackets.tax(taxable_income).quantize(CENT, rounding=ROUND_HALF_UP)
+        federal_tax_base = max(ZERO, federal_tax_base - self.federal_bpa.credit(net_income))
+        federal_tax = max(ZERO, federal_tax_base - cpp_qpp_nrtc_base * self.federal_bpa.lowest_rate).quantize(CENT, rounding=ROUND_HALF_UP)
+        return FederalPart(gross_income, cpp, ei, qpip, qpp, cpp_qpp_nrtc_base, net_income, taxable_income, federal_tax)
+
+    def provincial_row(self, part: "FederalPart") -> tuple:
+        """Finish a `federal_part()` with this plan's provincial tax and credits, in `IncomeTaxEstimate` field order."""
+        provincial_tax_base = self.provincial_brackets.tax(part.taxable_income).quantize(CENT, rounding=ROUND_HALF_UP)
+        provincial_tax_base = max(ZERO, provincial_tax_base - self.provincial_bpa.credit(part.net_income))
+        provincial_tax = max(ZERO, provincial_tax_base - part.cpp_qpp_nrtc_base * self.provincial_bpa.lowest_rate).quantize(CENT, rounding=ROUND_HALF_UP)
+
+        total_tax = part.federal_tax + provincial_tax + part.ei + part.cpp + part.qpip - self.provincial_credits(part.net_income)
+        return (
+            self.province,
+            part.gross_income,
+            part.federal_tax,
+            provincial_tax,
+            part.cpp,
+            part.ei,
+            part.qpip,
+            part.qpp,
+            canonical_amount(total_tax),
+            canonical_amount(part.net_income - total_tax),
+        )
+
+    @property
+    def shared_key(self) -> tuple[int, bool]:
+        """Plans with equal keys share the same federal rates, pension plan and EI/QPIP, so the same `federal_part()`."""
+        return self.year, self.is_quebec
+
+
+class FederalPart(NamedTuple):
+    """The province-independent part of an estimate, from `IncomeTaxPlan.federal_part()`."""
+
+    gross_income: Decimal
+    cpp: Decimal
+    ei: Decimal
+    qpip: Decimal
+    qpp: Decimal
+    cpp_qpp_nrtc_base: Decimal
+    net_income: Decimal
+    taxable_income: Decimal
+    federal_tax: Decimal
+
+
+@lru_cache(maxsize=None)
+def _compile(province: ProvinceOrTerritory, year: int) -> IncomeTaxPlan:
+    federal_rate = rate_registry.federal_rate(year)
+    provincial_rate = rate_registry.income_rate(province, year)
+    contributions = rate_registry.contributions(year)
+    is_quebec = province == ProvinceOrTerritory.QUEBEC
+    ei = contributions.ei_quebec if is_quebec else contributions.ei
+    return IncomeTaxPlan(
+        province=province,
+        year=year,
+        federal_brackets=federal_rate.bracket_table(),
+        provincial_brackets=provincial_rate.bracket_table(),
+        federal_bpa=federal_rate.bpa_credit(),
+        provincial_bpa=provincial_rate.bpa_credit(),
+        pension=PensionPlan.from_contribution(contributions.qpp if is_quebec else contributions.cpp),
+        ei_max_earnings=Decimal(ei.max_earnings),
+        ei_rate=ei.rate_decimal,
+        qpip_max_earnings=Decimal(contributions.qpip.max_earnings) if is_quebec else None,
+        qpip_rate=contributions.qpip.rate_decimal if is_quebec else None,
+        provincial_credits=provincial_rate.province_specific_tax_credits,
+    )
@@ -0,0 +1,406 @@
+"""Integer arithmetic engine for income and sales tax estimates.
+
+Every amount is held as a Python `int` in a fixed unit (cents, or a fraction of a cent) and every rate
+as an exact integer ratio from `Decimal.as_integer_ratio`, which is lossless for any Decimal. Sales
+tax rates come from `BaseSalesTaxRate.decimal_rates()`, so they are exact decimal fractions such as
+13/100. Income tax rates and thresholds come from `Decimal(float)`, so they are the exact binary
+fractions the float literals denote, which is also what the Decimal path computes with. Results are
+rounded half up to the cent at exactly the points the Decimal path calls `decimal_round`/`quantize`,
+so estimates match it.
+"""
+from bisect import bisect_left
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+import math
+from math import lcm
+from typing import Callable
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.enums import ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount
+from canatax.rates.income.base import BpaCredit, BracketTable
+from canatax.rates.registry import rate_registry
+from canatax.tax_estimate import IncomeTaxEstimate, SalesTaxEstimate
+from canatax.utils import canonical_amount
+
+
+_INF = float('inf')
+_NOT_APPLICABLE = Decimal(0)
+
+
+def to_ratio(amount: int | float | Decimal) -> tuple[int, int]:
+    """Validate a dollar amount like `BaseCalculator._decimalize` and return it as an exact (numerator, denominator)."""
+    if type(amount) is int:
+        if amount < 0:
+            raise InvalidDollarAmount(amount)
+        return amount, 1
+    if type(amount) is float:
+        if amount != amount or amount in (_INF, -_INF) or amount < 0:
+            raise InvalidDollarAmount(amount)
+        return amount.as_integer_ratio()
+    return BaseCalculator._decimalize(amount).as_integer_ratio()
+
+
+def to_cents(amount: int | float | Decimal) -> int:
+    """Return `decimal_round(amount)` in integer cents."""
+    numerator, denominator = to_ratio(amount)
+    if denominator == 1:
+        return numerator * 100
+    return (200 * numerator + denominator) // (2 * denominator)
+
+
+def round_half_up(numerator: int, denominator: int) -> int:
+    """Round the non-negative ratio to the nearest integer, halves up."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def _decimal_scale(denominator: int) -> tuple[int, int]:
+    """Return (multiplier, exponent) such that n / denominator == n * multiplier * 10**-exponent."""
+    exponent = 0
+    while 10 ** exponent % denominator:
+        exponent += 1
+    return 10 ** exponent // denominator, exponent
+
+
+@dataclass(frozen=True)
+class IntBracketTable:
+    """A `BracketTable` with amounts in units of `1 / unit` dollars and rates as numerators over `rate_denominator`."""
+
+    thresholds: tuple[int | float, ...]
+    rates: tuple[int, ...]
+    floors: tuple[int, ...]
+    cumulative_tax: tuple[int, ...]
+    rate_denominator: int
+    unit: int
+
+    @classmethod
+    def from_table(cls, table: BracketTable, unit: int) -> "IntBracketTable":
+        ratios = [rate.as_integer_ratio() for rate in table.rates]
+        rate_denominator = lcm(*(d for _, d in ratios))
+        rates = tuple(n * (rate_denominator // d) for n, d in ratios)
+        thresholds = []
+        for threshold in table.thresholds:
+            if threshold.is_infinite():
+                thresholds.append(_INF)
+            else:
+                numerator, denominator = threshold.as_integer_ratio()
+                if unit % denominator:
+                    raise ValueError(f"Bracket threshold {threshold} is finer than the engine unit")
+                thresholds.append(numerator * (unit // denominator))
+        floors = [0] + thresholds[:-1]
+        cumulative_tax = [0]
+        for threshold, floor, rate in zip(thresholds, floors, rates):
+            cumulative_tax.append(cumulative_tax[-1] + (threshold - floor) * rate if threshold != _INF else cumulative_tax[-1])
+        return cls(tuple(thresholds), rates, tuple(floors), tuple(cumulative_tax), rate_denominator, unit)
+
+    def tax_cents(self, income: int) -> int:
+        """Return the tax on `income` (in table units), rounded half up to the cent."""
+        i = bisect_left(self.thresholds, income)
+        if i == len(self.thresholds):
+            tax = self.cumulative_tax[i]
+        else:
+            tax = self.cumulative_tax[i] + (income - self.floors[i]) * self.rates[i]
+        return round_half_up(tax * 100, self.rate_denominator * self.unit)
+
+
+@dataclass(frozen=True)
+class IntBpaCredit:
+    """A `BpaCredit` returning the credit in cents as an exact (numerator, denominator)."""
+
+    phase_out_start: int | float
+    phase_out_end: int | float
+    max_credit: tuple[int, int]
+    min_credit: tuple[int, int]
+    decimal_credit: BpaCredit
+
+    @classmethod
+    def from_credit(cls, credit: BpaCredit, unit: int) -> "IntBpaCredit":
+        # Income is a whole number of units, so flooring the start and ceiling the end keeps comparisons exact.
+        start = _INF if credit.phase_out_start.is_infinite() else math.floor(credit.phase_out_start * unit)
+        end = _INF if credit.phase_out_end.is_infinite() else math.ceil(credit.phase_out_end * unit)
+        return cls(start, end, _cents_ratio(credit.max_credit), _cents_ratio(credit.min_credit), credit)
+
+    def credit(self, net_income: int, net_income_decimal: Decimal) -> tuple[int, int]:
+        if net_income <= self.phase_out_start:
+            return self.max_credit
+        if net_income >= self.phase_out_end:
+            return self.min_credit
+        return _cents_ratio(self.decimal_credit.credit(net_income_decimal))
+
+
+def _cents_ratio(dollars: Decimal) -> tuple[int, int]:
+    numerator, denominator = dollars.as_integer_ratio()
+    return numerator * 100, denominator
+
+
+@dataclass(frozen=True)
+class IntIncomeTaxPlan:
+    """The integer engine counterpart of `IncomeTaxPlan`.
+
+    Incomes are whole cents. Pension contributions are numerators over `pension_denominator` cents, and
+    net and taxable income are whole units of `1 / net_unit` cents, which keeps self-employed CPP/QPP
+    deductions exact. Use `IncomeTaxCalculator.compile(province, year, engine="int")` to get one.
+    """
+
+    province: ProvinceOrTerritory
+    year: int
+    federal_brackets: IntBracketTable
+    provincial_brackets: IntBracketTable
+    federal_bpa: IntBpaCredit
+    provincial_bpa: IntBpaCredit
+    pension_denominator: int
+    net_unit: int
+    max_earnings: int
+    exemption: int
+    additional_min: int
+    additional_max: int
+    base_first_rate: int
+    second_rate: int
+    base_rate_se: int
+    first_additional_rate_se: int
+    second_additional_rate_se: int
+    ei_max_earnings: int
+    ei_rate: tuple[int, int]
+    qpip_max_earnings: int | None
+    qpip_rate: tuple[int, int] | None
+    net_decimal_scale: tuple[int, int]
+    provincial_credits: Callable[[Decimal], Decimal] | None
+
+    @classmethod
+    def compile(cls, province: str | ProvinceOrTerritory, year: int = 2025) -> "IntIncomeTaxPlan":
+        """Return the shared integer plan for the province and year, compiling it on first use.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+        """
+        return _compile_income(BaseCalculator._coerce_province(province), int(year))
+
+    def __call__(
+        self,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+    ) -> IncomeTaxEstimate:
+        return IncomeTaxEstimate(*self.row(employment_income, self_employment_income, rrsp_fhsa_contributions, other_income))
+
+    def row(
+        self,
+        employment_income: float | int | Decimal,
+        self_employment_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+    ) -> tuple:
+        """Calculate an estimate and return its values in `IncomeTaxEstimate` field order.
+
+        Raises:
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        employment = to_cents(employment_income)
+        self_employment = to_cents(self_employment_income)
+        rrsp_fhsa = to_cents(rrsp_fhsa_contributions)
+        gross = employment + self_employment + to_cents(other_income)
+        federal_tax, provincial_tax, cpp, qpp, qpip, ei, net_decimal = self._cents(employment, self_employment, rrsp_fhsa, gross)
+        total_tax = cents_to_decimal(federal_tax + provincial_tax + ei + cpp + qpip)
+        if self.provincial_credits is not None:
+            total_tax -= self.provincial_credits(net_decimal)
+        # Like the Decimal path, the pension and QPIP fields that don't apply to the province are a bare 0
+        if self.qpip_rate is None:
+            cpp, qpip, qpp = cents_to_decimal(cpp), _NOT_APPLICABLE, _NOT_APPLICABLE
+        else:
+            cpp, qpip, qpp = _NOT_APPLICABLE, cents_to_decimal(qpip), cents_to_decimal(qpp)
+        return (
+            self.province,
+            cents_to_decimal(gross),
+            cents_to_decimal(federal_tax),
+            cents_to_decimal(provincial_tax),
+            cpp,
+            cents_to_decimal(ei),
+            qpip,
+            qpp,
+            canonical_amount(total_tax),
+            canonical_amount(net_decimal - total_tax),
+        )
+
+    def _cents(self, employment: int, self_employment: int, rrsp_fhsa: int, gross: int) -> tuple:
+        """Return (federal tax, provincial tax, cpp, qpp, qpip, ei) in cents, plus net income as a Decimal."""
+        ei_numerator, ei_denominator = self.ei_rate
+        ei = round_half_up(min(employment, self.ei_max_earnings) * ei_numerator, ei_denominator)
+
+        denominator = self.pension_denominator
+        base_first_income = max(0, min(employment, self.max_earnings) - self.exemption)
+        second_income = max(0, min(employment, self.additional_max) - self.additional_min)
+        pension = round_half_up(base_first_income * self.base_first_rate + second_income * self.second_rate, denominator)
+        if self_employment > 0:
+            total = employment + self_employment
+            se_base_first_income = max(0, min(total, self.max_earnings) - self.exemption) - base_first_income
+            se_second_income = max(0, min(total, self.additional_max) - self.additional_min) - second_income
+            se_base = se_base_first_income * self.base_rate_se
+            se_first = se_base_first_income * self.first_additional_rate_se
+            se_second = se_second_income * self.second_additional_rate_se
+            pension += round_half_up(se_base + se_first + se_second, denominator)
+        else:
+            se_base = se_first = se_second = 0
+        if self.qpip_rate is None:
+            cpp, qpp, qpip = pension, 0, 0
+        else:
+            cpp, qpp = 0, pension
+            qpip_numerator, qpip_denominator = self.qpip_rate
+            qpip = round_half_up(min(gross, self.qpip_max_earnings) * qpip_numerator, qpip_denominator)
+
+        # Units of 1 / net_unit cents, where net_unit == 2 * pension_denominator: se_base / 2 is whole.
+        net_unit = self.net_unit
+        nrtc_base = se_base
+        net = max(0, gross * net_unit - (se_base + 2 * se_first + 2 * se_second))
+        taxable = max(0, net - rrsp_fhsa * net_unit)
+        multiplier, exponent = self.net_decimal_scale
+        net_decimal = Decimal(net * multiplier).scaleb(-exponent)
+        federal_tax = self._tax(self.federal_brackets, self.federal_bpa, taxable, net, net_decimal, nrtc_base)
+        provincial_tax = self._tax(self.provincial_brackets, self.provincial_bpa, taxable, net, net_decimal, nrtc_base)
+        return federal_tax, provincial_tax, cpp, qpp, qpip, ei, net_decimal
+
+    def _tax(self, brackets: IntBracketTable, bpa: IntBpaCredit, taxable: int, net: int, net_decimal: Decimal, nrtc_base: int) -> int:
+        tax_base = brackets.tax_cents(taxable)
+        credit_numerator, credit_denominator = bpa.credit(net, net_decimal)
+        # tax_base - bpa credit - nrtc_base * lowest rate, each floored at zero, over a common denominator
+        scale = self.net_unit * brackets.rate_denominator
+        denominator = credit_denominator * scale
+        value = max(0, tax_base * denominator - credit_numerator * scale)
+        value = max(0, value - nrtc_base * brackets.rates[0] * credit_denominator)
+        return round_half_up(value, denominator)
+
+
+@dataclass(frozen=True)
+class IntSalesTaxPlan:
+    """Integer engine for sales tax: rates as exact ratios, taxes rounded half up to whole cents."""
+
+    province: ProvinceOrTerritory
+    year: int
+    gst: tuple[int, int] | None
+    pst: tuple[int, int] | None
+    hst: tuple[int, int] | None
+    qst: tuple[int, int] | None
+    total_rate: tuple[int, int]
+
+    @classmethod
+    def compile(cls, province: str | ProvinceOrTerritory, year: int = 2025) -> "IntSalesTaxPlan":
+        """Return the shared integer sales tax plan for the province and year.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+        """
+        return _compile_sales(BaseCalculator._coerce_province(province), int(year))
+
+    def __call__(self, amount: float | int | Decimal) -> SalesTaxEstimate:
+        return SalesTaxEstimate(*self.row(amount))
+
+    def row(self, amount: float | int | Decimal) -> tuple:
+        """Calculate sales tax and return the values in `SalesTaxEstimate` field order."""
+        before_tax = BaseCalculator._decimalize(amount)
+        numerator, denominator = before_tax.as_integer_ratio()
+        taxes = []
+        for rate in (self.gst, self.pst, self.hst, self.qst):
+            if rate is None:
+                taxes.append(0)
+            else:
+                taxes.append(round_half_up(100 * numerator * rate[0], denominator * rate[1]))
+        tax_total = sum(taxes)
+        after_tax = round_half_up(100 * numerator, denominator) + tax_total
+        gst, pst, hst, qst = taxes
+        return (
+            self.province,
+            before_tax,
+            cents_to_decimal(gst),
+            cents_to_decimal(pst),
+            cents_to_decimal(hst),
+            cents_to_decimal(qst),
+            cents_to_decimal(tax_total),
+            cents_to_decimal(after_tax),
+        )
+
+    def _taxes(self, before_tax: int) -> list[int]:
+        return [0 if rate is None else round_half_up(before_tax * rate[0], rate[1]) for rate in (self.gst, self.pst, self.hst, self.qst)]
+
+    def reverse_row(self, total: float | int | Decimal) -> tuple:
+        """Split a tax-inclusive total into `SalesTaxEstimate` field values (see `SalesTaxCalculator.reverse`)."""
+        total = to_cents(total)
+        numerator, denominator = self.total_rate
+        # Every cent of pre-tax amount adds at least a cent to the total, so the estimate from the
+        # combined rate is at most a cent or two away from the answer
+        before_tax = total * denominator // (denominator + numerator)
+        taxes = self._taxes(before_tax)
+        while before_tax > 0 and before_tax + sum(taxes) > total:
+            before_tax -= 1
+            taxes = self._taxes(before_tax)
+        while before_tax + 1 + sum(next_taxes := self._taxes(before_tax + 1)) <= total:
+            before_tax += 1
+            taxes = next_taxes
+        gst, pst, hst, qst = taxes
+        tax_total = sum(taxes)
+        return (
+            self.province,
+            cents_to_decimal(total - tax_total),
+            cents_to_decimal(gst),
+            cents_to_decimal(pst),
+            cents_to_decimal(hst),
+            cents_to_decimal(qst),
+            cents_to_decimal(tax_total),
+            cents_to_decimal(total),
+        )
+
+
+@lru_cache(maxsize=None)
+def _compile_income(province: ProvinceOrTerritory, year: int) -> IntIncomeTaxPlan:
+    plan = IncomeTaxPlan.compile(province, year)
+    pension = plan.pension
+    ratios = [
+        (pension.base_rate + pension.first_additional_rate).as_integer_ratio(),
+        pension.second_additional_rate.as_integer_ratio(),
+        pension.base_rate_se.as_integer_ratio(),
+        pension.first_additional_rate_se.as_integer_ratio(),
+        pension.second_additional_rate_se.as_integer_ratio(),
+    ]
+    pension_denominator = lcm(*(d for _, d in ratios))
+    base_first_rate, second_rate, base_rate_se, first_rate_se, second_rate_se = (n * (pension_denominator // d) for n, d in ratios)
+    net_unit = 2 * pension_denominator
+    unit = 100 * net_unit
+    provincial_rate = rate_registry.income_rate(province, year)
+    return IntIncomeTaxPlan(
+        province=province,
+        year=year,
+        federal_brackets=IntBracketTable.from_table(plan.federal_brackets, unit),
+        provincial_brackets=IntBracketTable.from_table(plan.provincial_brackets, unit),
+        federal_bpa=IntBpaCredit.from_credit(plan.federal_bpa, unit),
+        provincial_bpa=IntBpaCredit.from_credit(plan.provincial_bpa, unit),
+        pension_denominator=pension_denominator,
+        net_unit=net_unit,
+        max_earnings=to_cents(pension.max_earnings),
+        exemption=to_cents(pension.exemption),
+        additional_min=to_cents(pension.additional_min),
+        additional_max=to_cents(pension.additional_max),
+        base_first_rate=base_first_rate,
+        second_rate=second_rate,
+        base_rate_se=base_rate_se,
+        first_additional_rate_se=first_rate_se,
+        second_additional_rate_se=second_rate_se,
+        ei_max_earnings=to_cents(plan.ei_max_earnings),
+        ei_rate=plan.ei_rate.as_integer_ratio(),
+        qpip_max_earnings=None if plan.qpip_max_earnings is None else to_cents(plan.qpip_max_earnings),
+        qpip_rate=None if plan.qpip_rate is None else plan.qpip_rate.as_integer_ratio(),
+        net_decimal_scale=_decimal_scale(unit),
+        provincial_credits=plan.provincial_credits if provincial_rate.has_province_specific_tax_credits() else None,
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_sales(province: ProvinceOrTerritory, year: int) -> IntSalesTaxPlan:
+    rates = tuple(None if rate is None else rate.as_integer_ratio() for rate in rate_registry.sales_rate(province, year).decimal_rates())
+    total_rate = sum((Fraction(*r) for r in rates if r is not None), Fraction(0))
+    return IntSalesTaxPlan(province, year, *rates, (total_rate.numerator, total_rate.denominator))
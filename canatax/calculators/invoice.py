@@ -0,0 +1,103 @@
+from decimal import Decimal, ROUND_FLOOR, ROUND_HALF_UP
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.enums import ProvinceOrTerritory, RoundingPolicy, TaxCategory
+from canatax.tax_estimate import InvoiceEstimate, SalesTaxEstimate
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal('0.00')
+
+# Which of GST, PST, HST and QST each category is charged
+CATEGORY_TAXES = {
+    TaxCategory.STANDARD: (True, True, True, True),
+    TaxCategory.PST_EXEMPT: (True, False, True, False),
+    TaxCategory.EXEMPT: (False, False, False, False),
+}
+
+
+class LineItem(NamedTuple):
+    """One invoice line: `quantity` units at `amount` each, taxed according to `category`.
+
+    `PST_EXEMPT` lines are charged GST or HST but not PST or QST; `EXEMPT` lines carry no sales tax.
+    """
+
+    amount: float | int | Decimal
+    quantity: float | int | Decimal = 1
+    category: TaxCategory | str = TaxCategory.STANDARD
+
+
+def _line_item(item: LineItem | Sequence[Any] | Mapping[str, Any]) -> LineItem:
+    if isinstance(item, Mapping):
+        item = LineItem(**item)
+    elif not isinstance(item, LineItem):
+        item = LineItem(*item)
+    if item.category is None:
+        return item._replace(category=TaxCategory.STANDARD)
+    if not isinstance(item.category, TaxCategory):
+        return item._replace(category=TaxCategory(item.category))
+    return item
+
+
+def _allocate(values: list[Decimal], total: Decimal) -> list[Decimal]:
+    """Split `total` into cents across lines in proportion to their unrounded `values` (largest remainder first)."""
+    allocated = [value.quantize(CENT, rounding=ROUND_FLOOR) for value in values]
+    remainder = int((total - sum(allocated, ZERO)) / CENT)
+    if remainder:
+        largest_remainders = sorted(range(len(values)), key=lambda i: allocated[i] - values[i])
+        for i in largest_remainders[:remainder]:
+            allocated[i] += CENT
+    return allocated
+
+
+def calculate_invoice(
+    province: ProvinceOrTerritory,
+    rates: tuple[Decimal | None, Decimal | None, Decimal | None, Decimal | None],
+    items: Iterable[LineItem | Sequence[Any] | Mapping[str, Any]],
+    rounding: RoundingPolicy = RoundingPolicy.PER_LINE,
+) -> InvoiceEstimate:
+    """Tax every line of an invoice at `rates` (GST, PST, HST and QST fractions, None if not charged).
+
+    With `PER_LINE` rounding each line is taxed exactly like `SalesTaxCalculator.calculate(amount * quantity)`
+    and the invoice totals are the sums of the lines. With `PER_INVOICE` rounding each tax is summed over
+    the unrounded lines and rounded once, then allocated back to the lines cent by cent so the lines
+    still add up to the invoice total.
+    """
+    category_rates = {
+        category: tuple(rate if charged else None for rate, charged in zip(rates, taxes))
+        for category, taxes in CATEGORY_TAXES.items()
+    }
+    decimalize = BaseCalculator._decimalize
+    per_line = rounding == RoundingPolicy.PER_LINE
+    subtotals = []
+    line_taxes = []
+    for item in items:
+        item = _line_item(item)
+        before_tax = decimalize(item.amount) * decimalize(item.quantity)
+        taxes = []
+        for rate in category_rates[item.category]:
+            if rate is None:
+                taxes.append(ZERO)
+            elif per_line:
+                taxes.append((before_tax * rate).quantize(CENT, rounding=ROUND_HALF_UP))
+            else:
+                taxes.append(before_tax * rate)
+        subtotals.append(before_tax)
+        line_taxes.append(taxes)
+
+    columns = [list(column) for column in zip(*line_taxes)] or [[], [], [], []]
+    totals = [sum(column, ZERO) for column in columns]
+    if not per_line:
+        totals = [total.quantize(CENT, rounding=ROUND_HALF_UP) for total in totals]
+        columns = [_allocate(column, total) for column, total in zip(columns, totals)]
+
+    lines = []
+    for before_tax, gst, pst, hst, qst in zip(subtotals, *columns):
+        tax_total = gst + pst + hst + qst
+        after_tax = (before_tax + tax_total).quantize(CENT, rounding=ROUND_HALF_UP)
+        lines.append(SalesTaxEstimate(province, before_tax, gst, pst, hst, qst, tax_total, after_tax))
+    before_tax = sum(subtotals, ZERO)
+    tax_total = sum(totals, ZERO)
+    total = SalesTaxEstimate(province, before_tax, *totals, tax_total, (before_tax + tax_total).quantize(CENT, rounding=ROUND_HALF_UP))
+    return InvoiceEstimate(province, rounding, tuple(lines), total)
@@ -0,0 +1,113 @@
+from decimal import Decimal
+from typing import Iterable
+
+from canatax.calculators.payroll_plan import PayrollPlan
+from canatax.enums import PayPeriod, ProvinceOrTerritory
+from canatax.tax_estimate import PayrollEstimate, PayrollEstimateColumns, PayrollYearToDate
+from canatax.utils import to_columns
+
+
+class PayrollCalculator:
+    """Per-cheque payroll deductions: federal and provincial tax, CPP/QPP, EI and QPIP.
+
+    Each call takes the employee's year-to-date totals and returns the period's deductions together with
+    the updated totals to pass to the next period, so caps reached mid-year are respected exactly.
+
+    Example:
+        ytd = None
+        for _ in range(26):
+            stub, ytd = PayrollCalculator.calculate(3500, "ON", pay_period="biweekly", ytd=ytd)
+    """
+
+    @classmethod
+    def calculate(
+        cls,
+        gross_pay: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        pay_period: str | PayPeriod = PayPeriod.BIWEEKLY,
+        year: int = 2025,
+        ytd: PayrollYearToDate | None = None,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> tuple[PayrollEstimate, PayrollYearToDate]:
+        """Calculate one pay period's deductions.
+
+        Args:
+            gross_pay (float | int | Decimal): Employment income paid this period.
+            province (str | ProvinceOrTerritory): The province or territory of employment.
+            pay_period (str | PayPeriod): "weekly", "biweekly", "semi_monthly" or "monthly". Defaults to "biweekly".
+            year (int): Tax year. Defaults to 2025.
+            ytd (PayrollYearToDate | None): Totals before this period, as returned by the previous call; None for the first pay of the year.
+            rrsp_fhsa_contributions (float | int | Decimal): RRSP/FHSA contributions withheld this period. Defaults to 0.
+
+        Returns:
+            tuple[PayrollEstimate, PayrollYearToDate]: This period's deductions and the totals including it.
+
+        Raises:
+            InvalidDollarAmount: If any amount is invalid.
+            InvalidProvinceError: If the province or territory is not valid.
+            ValueError: If the pay period is not valid.
+        """
+        return cls.compile(province, year, pay_period)(gross_pay, ytd, rrsp_fhsa_contributions)
+
+    @classmethod
+    def calculate_many(
+        cls,
+        gross_pay: Iterable[float | int | Decimal] | float | int | Decimal,
+        province: Iterable[str | ProvinceOrTerritory] | str | ProvinceOrTerritory,
+        pay_period: Iterable[str | PayPeriod] | str | PayPeriod = PayPeriod.BIWEEKLY,
+        year: int = 2025,
+        ytd: Iterable[PayrollYearToDate | None] | None = None,
+        rrsp_fhsa_contributions: Iterable[float | int | Decimal] | float | int | Decimal = 0,
+    ) -> tuple[PayrollEstimateColumns, list[PayrollYearToDate]]:
+        """Calculate a whole pay run at once, one row per employee.
+
+        Each argument may be a single value, applied to every row, or a column (a list, tuple or NumPy
+        array). Plans are compiled once per province and pay period rather than once per row.
+
+        Returns:
+            tuple[PayrollEstimateColumns, list[PayrollYearToDate]]: The deductions, one list per field, and
+            each employee's updated totals, in input order.
+
+        Raises:
+            ValueError: If the columns passed have different lengths, or a pay period is not valid.
+            InvalidDollarAmount: If any amount is invalid.
+            InvalidProvinceError: If any province is invalid.
+        """
+        _, columns = to_columns(
+            gross_pay=gross_pay,
+            province=province,
+            pay_period=pay_period,
+            ytd=ytd,
+            rrsp_fhsa_contributions=rrsp_fhsa_contributions,
+        )
+        plans = {}
+        rows = []
+        totals = []
+        for pay, prov, period, employee_ytd, rrsp_fhsa in zip(
+            columns["gross_pay"],
+            columns["province"],
+            columns["pay_period"],
+            columns["ytd"],
+            columns["rrsp_fhsa_contributions"],
+        ):
+            plan = plans.get((prov, period))
+            if plan is None:
+                plan = plans[prov, period] = cls.compile(prov, year, period)
+            row, employee_ytd = plan.row(pay, employee_ytd, rrsp_fhsa)
+            rows.append(row)
+            totals.append(employee_ytd)
+        return PayrollEstimateColumns.from_rows(rows), totals
+
+    @staticmethod
+    def compile(province: str | ProvinceOrTerritory, year: int = 2025, pay_period: str | PayPeriod = PayPeriod.BIWEEKLY) -> PayrollPlan:
+        """Return the shared, immutable `PayrollPlan` for the province, year and pay period.
+
+        Example:
+            plan = PayrollCalculator.compile("QC", 2025, "semi_monthly")
+            stub, ytd = plan(4200, ytd)
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            ValueError: If the pay period is not valid.
+        """
+        return PayrollPlan.compile(province, year, pay_period)
@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.enums import PayPeriod, ProvinceOrTerritory
+from canatax.tax_estimate import PayrollEstimate, PayrollYearToDate
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal('0.00')
+NEW_YEAR = PayrollYearToDate()
+
+
+def _cents(amount: Decimal) -> Decimal:
+    return amount.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class PayrollPlan:
+    """Every constant needed to compute one pay period's deductions for a province, year and pay frequency.
+
+    Contributions are worked out per period and capped by what is left of the annual maximum after the
+    employee's year-to-date totals, so CPP/QPP, CPP2/QPP2, EI and QPIP stop exactly at their caps in the
+    period that reaches them. Income tax follows the CRA's periodic method: the period's pay is annualized,
+    taxed with the same brackets, basic personal amounts and provincial credits as `IncomeTaxPlan`, and
+    divided back over the periods. Each period is a fixed amount of work, whatever the year-to-date state.
+    Plans are immutable and shared; use `PayrollCalculator.compile()` to get one.
+    """
+
+    province: ProvinceOrTerritory
+    year: int
+    pay_period: PayPeriod
+    periods: Decimal
+    income: IncomeTaxPlan
+    pension_rate: Decimal
+    pension_exemption: Decimal
+    pension_max: Decimal
+    second_rate: Decimal
+    second_min_earnings: Decimal
+    second_max_earnings: Decimal
+    second_max: Decimal
+    ei_rate: Decimal
+    ei_max_earnings: Decimal
+    ei_max: Decimal
+    qpip_rate: Decimal | None
+    qpip_max_earnings: Decimal | None
+    qpip_max: Decimal | None
+
+    @classmethod
+    def compile(cls, province: str | ProvinceOrTerritory, year: int = 2025, pay_period: str | PayPeriod = PayPeriod.BIWEEKLY) -> "PayrollPlan":
+        """Return the shared plan for the province, year and pay period, compiling it on first use.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            ValueError: If the pay period is not valid.
+        """
+        return _compile(BaseCalculator._coerce_province(province), int(year), PayPeriod(pay_period))
+
+    def __call__(
+        self,
+        gross_pay: float | int | Decimal,
+        ytd: PayrollYearToDate | None = None,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> tuple[PayrollEstimate, PayrollYearToDate]:
+        row, ytd = self.row(gross_pay, ytd, rrsp_fhsa_contributions)
+        return PayrollEstimate(*row), ytd
+
+    def row(
+        self,
+        gross_pay: float | int | Decimal,
+        ytd: PayrollYearToDate | None = None,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> tuple[tuple, PayrollYearToDate]:
+        """Compute one period and return its values in `PayrollEstimate` field order, and the updated totals.
+
+        Args:
+            gross_pay: Employment income paid this period.
+            ytd (PayrollYearToDate | None): The employee's totals before this period; None for the first pay of the year.
+            rrsp_fhsa_contributions: RRSP/FHSA contributions withheld at source this period, deducted before tax.
+
+        Raises:
+            InvalidDollarAmount: If any amount is invalid.
+        """
+        decimalize = BaseCalculator._decimalize
+        gross_pay = _cents(decimalize(gross_pay))
+        rrsp_fhsa_contributions = _cents(decimalize(rrsp_fhsa_contributions))
+        if ytd is None:
+            ytd = NEW_YEAR
+        earned = ytd.gross_pay + gross_pay
+
+        # CPP/QPP base and first additional contributions, less the period's share of the basic exemption
+        pension = ZERO
+        if gross_pay > self.pension_exemption:
+            pension = max(ZERO, min(_cents((gross_pay - self.pension_exemption) * self.pension_rate), self.pension_max - ytd.pension))
+        # CPP2/QPP2 on the part of this period's pay that falls between the two earnings ceilings
+        pension_second = ZERO
+        second_earnings = min(earned, self.second_max_earnings) - max(ytd.gross_pay, self.second_min_earnings)
+        if second_earnings > 0:
+            pension_second = max(ZERO, min(_cents(second_earnings * self.second_rate), self.second_max - ytd.pension_second))
+
+        # Premiums are capped on the amount withheld so far, as the CRA does, so rounding each cheque never
+        # leaves the year a cent short of (or over) the maximum premium
+        insurable = max(ZERO, min(gross_pay, self.ei_max_earnings - ytd.insurable_earnings))
+        ei = max(ZERO, min(_cents(gross_pay * self.ei_rate), self.ei_max - ytd.ei))
+        if self.qpip_rate is None:
+            qpip_insurable = qpip = ZERO
+            cpp, qpp = pension + pension_second, ZERO
+        else:
+            qpip_insurable = max(ZERO, min(gross_pay, self.qpip_max_earnings - ytd.qpip_insurable_earnings))
+            qpip = max(ZERO, min(_cents(gross_pay * self.qpip_rate), self.qpip_max - ytd.qpip))
+            cpp, qpp = ZERO, pension + pension_second
+
+        income = self.income
+        annual_income = gross_pay * self.periods
+        taxable_income = max(ZERO, annual_income - rrsp_fhsa_contributions * self.periods)
+        federal_tax = _cents(income.federal_brackets.tax(taxable_income)) - income.federal_bpa.credit(annual_income)
+        provincial_tax = _cents(income.provincial_brackets.tax(taxable_income)) - income.provincial_bpa.credit(annual_income)
+        provincial_tax -= income.provincial_credits(annual_income)
+        federal_tax = _cents(max(ZERO, federal_tax) / self.periods)
+        provincial_tax = _cents(max(ZERO, provincial_tax) / self.periods)
+
+        total_deductions = federal_tax + provincial_tax + cpp + qpp + ei + qpip
+        row = (self.province, gross_pay, federal_tax, provincial_tax, cpp, ei, qpip, qpp, total_deductions, gross_pay - total_deductions)
+        ytd = PayrollYearToDate(
+            periods=ytd.periods + 1,
+            gross_pay=earned,
+            insurable_earnings=ytd.insurable_earnings + insurable,
+            qpip_insurable_earnings=ytd.qpip_insurable_earnings + qpip_insurable,
+            pension=ytd.pension + pension,
+            pension_second=ytd.pension_second + pension_second,
+            ei=ytd.ei + ei,
+            qpip=ytd.qpip + qpip,
+            federal_tax=ytd.federal_tax + federal_tax,
+            provincial_tax=ytd.provincial_tax + provincial_tax,
+        )
+        return row, ytd
+
+
+@lru_cache(maxsize=None)
+def _compile(province: ProvinceOrTerritory, year: int, pay_period: PayPeriod) -> PayrollPlan:
+    income = IncomeTaxPlan.compile(province, year)
+    pension = income.pension
+    pension_rate = pension.base_rate + pension.first_additional_rate
+    return PayrollPlan(
+        province=province,
+        year=year,
+        pay_period=pay_period,
+        periods=Decimal(pay_period.periods_per_year),
+        income=income,
+        pension_rate=pension_rate,
+        pension_exemption=pension.exemption / pay_period.periods_per_year,
+        pension_max=_cents((pension.max_earnings - pension.exemption) * pension_rate),
+        second_rate=pension.second_additional_rate,
+        second_min_earnings=pension.additional_min,
+        second_max_earnings=pension.additional_max,
+        second_max=_cents((pension.additional_max - pension.additional_min) * pension.second_additional_rate),
+        ei_rate=income.ei_rate,
+        ei_max_earnings=income.ei_max_earnings,
+        ei_max=_cents(income.ei_max_earnings * income.ei_rate),
+        qpip_rate=income.qpip_rate,
+        qpip_max_earnings=income.qpip_max_earnings,
+        qpip_max=_cents(income.qpip_max_earnings * income.qpip_rate) if income.qpip_rate is not None else None,
+    )
@@ -1,18 +1,48 @@
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
 from canatax.calculators.base_calculator import BaseCalculator
 from canatax.exc import CanataxError
-from canatax.enums import ProvinceOrTerritory, TaxType
-from canatax.rates.income.current_tax import ProvincialIncomeTaxRate
-from canatax.rates.sales.current_sales_tax import BaseSalesTaxRate
-from canatax.tax_estimate import SalesTaxEstimate
-from canatax.utils import percent_to_decimal, decimal_round
+from canatax.calculators.invoice import LineItem, calculate_invoice
+from canatax.enums import Engine, ProvinceOrTerritory, RoundingPolicy, TaxType
+from canatax.rates.income.base import ProvincialIncomeTaxRate
+from canatax.rates.sales.base import BaseSalesTaxRate
+from canatax.tax_estimate import InvoiceEstimate, SalesTaxEstimate, SalesTaxEstimateColumns
+from canatax.utils import to_columns
+
+if TYPE_CHECKING:
+    # The integer engine is imported on first use to keep `import canatax` cheap.
+    from canatax.calculators.int_engine import IntSalesTaxPlan
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal('0.00')
 
 
 class SalesTaxCalculator(BaseCalculator):
+    """Sales tax for one province and year.
+
+    Instances are immutable once built and hold their rates as exact Decimal fractions, so one can be
+    shared across calls and threads. `SalesTaxCalculator.compile()` returns a shared instance.
+    """
 
     def __init__(self, province: ProvinceOrTerritory | str, year: int = 2025):
         super().__init__(province=province, year=year)
         self.tax_rate = self._get_tax_rate(TaxType.SALES)
+        self.rates = self.tax_rate.decimal_rates()
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{self.__class__.__name__} is immutable; compile a calculator for another province or year instead")
+        super().__setattr__(name, value)
+
+    def __call__(self, amount: float | int | Decimal) -> SalesTaxEstimate:
+        return self._calculate(amount)
+
+    def row(self, amount: float | int | Decimal) -> tuple:
+        """Calculate sales tax and return the values in `SalesTaxEstimate` field order."""
+        return self._calculate_row(amount)
 
     def _get_tax_rate(self, tax_type: TaxType) -> BaseSalesTaxRate:
         tax_rate = super()._get_tax_rate(tax_type)
@@ -36,23 +66,57 @@ class SalesTaxCalculator(BaseCalculator):
         Raises:
             InvalidDollarAmount: If the provided amount is negative, `None`, or cannot be converted to a valid decimal.
         """
+        return SalesTaxEstimate(*self._calculate_row(amount))
+
+    def _calculate_row(self, amount: float | int | Decimal) -> tuple:
+        """Calculate sales tax and return the values in `SalesTaxEstimate` field order."""
         amount = self._decimalize(amount)
-        gst_total = decimal_round((amount * percent_to_decimal(self.tax_rate.GST))) if self.tax_rate.GST else Decimal('0.00')
-        pst_total = decimal_round((amount * percent_to_decimal(self.tax_rate.PST))) if self.tax_rate.PST else Decimal('0.00')
-        hst_total = decimal_round((amount * percent_to_decimal(self.tax_rate.HST))) if self.tax_rate.HST else Decimal('0.00')
-        qst_total = decimal_round((amount * percent_to_decimal(self.tax_rate.QST))) if self.tax_rate.QST else Decimal('0.00')
-        tax_total = decimal_round((gst_total + pst_total + hst_total + qst_total))
-        after_tax_total = decimal_round((amount + tax_total))
-        return SalesTaxEstimate(
-            province=self.province,
-            before_tax=amount,
-            tax_total=tax_total,
-            after_tax=after_tax_total,
-            gst=gst_total,
-            pst=pst_total,
-            hst=hst_total,
-            qst=qst_total,
-        )
+        gst, pst, hst, qst = self.rates
+        gst_total = (amount * gst).quantize(CENT, rounding=ROUND_HALF_UP) if gst else ZERO
+        pst_total = (amount * pst).quantize(CENT, rounding=ROUND_HALF_UP) if pst else ZERO
+        hst_total = (amount * hst).quantize(CENT, rounding=ROUND_HALF_UP) if hst else ZERO
+        qst_total = (amount * qst).quantize(CENT, rounding=ROUND_HALF_UP) if qst else ZERO
+        tax_total = gst_total + pst_total + hst_total + qst_total
+        after_tax_total = (amount + tax_total).quantize(CENT, rounding=ROUND_HALF_UP)
+        return (self.province, amount, gst_total, pst_total, hst_total, qst_total, tax_total, after_tax_total)
+
+    def _calculate_invoice(
+        self,
+        items: Iterable[LineItem | Sequence[Any] | Mapping[str, Any]],
+        rounding: str | RoundingPolicy = RoundingPolicy.PER_LINE,
+    ) -> InvoiceEstimate:
+        return calculate_invoice(self.province, self.rates, items, RoundingPolicy(rounding))
+
+    @classmethod
+    def calculate_invoice(
+        cls,
+        items: Iterable[LineItem | Sequence[Any] | Mapping[str, Any]],
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        rounding: str | RoundingPolicy = RoundingPolicy.PER_LINE,
+    ) -> InvoiceEstimate:
+        """Calculate sales tax for every line of an invoice or cart in one pass.
+
+        Rates are loaded once per invoice, so each line costs a multiplication and a rounding per tax.
+
+        Args:
+            items: `LineItem`s, or tuples of `(amount, quantity[, category])`, or mappings with those keys.
+                `amount` is the price per unit; `category` is a `TaxCategory` and defaults to STANDARD.
+            province (str | ProvinceOrTerritory): The province or territory of sale.
+            year (int): Tax year. Defaults to 2025.
+            rounding (str | RoundingPolicy): PER_LINE rounds each tax on each line, like `calculate`.
+                PER_INVOICE rounds each tax once on the invoice total and allocates the cents back to
+                the lines, largest remainder first.
+
+        Returns:
+            InvoiceEstimate: A `SalesTaxEstimate` per line, in input order, and one for the whole invoice.
+
+        Raises:
+            InvalidDollarAmount: If any amount or quantity is invalid.
+            InvalidProvinceError: If the province or territory is not valid.
+            ValueError: If a category or rounding policy is not valid.
+        """
+        return cls.compile(province, year)._calculate_invoice(items, rounding)
 
     @classmethod
     def calculate(
@@ -60,6 +124,143 @@ class SalesTaxCalculator(BaseCalculator):
         amount: float | int | Decimal,
         province: str | ProvinceOrTerritory,
         year: int = 2025,
+        engine: str | Engine = Engine.DECIMAL,
+    ) -> SalesTaxEstimate:
+        """Calculate sales tax on `amount`.
+
+        `engine="int"` computes each tax in integer cents instead of `Decimal`. Both engines return the same estimate.
+        Results are memoized if `enable_cache()` was called, and calls are counted and timed if `enable_metrics()` was.
+        """
+        engine = Engine(engine)
+        if cls._metrics is not None:
+            return cls._metrics.measure(cls.__name__, year, engine, cls._cached_estimate, amount, province, year, engine)
+        return cls._cached_estimate(amount, province, year, engine)
+
+    @classmethod
+    def _cached_estimate(
+        cls,
+        amount: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int,
+        engine: Engine,
+    ) -> SalesTaxEstimate:
+        if cls._cache is not None:
+            amount = cls._decimalize(amount)
+            province = cls._coerce_province(province)
+            # `before_tax` keeps the amount as given, so 100 and 100.00 are cached apart
+            key = (amount.as_tuple(), province, int(year), engine)
+            return cls._cache.get(key, lambda: cls._estimate(amount, province, year, engine))
+        return cls._estimate(amount, province, year, engine)
+
+    @classmethod
+    def _estimate(
+        cls,
+        amount: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        engine: Engine = Engine.DECIMAL,
     ) -> SalesTaxEstimate:
-        calculator = cls(province=province, year=year)
-        return calculator._calculate(amount)
+        return cls.compile(province, year, engine)(amount)
+
+    @classmethod
+    def reverse(
+        cls,
+        total: float | int | Decimal,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+    ) -> SalesTaxEstimate:
+        """Split a tax-inclusive total into its pre-tax amount and each sales tax.
+
+        The pre-tax amount is the one, in cents, that `calculate` turns into `total`, so
+        `calculate(estimate.before_tax, ...)` returns the same estimate. Because each tax is rounded, a
+        few totals can't be reached from any amount (one more cent before tax adds two cents after it).
+        For those, the taxes are the ones on the largest pre-tax amount that stays under `total`, and
+        the cent left over is kept in `before_tax`, so `before_tax + tax_total == after_tax == total`
+        always holds.
+
+        Raises:
+            InvalidDollarAmount: If `total` is invalid.
+            InvalidProvinceError: If the province or territory is not valid.
+        """
+        from canatax.calculators.int_engine import IntSalesTaxPlan
+        return SalesTaxEstimate(*IntSalesTaxPlan.compile(province, year).reverse_row(total))
+
+    @classmethod
+    def reverse_many(
+        cls,
+        total: Iterable[float | int | Decimal] | float | int | Decimal,
+        province: Iterable[str | ProvinceOrTerritory] | str | ProvinceOrTerritory,
+        year: int = 2025,
+    ) -> SalesTaxEstimateColumns:
+        """Like `reverse`, for whole columns of tax-inclusive totals (lists, tuples or NumPy arrays).
+
+        Raises:
+            ValueError: If the columns passed have different lengths.
+            InvalidDollarAmount: If any total is invalid.
+            InvalidProvinceError: If any province is invalid.
+        """
+        from canatax.calculators.int_engine import IntSalesTaxPlan
+        _, columns = to_columns(total=total, province=province)
+        plans = {}
+        results = []
+        for row_total, prov in zip(columns["total"], columns["province"]):
+            plan = plans.get(prov)
+            if plan is None:
+                plan = plans[prov] = IntSalesTaxPlan.compile(prov, year)
+            results.append(plan.reverse_row(row_total))
+        return SalesTaxEstimateColumns.from_rows(results)
+
+    @classmethod
+    def calculate_many(
+        cls,
+        amount: Iterable[float | int | Decimal] | float | int | Decimal,
+        province: Iterable[str | ProvinceOrTerritory] | str | ProvinceOrTerritory,
+        year: int = 2025,
+        engine: str | Engine = Engine.DECIMAL,
+    ) -> SalesTaxEstimateColumns:
+        """Calculate sales tax for whole columns of amounts at once.
+
+        Each argument may be a single value, applied to every row, or a column (list, tuple or NumPy array).
+        One calculator is built per province rather than per row.
+
+        Returns:
+            SalesTaxEstimateColumns: One list per estimate field, in input order.
+
+        Raises:
+            ValueError: If the columns passed have different lengths.
+            InvalidDollarAmount: If any amount is invalid.
+            InvalidProvinceError: If any province is invalid.
+        """
+        _, columns = to_columns(amount=amount, province=province)
+        calculators = {}
+        results = []
+        for row_amount, prov in zip(columns["amount"], columns["province"]):
+            calculator = calculators.get(prov)
+            if calculator is None:
+                calculator = calculators[prov] = cls.compile(prov, year, engine)
+            results.append(calculator.row(row_amount))
+        return SalesTaxEstimateColumns.from_rows(results)
+
+    @staticmethod
+    def compile(province: str | ProvinceOrTerritory, year: int = 2025, engine: str | Engine = Engine.DECIMAL) -> "SalesTaxCalculator | IntSalesTaxPlan":
+        """Return a shared, immutable calculator for the province and year.
+
+        Calling it with an amount returns a `SalesTaxEstimate`, skipping the rate lookup `calculate` does
+        on every call. With `engine="int"` the shared `IntSalesTaxPlan` is returned instead.
+
+        Example:
+            calculator = SalesTaxCalculator.compile("QC", 2025)
+            estimate = calculator(19.99)
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+        """
+        if Engine(engine) == Engine.INT:
+            from canatax.calculators.int_engine import IntSalesTaxPlan
+            return IntSalesTaxPlan.compile(province, year)
+        return _compile(BaseCalculator._coerce_province(province), int(year))
+
+
+@lru_cache(maxsize=None)
+def _compile(province: ProvinceOrTerritory, year: int) -> SalesTaxCalculator:
+    return SalesTaxCalculator(province, year)
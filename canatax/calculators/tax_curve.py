@@ -0,0 +1,388 @@
+"""Income tax as an exact piecewise-linear function of income.
+
+Before rounding, every amount `IncomeTaxCalculator` estimates is piecewise linear in income: brackets,
+contribution caps, BPA phase-outs and provincial credits only add breakpoints. `IncomeTaxCurve` builds
+those functions once for a province, year and income mix, so totals and marginal rates over a whole
+income range are read off a few dozen segments instead of running one estimate per point.
+
+Example:
+    curve = IncomeTaxCalculator.tax_curve("ON", 2025)
+    curve.breakpoints        # incomes where the marginal rate changes
+    curve.marginal_rates     # the marginal rate from 0, then after each breakpoint
+    curve.evaluate(range(0, 500_001, 1_000))["total_tax"]
+"""
+import operator
+from bisect import bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Iterable, Sequence
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.base import BpaCredit, BracketTable
+from canatax.rates.registry import rate_registry
+
+
+def _to_decimal(value: Fraction) -> Decimal:
+    if value.denominator == 1:
+        return Decimal(value.numerator)
+    return Decimal(value.numerator) / Decimal(value.denominator)
+
+
+@dataclass(frozen=True)
+class PiecewiseLinear:
+    """A continuous piecewise-linear function on [0, infinity), held as exact fractions.
+
+    `xs[i]` is where segment `i` starts, `ys[i]` the value there and `slopes[i]` the slope up to
+    `xs[i + 1]`. `xs[0]` is always 0 and the last segment extends to infinity.
+    """
+
+    xs: tuple[Fraction, ...]
+    ys: tuple[Fraction, ...]
+    slopes: tuple[Fraction, ...]
+
+    @classmethod
+    def line(cls, intercept: Fraction | Decimal | int = 0, slope: Fraction | Decimal | int = 0) -> "PiecewiseLinear":
+        return cls((Fraction(0),), (Fraction(intercept),), (Fraction(slope),))
+
+    @classmethod
+    def from_points(cls, xs: Sequence[Fraction], ys: Sequence[Fraction], last_slope: Fraction) -> "PiecewiseLinear":
+        """Build the function through `(xs[i], ys[i])`, with `xs` increasing from 0, merging collinear segments."""
+        slopes = [(y1 - y0) / (x1 - x0) for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:])]
+        slopes.append(Fraction(last_slope))
+        keep = [0] + [i for i in range(1, len(xs)) if slopes[i] != slopes[i - 1]]
+        return cls(tuple(xs[i] for i in keep), tuple(ys[i] for i in keep), tuple(slopes[i] for i in keep))
+
+    @classmethod
+    def from_bracket_table(cls, table: BracketTable) -> "PiecewiseLinear":
+        """Return the tax on taxable income under a bracket table, before credits."""
+        return cls(
+            tuple(map(Fraction, table.floors)),
+            tuple(map(Fraction, table.cumulative_tax[:-1])),
+            tuple(map(Fraction, table.rates)),
+        )
+
+    @classmethod
+    def from_bpa_credit(cls, credit: BpaCredit) -> "PiecewiseLinear":
+        """Return the basic personal amount credit as a function of net income, phase-out included."""
+        if credit.phase_out_start.is_infinite():
+            return cls.line(credit.max_credit)
+        xs = (Fraction(0), Fraction(credit.phase_out_start), Fraction(credit.phase_out_end))
+        ys = (Fraction(credit.max_credit), Fraction(credit.max_credit), Fraction(credit.min_credit))
+        return cls.from_points(xs, ys, Fraction(0))
+
+    @classmethod
+    def from_provincial_credits(cls, province: ProvinceOrTerritory, year: int, credits: Callable[[Decimal], Decimal]) -> "PiecewiseLinear":
+        """Return the province-specific credits `credits` gives as a function of net income.
+
+        Raises:
+            NotImplementedError: If the province has specific credits but declares no breakpoints for them.
+        """
+        rate = rate_registry.income_rate(province, year)
+        if not rate.has_province_specific_tax_credits():
+            return cls.line()
+        breakpoints = rate.province_specific_tax_credit_breakpoints
+        if not breakpoints:
+            raise NotImplementedError(f"{type(rate).__name__} has province-specific tax credits but no `province_specific_tax_credit_breakpoints`")
+        points = (Decimal(0),) + tuple(breakpoints)
+        last_slope = Fraction(credits(points[-1] + 1) - credits(points[-1]))
+        return cls.from_points([Fraction(p) for p in points], [Fraction(credits(p)) for p in points], last_slope)
+
+    def segment_index(self, x: Fraction) -> int:
+        """Return the index of the segment holding `x`; a breakpoint belongs to the segment it starts."""
+        return bisect_right(self.xs, x) - 1
+
+    def __call__(self, x: Fraction) -> Fraction:
+        i = self.segment_index(x)
+        return self.ys[i] + self.slopes[i] * (x - self.xs[i])
+
+    def slope_at(self, x: Fraction) -> Fraction:
+        """Return the slope just to the right of `x`."""
+        return self.slopes[self.segment_index(x)]
+
+    def solve(self, y: Fraction) -> Fraction:
+        """Return the smallest `x` with `self(x) >= y`. The function must be non-decreasing and unbounded."""
+        i = bisect_right(self.ys, y) - 1
+        if i < 0:
+            return Fraction(0)
+        if self.ys[i] == y or not self.slopes[i]:
+            return self.xs[i]
+        return self.xs[i] + (y - self.ys[i]) / self.slopes[i]
+
+    def _coerce(self, other: Any) -> "PiecewiseLinear":
+        return other if isinstance(other, PiecewiseLinear) else PiecewiseLinear.line(other)
+
+    def _pointwise(self, other: Any, op: Callable[[Fraction, Fraction], Fraction]) -> "PiecewiseLinear":
+        other = self._coerce(other)
+        xs = sorted(set(self.xs).union(other.xs))
+        return PiecewiseLinear.from_points(xs, [op(self(x), other(x)) for x in xs], op(self.slopes[-1], other.slopes[-1]))
+
+    def __add__(self, other: Any) -> "PiecewiseLinear":
+        return self._pointwise(other, operator.add)
+
+    def __sub__(self, other: Any) -> "PiecewiseLinear":
+        return self._pointwise(other, operator.sub)
+
+    def __mul__(self, factor: Fraction | Decimal | int) -> "PiecewiseLinear":
+        factor = Fraction(factor)
+        if not factor:
+            return PiecewiseLinear.line()
+        return PiecewiseLinear(self.xs, tuple(y * factor for y in self.ys), tuple(s * factor for s in self.slopes))
+
+    __rmul__ = __mul__
+
+    def _select(self, other: Any, choose: Callable[[Fraction, Fraction], Fraction]) -> "PiecewiseLinear":
+        other = self._coerce(other)
+        difference = self - other
+        xs = set(self.xs).union(other.xs)
+        for i, (x, y, slope) in enumerate(zip(difference.xs, difference.ys, difference.slopes)):
+            if not slope:
+                continue
+            root = x - y / slope
+            if root > x and (i + 1 == len(difference.xs) or root < difference.xs[i + 1]):
+                xs.add(root)
+        xs = sorted(xs)
+        last_self, last_other = self(xs[-1]), other(xs[-1])
+        if last_self == last_other:
+            last_slope = choose(self.slopes[-1], other.slopes[-1])
+        else:
+            last_slope = self.slopes[-1] if choose(last_self, last_other) == last_self else other.slopes[-1]
+        return PiecewiseLinear.from_points(xs, [choose(self(x), other(x)) for x in xs], last_slope)
+
+    def maximum(self, other: Any) -> "PiecewiseLinear":
+        return self._select(other, max)
+
+    def minimum(self, other: Any) -> "PiecewiseLinear":
+        return self._select(other, min)
+
+    def compose(self, inner: "PiecewiseLinear") -> "PiecewiseLinear":
+        """Return the function `x -> self(inner(x))`. `inner` must be non-negative and non-decreasing."""
+        xs = set(inner.xs)
+        for i, (x, y, slope) in enumerate(zip(inner.xs, inner.ys, inner.slopes)):
+            if slope <= 0:
+                continue
+            end = inner.ys[i + 1] if i + 1 < len(inner.xs) else None
+            for breakpoint in self.xs:
+                if breakpoint > y and (end is None or breakpoint < end):
+                    xs.add(x + (breakpoint - y) / slope)
+        xs = sorted(xs)
+        last_slope = self.slope_at(inner(xs[-1])) * inner.slopes[-1]
+        return PiecewiseLinear.from_points(xs, [self(inner(x)) for x in xs], last_slope)
+
+    @cached_property
+    def decimal_segments(self) -> tuple[tuple[Decimal, ...], tuple[Decimal, ...], tuple[Decimal, ...]]:
+        """`xs`, `ys` and `slopes` as Decimal tuples, converted once."""
+        return tuple(map(_to_decimal, self.xs)), tuple(map(_to_decimal, self.ys)), tuple(map(_to_decimal, self.slopes))
+
+    def segments(self) -> list[tuple[Decimal, Decimal | None, Decimal, Decimal]]:
+        """Return `(start, end, value at start, slope)` per segment, as Decimal. The last `end` is None."""
+        xs, ys, slopes = self.decimal_segments
+        return list(zip(xs, xs[1:] + (None,), ys, slopes))
+
+    def _walk(self, points: Sequence[Decimal]) -> Iterable[tuple[int, int]]:
+        """Yield `(point index, segment index)` in ascending point order, in one pass over the segments."""
+        xs = self.decimal_segments[0]
+        segment = 0
+        for i in sorted(range(len(points)), key=points.__getitem__):
+            while segment + 1 < len(xs) and xs[segment + 1] <= points[i]:
+                segment += 1
+            yield i, segment
+
+    def evaluate(self, points: Sequence[Decimal]) -> list[Decimal]:
+        """Return the function's value at every point (non-negative Decimals), in input order."""
+        xs, ys, slopes = self.decimal_segments
+        values = [None] * len(points)
+        for i, segment in self._walk(points):
+            values[i] = ys[segment] + slopes[segment] * (points[i] - xs[segment])
+        return values
+
+    def slopes_at(self, points: Sequence[Decimal]) -> list[Decimal]:
+        """Return the slope just to the right of every point, in input order."""
+        slopes = self.decimal_segments[2]
+        values = [None] * len(points)
+        for i, segment in self._walk(points):
+            values[i] = slopes[segment]
+        return values
+
+
+@dataclass(frozen=True)
+class IncomeTaxCurve:
+    """Every amount of an `IncomeTaxEstimate` as an exact piecewise-linear function of one income `x`.
+
+    Each income source is a fixed amount plus a share of `x`, so by default `x` is employment income;
+    with `employment_share=0.7, self_employment_share=0.3` it is gross income split 70/30. Amounts are
+    not rounded to the cent, so they can differ from `IncomeTaxCalculator.calculate` by the few cents
+    `calculate` rounds away. Build one with `IncomeTaxCalculator.tax_curve()`.
+    """
+
+    province: ProvinceOrTerritory
+    year: int
+    shares: tuple[Decimal, Decimal, Decimal]
+    fixed_incomes: tuple[Decimal, Decimal, Decimal]
+    rrsp_fhsa_contributions: Decimal
+    gross_income: PiecewiseLinear
+    federal_tax: PiecewiseLinear
+    provincial_tax: PiecewiseLinear
+    cpp: PiecewiseLinear
+    ei: PiecewiseLinear
+    qpip: PiecewiseLinear
+    qpp: PiecewiseLinear
+    net_income: PiecewiseLinear
+    total_tax: PiecewiseLinear
+    after_tax_income: PiecewiseLinear
+
+    @classmethod
+    def build(
+        cls,
+        province: str | ProvinceOrTerritory,
+        year: int = 2025,
+        employment_share: float | int | Decimal = 1,
+        self_employment_share: float | int | Decimal = 0,
+        other_share: float | int | Decimal = 0,
+        employment_income: float | int | Decimal = 0,
+        self_employment_income: float | int | Decimal = 0,
+        other_income: float | int | Decimal = 0,
+        rrsp_fhsa_contributions: float | int | Decimal = 0,
+    ) -> "IncomeTaxCurve":
+        """Return the shared curve for the province, year and income mix, building it on first use.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            InvalidDollarAmount: If any share or amount is invalid.
+            ValueError: If every share is zero.
+        """
+        decimalize = BaseCalculator._decimalize
+        shares = (decimalize(employment_share), decimalize(self_employment_share), decimalize(other_share))
+        if not any(shares):
+            raise ValueError("At least one income share must be positive")
+        fixed = (decimalize(employment_income), decimalize(self_employment_income), decimalize(other_income))
+        return _build(BaseCalculator._coerce_province(province), int(year), shares, fixed, decimalize(rrsp_fhsa_contributions))
+
+    @property
+    def breakpoints(self) -> tuple[Decimal, ...]:
+        """The values of `x` where the marginal rate of `total_tax` changes."""
+        return self.total_tax.decimal_segments[0][1:]
+
+    @property
+    def marginal_rates(self) -> tuple[Decimal, ...]:
+        """Tax on each extra dollar of gross income: up to the first breakpoint, then after each one."""
+        share = self.gross_income.decimal_segments[2][0]
+        return tuple(slope / share for slope in self.total_tax.decimal_segments[2])
+
+    def evaluate(self, incomes: Iterable[float | int | Decimal]) -> dict[str, list[Decimal]]:
+        """Evaluate the curve at every `x` in `incomes` in one pass per amount.
+
+        Returns:
+            dict[str, list[Decimal]]: `gross_income`, `total_tax`, `after_tax_income`, `marginal_rate`
+                and `effective_rate` (total tax over gross income), in input order.
+        """
+        points = [BaseCalculator._decimalize(income) for income in incomes]
+        gross_income = self.gross_income.evaluate(points)
+        total_tax = self.total_tax.evaluate(points)
+        share = self.gross_income.decimal_segments[2][0]
+        return {
+            "gross_income": gross_income,
+            "total_tax": total_tax,
+            "after_tax_income": self.after_tax_income.evaluate(points),
+            "marginal_rate": [slope / share for slope in self.total_tax.slopes_at(points)],
+            "effective_rate": [tax / gross if gross else Decimal(0) for tax, gross in zip(total_tax, gross_income)],
+        }
+
+    def incomes(self, x: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+        """Return the `(employment, self-employment, RRSP/FHSA, other)` amounts an estimate at `x` uses."""
+        employment, self_employment, other = (amount + share * x for amount, share in zip(self.fixed_incomes, self.shares))
+        return employment, self_employment, self.rrsp_fhsa_contributions, other
+
+    def gross_up(self, after_tax_income: float | int | Decimal) -> Decimal:
+        """Return the smallest `x`, to the cent, whose estimate leaves at least `after_tax_income` after tax.
+
+        The curve is inverted on the segment holding the target, then the answer is checked against
+        `IncomeTaxPlan` estimates a cent at a time to absorb the rounding the curve leaves out. That is
+        usually one or two estimates, whatever the target. Returns 0 if the target is already met at 0.
+
+        Raises:
+            InvalidDollarAmount: If `after_tax_income` is invalid.
+        """
+        target = BaseCalculator._decimalize(after_tax_income)
+        plan = IncomeTaxPlan.compile(self.province, self.year)
+
+        def after_tax(cents: int) -> Decimal:
+            return plan.row(*self.incomes(Decimal(cents).scaleb(-2)))[-1]
+
+        solution = self.after_tax_income.solve(Fraction(target))
+        cents = -(-solution.numerator * 100 // solution.denominator)
+        while after_tax(cents) < target:
+            cents += 1
+        while cents > 0 and after_tax(cents - 1) >= target:
+            cents -= 1
+        return Decimal(cents).scaleb(-2)
+
+
+def _earnings(income: PiecewiseLinear, upper: Decimal, lower: Decimal) -> PiecewiseLinear:
+    """Return `max(0, min(income, upper) - lower)`, the pensionable part of `income` between two caps."""
+    return (income.minimum(upper) - lower).maximum(0)
+
+
+@lru_cache(maxsize=256)
+def _build(
+    province: ProvinceOrTerritory,
+    year: int,
+    shares: tuple[Decimal, Decimal, Decimal],
+    fixed: tuple[Decimal, Decimal, Decimal],
+    rrsp_fhsa_contributions: Decimal,
+) -> IncomeTaxCurve:
+    # Mirrors `IncomeTaxPlan.row` step by step, on functions of x instead of amounts
+    plan = IncomeTaxPlan.compile(province, year)
+    employment, self_employment, other = (PiecewiseLinear.line(amount, share) for amount, share in zip(fixed, shares))
+    gross_income = employment + self_employment + other
+    zero = PiecewiseLinear.line()
+
+    ei = employment.minimum(plan.ei_max_earnings) * plan.ei_rate
+    pension = plan.pension
+    base_first_income = _earnings(employment, pension.max_earnings, pension.exemption)
+    second_income = _earnings(employment, pension.additional_max, pension.additional_min)
+    pension_employment = base_first_income * pension.base_rate + base_first_income * pension.first_additional_rate + second_income * pension.second_additional_rate
+    total_income = employment + self_employment
+    se_base_first_income = _earnings(total_income, pension.max_earnings, pension.exemption) - base_first_income
+    se_second_income = _earnings(total_income, pension.additional_max, pension.additional_min) - second_income
+    se_base_contrib = se_base_first_income * pension.base_rate_se
+    se_first_addl_contrib = se_base_first_income * pension.first_additional_rate_se
+    se_second_addl_contrib = se_second_income * pension.second_additional_rate_se
+    pension_total = pension_employment + se_base_contrib + se_first_addl_contrib + se_second_addl_contrib
+    if plan.qpip_rate is None:
+        cpp, qpp, qpip = pension_total, zero, zero
+    else:
+        cpp, qpp = zero, pension_total
+        qpip = gross_income.minimum(plan.qpip_max_earnings) * plan.qpip_rate
+
+    cpp_qpp_nrtc_base = se_base_contrib * Fraction(1, 2)
+    net_income = (gross_income - (cpp_qpp_nrtc_base + se_first_addl_contrib + se_second_addl_contrib)).maximum(0)
+    taxable_income = (net_income - rrsp_fhsa_contributions).maximum(0)
+
+    federal_tax_base = (PiecewiseLinear.from_bracket_table(plan.federal_brackets).compose(taxable_income) - PiecewiseLinear.from_bpa_credit(plan.federal_bpa).compose(net_income)).maximum(0)
+    provincial_tax_base = (PiecewiseLinear.from_bracket_table(plan.provincial_brackets).compose(taxable_income) - PiecewiseLinear.from_bpa_credit(plan.provincial_bpa).compose(net_income)).maximum(0)
+    federal_tax = (federal_tax_base - cpp_qpp_nrtc_base * plan.federal_bpa.lowest_rate).maximum(0)
+    provincial_tax = (provincial_tax_base - cpp_qpp_nrtc_base * plan.provincial_bpa.lowest_rate).maximum(0)
+    credits = PiecewiseLinear.from_provincial_credits(province, year, plan.provincial_credits).compose(net_income)
+
+    total_tax = federal_tax + provincial_tax + ei + cpp + qpip - credits
+    return IncomeTaxCurve(
+        province=province,
+        year=year,
+        shares=shares,
+        fixed_incomes=fixed,
+        rrsp_fhsa_contributions=rrsp_fhsa_contributions,
+        gross_income=gross_income,
+        federal_tax=federal_tax,
+        provincial_tax=provincial_tax,
+        cpp=cpp,
+        ei=ei,
+        qpip=qpip,
+        qpp=qpp,
+        net_income=net_income,
+        total_tax=total_tax,
+        after_tax_income=net_income - total_tax,
+    )
@@ -21,3 +21,37 @@ class ProvinceOrTerritory(Enum):
     SASKATCHEWAN = 'SK'
     YUKON = 'YK'
 
+
+class Engine(Enum):
+    DECIMAL = 'decimal'
+    INT = 'int'
+
+
+class TaxCategory(Enum):
+    STANDARD = 'standard'
+    PST_EXEMPT = 'pst_exempt'
+    EXEMPT = 'exempt'
+
+
+class RoundingPolicy(Enum):
+    PER_LINE = 'per_line'
+    PER_INVOICE = 'per_invoice'
+
+
+class PayPeriod(Enum):
+    WEEKLY = 'weekly'
+    BIWEEKLY = 'biweekly'
+    SEMI_MONTHLY = 'semi_monthly'
+    MONTHLY = 'monthly'
+
+    @property
+    def periods_per_year(self) -> int:
+        return _PERIODS_PER_YEAR[self]
+
+
+_PERIODS_PER_YEAR = {
+    PayPeriod.WEEKLY: 52,
+    PayPeriod.BIWEEKLY: 26,
+    PayPeriod.SEMI_MONTHLY: 24,
+    PayPeriod.MONTHLY: 12,
+}
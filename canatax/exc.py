@@ -11,10 +11,18 @@ class InvalidProvinceError(CanataxError):
     def __init__(self, province:str|ProvinceOrTerritory):
         message = f"Invalid province or territory: `{province}`. Value must be two-letter string: AB,BC,MB,NB,NL,NS,NT,NU,ON,PE,QC,SK,YK."
         super().__init__(message)
+        self.province = province
+
+    def __reduce__(self):
+        return self.__class__, (self.province,)
 
 
 class InvalidDollarAmount(CanataxError):
     """Raised when an invalid amount is passed to a tax calculator."""
     def __init__(self, amount:Any):
         message = f"Invalid dollar amount `{amount}`"
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+        self.amount = amount
+
+    def __reduce__(self):
+        return self.__class__, (self.amount,)
\ No newline at end of file
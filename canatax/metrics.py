@@ -0,0 +1,205 @@
+"""In-process usage and latency metrics for the calculators.
+
+Turn recording on with `IncomeTaxCalculator.enable_metrics()` and `SalesTaxCalculator.enable_metrics()`. Each
+`calculate` call is then counted by calculator, province, year and engine, its latency goes into a histogram per
+calculator and engine, and `InvalidDollarAmount` and `InvalidProvinceError` are counted per calculator.
+`MetricsRegistry.observe_stage` can also be registered with `canatax.profiling.add_hook` for a latency
+histogram per estimate stage.
+
+Every thread records into its own shard without taking a lock; shards are only merged when the registry is
+exported, so the export is a snapshot that may miss observations still being written.
+
+Example:
+    registry = IncomeTaxCalculator.enable_metrics()
+    SalesTaxCalculator.enable_metrics(registry)
+    ...
+    body = registry.to_prometheus()
+"""
+import threading
+import weakref
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Callable
+
+from canatax.enums import Engine
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+
+
+DEFAULT_BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+"""Histogram upper bounds in seconds; estimates take microseconds, so the low end is fine-grained."""
+
+
+class _Shard:
+    """One thread's observations. Histograms hold one count per bucket, then the +Inf count and the sum."""
+
+    __slots__ = ("estimates", "errors", "latency", "stages")
+
+    def __init__(self):
+        self.estimates: dict[tuple, int] = {}
+        self.errors: dict[tuple, int] = {}
+        self.latency: dict[tuple, list] = {}
+        self.stages: dict[tuple, list] = {}
+
+    def merge(self, other: "_Shard") -> None:
+        for name in ("estimates", "errors"):
+            counts = getattr(self, name)
+            for key, count in getattr(other, name).copy().items():
+                counts[key] = counts.get(key, 0) + count
+        for name in ("latency", "stages"):
+            histograms = getattr(self, name)
+            for key, values in getattr(other, name).copy().items():
+                values = list(values)
+                merged = histograms.get(key)
+                if merged is None:
+                    histograms[key] = values
+                else:
+                    histograms[key] = [a + b for a, b in zip(merged, values)]
+
+
+class MetricsRegistry:
+    """Counters and latency histograms for calculator calls, safe to share between threads."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+        # Shards of threads that have exited, folded together so short-lived threads don't pile up
+        self._retired = _Shard()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            weakref.finalize(threading.current_thread(), self._retire, shard)
+            return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        with self._lock:
+            if shard in self._shards:
+                self._shards.remove(shard)
+                self._retired.merge(shard)
+
+    def _observe(self, histograms: dict[tuple, list], key: tuple, seconds: float) -> None:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def observe_estimate(self, calculator: str, province: str, year: int, engine: str, seconds: float) -> None:
+        shard = self._shard()
+        key = (calculator, province, year, engine)
+        shard.estimates[key] = shard.estimates.get(key, 0) + 1
+        self._observe(shard.latency, (calculator, engine), seconds)
+
+    def observe_error(self, calculator: str, error: str) -> None:
+        shard = self._shard()
+        key = (calculator, error)
+        shard.errors[key] = shard.errors.get(key, 0) + 1
+
+    def observe_stage(self, stage: str, province: Any, year: int, seconds: float) -> None:
+        """A `canatax.profiling` hook recording a latency histogram per estimate stage."""
+        self._observe(self._shard().stages, (stage,), seconds)
+
+    def measure(self, calculator: str, year: int, engine: Engine, compute: Callable[..., Any], *args: Any) -> Any:
+        """Return `compute(*args)`, recording its latency and outcome under `calculator`."""
+        started = perf_counter()
+        try:
+            estimate = compute(*args)
+        except (InvalidDollarAmount, InvalidProvinceError) as e:
+            self.observe_error(calculator, type(e).__name__)
+            raise
+        self.observe_estimate(calculator, estimate.province.value, int(year), engine.value, perf_counter() - started)
+        return estimate
+
+    def snapshot(self) -> _Shard:
+        """Merge every thread's observations so far."""
+        merged = _Shard()
+        with self._lock:
+            merged.merge(self._retired)
+            for shard in self._shards:
+                merged.merge(shard)
+        return merged
+
+    def reset(self) -> None:
+        """Forget every observation. Threads recording at the same moment may keep a few."""
+        with self._lock:
+            self._retired = _Shard()
+            for shard in self._shards:
+                shard.estimates.clear()
+                shard.errors.clear()
+                shard.latency.clear()
+                shard.stages.clear()
+
+    def _histogram_dict(self, values: list) -> dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip((*self.buckets, float("inf")), values):
+            cumulative += count
+            buckets[str(bound) if bound != float("inf") else "+Inf"] = cumulative
+        return {"buckets": buckets, "count": cumulative, "sum": values[-1]}
+
+    def to_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return every metric as plain lists of dicts, e.g. to serve as JSON. Histogram buckets are cumulative."""
+        snapshot = self.snapshot()
+        return {
+            "estimates": [
+                {"calculator": calculator, "province": province, "year": year, "engine": engine, "count": count}
+                for (calculator, province, year, engine), count in sorted(snapshot.estimates.items())
+            ],
+            "latency_seconds": [
+                {"calculator": calculator, "engine": engine, **self._histogram_dict(values)}
+                for (calculator, engine), values in sorted(snapshot.latency.items())
+            ],
+            "validation_errors": [
+                {"calculator": calculator, "error": error, "count": count}
+                for (calculator, error), count in sorted(snapshot.errors.items())
+            ],
+            "stage_seconds": [
+                {"stage": stage, **self._histogram_dict(values)}
+                for (stage,), values in sorted(snapshot.stages.items())
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        data = self.to_dict()
+        lines = [
+            "# HELP canatax_estimates_total Estimates calculated.",
+            "# TYPE canatax_estimates_total counter",
+        ]
+        for row in data["estimates"]:
+            lines.append(f"canatax_estimates_total{_labels(row, 'calculator', 'province', 'year', 'engine')} {row['count']}")
+        lines += [
+            "# HELP canatax_validation_errors_total Calls rejected for an invalid amount or province.",
+            "# TYPE canatax_validation_errors_total counter",
+        ]
+        for row in data["validation_errors"]:
+            lines.append(f"canatax_validation_errors_total{_labels(row, 'calculator', 'error')} {row['count']}")
+        lines += _histogram_lines("canatax_estimate_duration_seconds", "Time spent in calculate().", data["latency_seconds"], ("calculator", "engine"))
+        lines += _histogram_lines("canatax_stage_duration_seconds", "Time spent in each estimate stage.", data["stage_seconds"], ("stage",))
+        return "\n".join(lines) + "\n"
+
+
+def _labels(row: dict[str, Any], *names: str, **extra: str) -> str:
+    pairs = [(name, row[name]) for name in names] + list(extra.items())
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _histogram_lines(name: str, description: str, rows: list[dict[str, Any]], label_names: tuple[str, ...]) -> list[str]:
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+    for row in rows:
+        for bound, count in row["buckets"].items():
+            lines.append(f"{name}_bucket{_labels(row, *label_names, le=bound)} {count}")
+        lines.append(f"{name}_sum{_labels(row, *label_names)} {row['sum']}")
+        lines.append(f"{name}_count{_labels(row, *label_names)} {row['count']}")
+    return lines
+
+
+metrics = MetricsRegistry()
+"""The registry `enable_metrics()` records into unless given another."""
@@ -0,0 +1,201 @@
+"""Run large income or sales tax batches across worker processes.
+
+Input rows are cut into chunks, each chunk is estimated in a worker process with
+`IncomeTaxCalculator.calculate_many` or `SalesTaxCalculator.calculate_many`, and each chunk comes back as
+one column set rather than one pickled estimate per row. Workers warm up the rate registry and compiled
+plans once when they start. Only a bounded number of chunks is in flight at a time, so rows can be
+streamed from a generator without loading the whole input.
+
+Example:
+    rows = ((row.salary, 0, row.province) for row in read_payroll())
+    columns = calculate_income_batch(rows, workers=32, chunk_size=20_000)
+"""
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.enums import Engine, ProvinceOrTerritory
+from canatax.rates.registry import rate_registry
+from canatax.tax_estimate import BaseEstimateColumns, IncomeTaxEstimateColumns, SalesTaxEstimateColumns
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+INCOME_FIELDS = ("employment_income", "self_employment_income", "province", "rrsp_fhsa_contributions", "other_income")
+INCOME_DEFAULTS = (None, 0, None, 0, 0)
+SALES_FIELDS = ("amount", "province")
+
+
+def _columns(chunk: Sequence[Sequence[Any] | Mapping[str, Any]], names: tuple[str, ...], defaults: tuple[Any, ...]) -> dict[str, list[Any]]:
+    """Turn row tuples (in `names` order, trailing values optional) or mappings into columns."""
+    columns = {name: [] for name in names}
+    for row in chunk:
+        if isinstance(row, Mapping):
+            values = [row.get(name, default) for name, default in zip(names, defaults)]
+        else:
+            values = list(row) + list(defaults[len(row):])
+        for name, value in zip(names, values):
+            columns[name].append(value)
+    return columns
+
+
+def _income_chunk(chunk: list, year: int, engine: str) -> IncomeTaxEstimateColumns:
+    return IncomeTaxCalculator.calculate_many(**_columns(chunk, INCOME_FIELDS, INCOME_DEFAULTS), year=year, engine=engine)
+
+
+def _sales_chunk(chunk: list, year: int, engine: str) -> SalesTaxEstimateColumns:
+    return SalesTaxCalculator.calculate_many(**_columns(chunk, SALES_FIELDS, (None, None)), year=year, engine=engine)
+
+
+def _warm_up_income(year: int, engine: str):
+    """Worker initializer for income batches: resolve rates and compile plans before the first chunk arrives."""
+    rate_registry.federal_rate(year)
+    rate_registry.contributions(year)
+    for province in ProvinceOrTerritory:
+        rate_registry.income_rate(province, year)
+        IncomeTaxCalculator.compile(province, year, engine)
+
+
+def _warm_up_sales(year: int, engine: str):
+    """Worker initializer for sales batches; sales rates exist for years without contribution data."""
+    for province in ProvinceOrTerritory:
+        rate_registry.sales_rate(province, year)
+        SalesTaxCalculator.compile(province, year, engine)
+
+
+def _chunks(rows: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _run(
+    func: Callable[[list, int, str], BaseEstimateColumns],
+    warm_up: Callable[[int, str], None],
+    rows: Iterable[Any],
+    workers: int | None,
+    chunk_size: int,
+    year: int,
+    engine: str | Engine,
+    ordered: bool,
+    executor: Executor | None,
+) -> Iterator[tuple[int, BaseEstimateColumns]]:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    year, engine = int(year), Engine(engine).value
+    if executor is None and workers == 1:
+        offset = 0
+        for chunk in _chunks(rows, chunk_size):
+            yield offset, func(chunk, year, engine)
+            offset += len(chunk)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        # Warm up here first: a year without rates raises its own error in the caller, where a failing
+        # worker initializer would only surface as BrokenProcessPool
+        warm_up(year, engine)
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up, initargs=(year, engine))
+    max_in_flight = 2 * (workers or os.cpu_count() or 1)
+    pending: dict[Future, int] = {}
+    done_out_of_order: dict[int, BaseEstimateColumns] = {}
+    next_offset = 0
+    chunks = _chunks(rows, chunk_size)
+    offset = 0
+    try:
+        exhausted = False
+        while pending or not exhausted:
+            # Results held back for an unfinished earlier chunk count as in flight, so a slow head chunk
+            # stops submission instead of letting finished chunks pile up
+            while not exhausted and len(pending) + len(done_out_of_order) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                pending[executor.submit(func, chunk, year, engine)] = offset
+                offset += len(chunk)
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk_offset = pending.pop(future)
+                result = future.result()
+                if not ordered:
+                    yield chunk_offset, result
+                    continue
+                done_out_of_order[chunk_offset] = result
+            while next_offset in done_out_of_order:
+                result = done_out_of_order.pop(next_offset)
+                yield next_offset, result
+                next_offset += len(result)
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def iter_income_batch(
+    rows: Iterable[Sequence[Any] | Mapping[str, Any]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    ordered: bool = True,
+    executor: Executor | None = None,
+) -> Iterator[tuple[int, IncomeTaxEstimateColumns]]:
+    """Estimate income tax for `rows` in worker processes, yielding one chunk of results at a time.
+
+    Args:
+        rows: Tuples of `(employment_income, self_employment_income, province[, rrsp_fhsa_contributions[, other_income]])`
+            or mappings keyed by those names.
+        workers (int | None): Number of worker processes. Defaults to the CPU count; 1 runs in this process.
+        chunk_size (int): Rows per work unit.
+        year (int): Tax year for every row.
+        engine (str | Engine): "decimal" or "int".
+        ordered (bool): If True, chunks are yielded in input order. If False, as soon as each one finishes.
+        executor (Executor | None): Run on an existing executor instead of starting a process pool.
+
+    Yields:
+        tuple[int, IncomeTaxEstimateColumns]: The index of the chunk's first row in the input, and its results.
+    """
+    return _run(_income_chunk, _warm_up_income, rows, workers, chunk_size, year, engine, ordered, executor)
+
+
+def iter_sales_batch(
+    rows: Iterable[Sequence[Any] | Mapping[str, Any]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    ordered: bool = True,
+    executor: Executor | None = None,
+) -> Iterator[tuple[int, SalesTaxEstimateColumns]]:
+    """Like `iter_income_batch`, for rows of `(amount, province)` or mappings with those keys."""
+    return _run(_sales_chunk, _warm_up_sales, rows, workers, chunk_size, year, engine, ordered, executor)
+
+
+def calculate_income_batch(
+    rows: Iterable[Sequence[Any] | Mapping[str, Any]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+) -> IncomeTaxEstimateColumns:
+    """Estimate income tax for every row in worker processes and return all results in input order."""
+    return IncomeTaxEstimateColumns.concat(columns for _, columns in iter_income_batch(rows, workers, chunk_size, year, engine))
+
+
+def calculate_sales_batch(
+    rows: Iterable[Sequence[Any] | Mapping[str, Any]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+) -> SalesTaxEstimateColumns:
+    """Estimate sales tax for every `(amount, province)` row in worker processes and return all results in input order."""
+    return SalesTaxEstimateColumns.concat(columns for _, columns in iter_sales_batch(rows, workers, chunk_size, year, engine))
@@ -0,0 +1,218 @@
+"""Per-stage timing of `IncomeTaxCalculator.calculate`.
+
+Register a hook with `add_hook()`, or wrap a stretch of real traffic in `StageProfiler`, to time each stage of
+every estimate: the constructor (input validation and rate loading), `_ei`, `_cpp`, `_qpip`,
+`_self_employed_cpp_qpp_components`, the federal and provincial `calculate_tax` and `get_bpa`, and
+`province_specific_tax_credits`, plus the whole estimate as `total`. Integer-engine estimates are timed as a
+whole only, and cache hits (see `enable_cache()`) are not timed at all. When no hook is registered `calculate`
+pays for one truth test and nothing else.
+
+Example:
+    with StageProfiler() as profiler:
+        serve_traffic()
+    print(profiler.table())
+"""
+from collections import defaultdict
+from decimal import Decimal
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+from canatax.enums import Engine, ProvinceOrTerritory
+from canatax.tax_estimate import IncomeTaxEstimate
+
+
+Hook = Callable[[str, ProvinceOrTerritory, int, float], None]
+"""Called as `hook(stage, province, year, seconds)` once per stage of every estimate."""
+
+TOTAL = "total"
+RATE_STAGES = ("calculate_tax", "get_bpa", "province_specific_tax_credits")
+CALCULATOR_STAGES = ("_ei", "_cpp", "_qpip", "_self_employed_cpp_qpp_components")
+
+_lock = Lock()
+
+
+def _calculator_class():
+    from canatax.calculators.income_calculator import IncomeTaxCalculator
+    return IncomeTaxCalculator
+
+
+def add_hook(hook: Hook) -> None:
+    """Start calling `hook` for every stage of every `IncomeTaxCalculator.calculate` in this process."""
+    cls = _calculator_class()
+    with _lock:
+        cls._stage_hooks = (*cls._stage_hooks, hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling `hook`. Once the last hook is removed, estimates run untimed again.
+
+    Raises:
+        ValueError: If `hook` was not registered.
+    """
+    cls = _calculator_class()
+    with _lock:
+        hooks = list(cls._stage_hooks)
+        hooks.remove(hook)
+        cls._stage_hooks = tuple(hooks)
+
+
+class _TimedRate:
+    """Stands in for a rate object on one calculator, timing the methods the estimate calls."""
+
+    def __init__(self, rate: Any, prefix: str, emit: Callable[[str, float], None]):
+        self._rate = rate
+        for name in RATE_STAGES:
+            if hasattr(rate, name):
+                setattr(self, name, _timed(getattr(rate, name), f"{prefix}.{name}", emit))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._rate, name)
+
+
+def _timed(method: Callable, stage: str, emit: Callable[[str, float], None]) -> Callable:
+    def timed(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            emit(stage, perf_counter() - started)
+    return timed
+
+
+def timed_estimate(
+    cls: type,
+    hooks: tuple[Hook, ...],
+    employment_income: float | int | Decimal,
+    self_employment_income: float | int | Decimal,
+    province: str | ProvinceOrTerritory,
+    year: int,
+    rrsp_fhsa_contributions: float | int | Decimal,
+    other_income: float | int | Decimal,
+    engine: Engine,
+) -> IncomeTaxEstimate:
+    """`IncomeTaxCalculator._estimate` with every stage reported to `hooks`."""
+    started = perf_counter()
+    if engine == Engine.INT:
+        from canatax.calculators.int_engine import IntIncomeTaxPlan
+        plan = IntIncomeTaxPlan.compile(province, year)
+        estimate = plan(employment_income, self_employment_income, rrsp_fhsa_contributions, other_income)
+        elapsed = perf_counter() - started
+        for hook in hooks:
+            hook(TOTAL, plan.province, plan.year, elapsed)
+        return estimate
+
+    calculator = cls(
+        employment_income=employment_income,
+        self_employment_income=self_employment_income,
+        province=province,
+        year=year,
+        rrsp_fhsa_contributions=rrsp_fhsa_contributions,
+        other_income=other_income,
+    )
+    setup = perf_counter() - started
+    province, year = calculator.province, calculator.year
+
+    def emit(stage: str, seconds: float):
+        for hook in hooks:
+            hook(stage, province, year, seconds)
+
+    emit("setup", setup)
+    for name in CALCULATOR_STAGES:
+        setattr(calculator, name, _timed(getattr(calculator, name), name, emit))
+    calculator.federal_tax_rate = _TimedRate(calculator.federal_tax_rate, "federal", emit)
+    calculator.provincial_tax_rate = _TimedRate(calculator.provincial_tax_rate, "provincial", emit)
+    estimate = calculator._calculate()
+    emit(TOTAL, perf_counter() - started)
+    return estimate
+
+
+class StageStats(NamedTuple):
+    calls: int
+    seconds: float
+
+
+class StageSummary(NamedTuple):
+    province: ProvinceOrTerritory | None
+    year: int | None
+    stage: str
+    calls: int
+    seconds: float
+    share: float
+    """Fraction of the group's `total` time spent in this stage."""
+
+
+class StageProfiler:
+    """Accumulates wall time and call counts per province, year and stage while active.
+
+    Use it as a context manager, or call `start()` and `stop()`. It is thread-safe, so it can stay active
+    under concurrent traffic, and can be started again to keep accumulating.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._stats: dict[tuple[ProvinceOrTerritory, int, str], list] = defaultdict(lambda: [0, 0.0])
+
+    def record(self, stage: str, province: ProvinceOrTerritory, year: int, seconds: float) -> None:
+        """The hook registered while the profiler is active."""
+        with self._lock:
+            entry = self._stats[province, year, stage]
+            entry[0] += 1
+            entry[1] += seconds
+
+    def start(self) -> "StageProfiler":
+        add_hook(self.record)
+        return self
+
+    def stop(self) -> None:
+        remove_hook(self.record)
+
+    def __enter__(self) -> "StageProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def stats(self) -> dict[tuple[ProvinceOrTerritory, int, str], StageStats]:
+        """Return the raw counts keyed by `(province, year, stage)`."""
+        with self._lock:
+            return {key: StageStats(*entry) for key, entry in self._stats.items()}
+
+    def summary(self, group_by: tuple[str, ...] = ("province", "year")) -> list[StageSummary]:
+        """Return one row per group and stage, slowest stages first within each group.
+
+        Args:
+            group_by (tuple[str, ...]): Any of "province" and "year"; the others are summed over and left None.
+        """
+        unknown = set(group_by) - {"province", "year"}
+        if unknown:
+            raise ValueError(f"Can only group by province and year, not {', '.join(sorted(unknown))}")
+        groups: dict[tuple, dict[str, list]] = defaultdict(lambda: defaultdict(lambda: [0, 0.0]))
+        for (province, year, stage), (calls, seconds) in self.stats().items():
+            key = (province if "province" in group_by else None, year if "year" in group_by else None)
+            entry = groups[key][stage]
+            entry[0] += calls
+            entry[1] += seconds
+        rows = []
+        for (province, year), stages in sorted(groups.items(), key=lambda item: (str(item[0][0]), item[0][1] or 0)):
+            total = stages[TOTAL][1] if TOTAL in stages else 0.0
+            ordered = sorted(stages.items(), key=lambda item: (item[0] != TOTAL, -item[1][1]))
+            for stage, (calls, seconds) in ordered:
+                rows.append(StageSummary(province, year, stage, calls, seconds, seconds / total if total else 0.0))
+        return rows
+
+    def table(self, group_by: tuple[str, ...] = ("province", "year")) -> str:
+        """Return `summary()` as a fixed-width text table."""
+        lines = [f"{'province':<8}  {'year':>4}  {'stage':<44}  {'calls':>9}  {'total ms':>10}  {'mean us':>9}  {'share':>6}"]
+        for row in self.summary(group_by):
+            province = row.province.value if row.province is not None else "*"
+            year = row.year if row.year is not None else "*"
+            mean = row.seconds / row.calls * 1e6 if row.calls else 0.0
+            lines.append(
+                f"{province:<8}  {year:>4}  {row.stage:<44}  {row.calls:>9}  {row.seconds * 1e3:>10.3f}  {mean:>9.2f}  {row.share:>6.1%}"
+            )
+        return "\n".join(lines)
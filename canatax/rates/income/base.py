@@ -1,44 +1,151 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable
 from canatax.utils import percent_to_decimal
 
 
+@dataclass(frozen=True)
+class BracketTable:
+    """Brackets of a tax rate compiled into Decimal columns.
+
+    `thresholds[i]` is the upper bound of bracket `i`, `rates[i]` its marginal rate as a decimal
+    fraction, and `floors[i]` the lower bound. `cumulative_tax[i]` is the tax owed on an income of
+    exactly `floors[i]`; it has one extra trailing entry holding the tax on the last threshold.
+    """
+
+    thresholds: tuple[Decimal, ...]
+    rates: tuple[Decimal, ...]
+    floors: tuple[Decimal, ...]
+    cumulative_tax: tuple[Decimal, ...]
+
+    @classmethod
+    def from_brackets(cls, brackets: list[tuple[float | int, float | int]]) -> "BracketTable":
+        thresholds = []
+        rates = []
+        floors = []
+        cumulative_tax = [Decimal(0)]
+        previous_threshold = Decimal(0)
+        for rate, threshold in brackets:
+            threshold = Decimal(threshold)
+            rate = percent_to_decimal(rate)
+            thresholds.append(threshold)
+            rates.append(rate)
+            floors.append(previous_threshold)
+            cumulative_tax.append(cumulative_tax[-1] + (threshold - previous_threshold) * rate)
+            previous_threshold = threshold
+        return cls(tuple(thresholds), tuple(rates), tuple(floors), tuple(cumulative_tax))
+
+    def bracket_index(self, income: Decimal) -> int:
+        """Return the index of the bracket `income` falls in (thresholds are inclusive upper bounds)."""
+        return bisect_left(self.thresholds, income)
+
+    def tax(self, income: Decimal) -> Decimal:
+        """Return the unrounded tax owed on `income`."""
+        i = bisect_left(self.thresholds, income)
+        if i == len(self.thresholds):
+            return self.cumulative_tax[i]
+        return self.cumulative_tax[i] + (income - self.floors[i]) * self.rates[i]
+
+
+@dataclass(frozen=True)
+class BpaCredit:
+    """The basic personal amount credit (BPA times the lowest rate) of a tax rate, precomputed.
+
+    Outside the phase-out range the credit is a constant; inside it `get_bpa` is still used so the
+    result matches the rate class exactly. Rates without a phase-out have an infinite range start.
+    """
+
+    phase_out_start: Decimal
+    phase_out_end: Decimal
+    max_credit: Decimal
+    min_credit: Decimal
+    lowest_rate: Decimal
+    get_bpa: Callable[[Decimal], Decimal]
+
+    @classmethod
+    def from_rate(cls, rate: type["BaseIncomeTaxRate"]) -> "BpaCredit":
+        lowest_rate = rate.bracket_table().rates[0]
+        if not hasattr(rate, "_BPA_PHASE_OUT_START"):
+            credit = rate.get_bpa(Decimal(0)) * lowest_rate
+            return cls(Decimal('Infinity'), Decimal('Infinity'), credit, credit, lowest_rate, rate.get_bpa)
+        start = Decimal(rate._BPA_PHASE_OUT_START)
+        end = Decimal(rate._BPA_PHASE_OUT_END)
+        return cls(start, end, rate.get_bpa(start) * lowest_rate, rate.get_bpa(end) * lowest_rate, lowest_rate, rate.get_bpa)
+
+    def credit(self, net_income: Decimal) -> Decimal:
+        if net_income <= self.phase_out_start:
+            return self.max_credit
+        if net_income >= self.phase_out_end:
+            return self.min_credit
+        return self.get_bpa(net_income) * self.lowest_rate
+
+
 class BaseIncomeTaxRate(ABC):
     brackets: list[tuple[float|int, int | float]]
 
+    @classmethod
+    def bracket_table(cls) -> BracketTable:
+        """Return the class's brackets compiled into a `BracketTable`, built once per class."""
+        table = cls.__dict__.get("_bracket_table")
+        if table is None or table[0] is not cls.brackets:
+            table = (cls.brackets, BracketTable.from_brackets(cls.brackets))
+            cls._bracket_table = table
+        return table[1]
+
+    @classmethod
+    def bpa_credit(cls) -> BpaCredit:
+        """Return the class's basic personal amount credit as a `BpaCredit`, built once per class."""
+        credit = cls.__dict__.get("_bpa_credit")
+        if credit is None:
+            credit = cls._bpa_credit = BpaCredit.from_rate(cls)
+        return credit
+
     @property
     def lowest_rate(self) -> Decimal:
         """Return the lowest marginal tax rate for non-refundable credit calculations."""
         if self.brackets:
-            return percent_to_decimal(self.brackets[0][0])
+            return self.bracket_table().rates[0]
         raise NotImplementedError(f"{self.__class__.__name__} has no brackets defined")
 
     def calculate_tax(self, income: Decimal) -> Decimal:
         """Returns the tax owed (estimate) on a given income amount."""
-        tax_owed = Decimal(0)
-        previous_threshold = Decimal(0)
-        for rate, threshold in self.brackets:
-            if income > threshold:
-                tax_owed += (Decimal(threshold) - Decimal(previous_threshold)) * percent_to_decimal(rate)
-                previous_threshold = threshold
-            else:
-                tax_owed += (income - Decimal(previous_threshold)) * percent_to_decimal(rate)
-                break
-        return tax_owed.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return self.bracket_table().tax(income).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     @classmethod
     def get_bpa(cls, income: Decimal) -> Decimal:
         if hasattr(cls, "BPA") and not hasattr(cls, "_BPA_MIN") and not hasattr(cls, "_BPA_MAX"):
             return getattr(cls, "BPA")
+        elif hasattr(cls, "_BPA_PHASE_OUT_START") and hasattr(cls, "_BPA_PHASE_OUT_END"):
+            # Linear phase-out from _BPA_MAX down to _BPA_MIN, optionally rounded to _BPA_QUANTUM
+            if income <= cls._BPA_PHASE_OUT_START:
+                bpa = cls._BPA_MAX
+            elif income >= cls._BPA_PHASE_OUT_END:
+                bpa = cls._BPA_MIN
+            else:
+                reduction_ratio = ((income - cls._BPA_PHASE_OUT_START) / (cls._BPA_PHASE_OUT_END - cls._BPA_PHASE_OUT_START))
+                bpa = cls._BPA_MAX - (reduction_ratio * (cls._BPA_MAX - cls._BPA_MIN))
+            quantum = getattr(cls, "_BPA_QUANTUM", None)
+            return bpa.quantize(quantum) if quantum is not None else bpa
         elif hasattr(cls, "_BPA_MIN") and hasattr(cls, "_BPA_MAX"):
             raise NotImplementedError(f"{cls.__name__} has a BPA (basic personal amount) range. It must implement its own calculation for BPA.")
         else:
             raise NotImplementedError(f"{cls.__name__} missing BPA (basic personal amount) information.")
 class ProvincialIncomeTaxRate(BaseIncomeTaxRate):
+    # Net incomes where `province_specific_tax_credits` changes slope. Between them, and past the last one,
+    # the credits must be linear in net income; the tax curve in `canatax.calculators.tax_curve` relies on it.
+    province_specific_tax_credit_breakpoints: tuple[Decimal, ...] = ()
+
     def province_specific_tax_credits(self, income: Decimal) -> Decimal:
         """Override in province-specific classes to return province-specific tax credits."""
         return Decimal(0)
 
+    @classmethod
+    def has_province_specific_tax_credits(cls) -> bool:
+        """Return True if the class overrides `province_specific_tax_credits`."""
+        return cls.province_specific_tax_credits is not ProvincialIncomeTaxRate.province_specific_tax_credits
+
 
 class BaseContribution:
 
@@ -48,3 +155,44 @@ class BaseContribution:
     @property
     def rate_decimal(self) -> Decimal:
         return Decimal(self.rate / 100)
+
+
+class PensionContribution(BaseContribution):
+    """CPP or QPP: a base rate up to `max_earnings` above `exemption`, a first additional rate on the
+    same earnings and a second additional rate between `additional_min` and `additional_max`. The `_se`
+    rates are the self-employed ones (employee and employer shares)."""
+
+    base_rate = Decimal(0)
+    base_rate_se = Decimal(0)
+    first_additional_rate = Decimal(0)
+    first_additional_rate_se = Decimal(0)
+    second_additional_rate = Decimal(0)
+    second_additional_rate_se = Decimal(0)
+
+    exemption = Decimal(0)
+    additional_min = Decimal(0)
+    additional_max = Decimal(0)
+
+    @property
+    def base_rate_decimal(self) -> Decimal:
+        return self.base_rate / Decimal('100')
+
+    @property
+    def base_rate_se_decimal(self) -> Decimal:
+        return self.base_rate_se / Decimal('100')
+
+    @property
+    def first_additional_rate_decimal(self) -> Decimal:
+        return self.first_additional_rate / Decimal('100')
+
+    @property
+    def first_additional_rate_se_decimal(self) -> Decimal:
+        return self.first_additional_rate_se / Decimal('100')
+
+    @property
+    def second_additional_rate_decimal(self) -> Decimal:
+        return self.second_additional_rate / Decimal('100')
+
+    @property
+    def second_additional_rate_se_decimal(self) -> Decimal:
+        return self.second_additional_rate_se / Decimal('100')
@@ -1,19 +1,19 @@
+from dataclasses import dataclass
 
+from .base import BaseContribution
+
+
+@dataclass(frozen=True, init=False)
 class Contributions:
+    cpp: BaseContribution
+    ei: BaseContribution
+    ei_quebec: BaseContribution
+    qpp: BaseContribution
+    qpip: BaseContribution
+
     def __init__(self, year: int = 2025):
-        if int(year) == 2025:
-            from .contribution_rates.rates_2025 import CPP, EI, QPP, QPIP, EIQuebec
-            self.cpp = CPP()
-            self.ei = EI()
-            self.ei_quebec = EIQuebec()
-            self.qpp = QPP()
-            self.qpip = QPIP()
-        elif int(year) == 2024:
-            from .contribution_rates.rates_2024 import CPP, EI, QPP, QPIP, EIQuebec
-            self.cpp = CPP()
-            self.ei = EI()
-            self.ei_quebec = EIQuebec()
-            self.qpp = QPP()
-            self.qpip = QPIP()
-        else:
+        from canatax.rates.tables import available_years, contribution_class
+        if int(year) not in available_years():
             raise NotImplementedError(f"Contribution rates for year {year} not implemented.")
+        for name in ('cpp', 'ei', 'ei_quebec', 'qpp', 'qpip'):
+            object.__setattr__(self, name, contribution_class(name, int(year))())
@@ -0,0 +1,111 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable
+
+from canatax.enums import ProvinceOrTerritory, TaxType
+from canatax.rates import tables
+from canatax.rates.income.base import BaseIncomeTaxRate, ProvincialIncomeTaxRate
+from canatax.rates.income.current_contributions import Contributions
+from canatax.rates.sales.base import BaseSalesTaxRate
+
+
+SUPPORTED_YEARS = tables.available_years()
+
+
+def _rates_year(year: int) -> int:
+    # Tax and sales rates for a year without a data file fall back to the latest year, as they always have;
+    # contributions for such a year raise NotImplementedError.
+    year = int(year)
+    return year if year in SUPPORTED_YEARS else SUPPORTED_YEARS[-1]
+
+
+def income_rate_class(province: ProvinceOrTerritory, year: int = 2025) -> type[ProvincialIncomeTaxRate]:
+    """Return the provincial income tax rate class for the province and year."""
+    return tables.income_rate_class(province, _rates_year(year))
+
+
+def federal_rate_class(year: int = 2025) -> type[BaseIncomeTaxRate]:
+    """Return the federal income tax rate class for the year."""
+    return tables.federal_rate_class(_rates_year(year))
+
+
+def sales_rate_class(province: ProvinceOrTerritory, year: int = 2025) -> type[BaseSalesTaxRate]:
+    """Return the sales tax rate class for the province and year."""
+    return tables.sales_rate_class(province, _rates_year(year))
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class RateRegistry:
+    """Process-wide cache of rate objects.
+
+    Each entry is resolved once and the same instance is handed to every caller afterwards. Rate
+    objects hold no per-call state, so sharing them between calculators and threads is safe.
+    Lookups of existing entries don't take a lock; hit and miss counts are best-effort under
+    concurrent use.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, Any] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _get(self, key: tuple, factory: Callable[[], Any]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            return entry
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = factory()
+                self._misses += 1
+            else:
+                self._hits += 1
+        return entry
+
+    def income_rate(self, province: ProvinceOrTerritory, year: int = 2025) -> ProvincialIncomeTaxRate:
+        year = int(year)
+        return self._get((TaxType.INCOME, province, year), lambda: income_rate_class(province, year)())
+
+    def federal_rate(self, year: int = 2025) -> BaseIncomeTaxRate:
+        year = int(year)
+        return self._get((TaxType.INCOME, None, year), lambda: federal_rate_class(year)())
+
+    def sales_rate(self, province: ProvinceOrTerritory, year: int = 2025) -> BaseSalesTaxRate:
+        year = int(year)
+        return self._get((TaxType.SALES, province, year), lambda: sales_rate_class(province, year)())
+
+    def contributions(self, year: int = 2025) -> Contributions:
+        year = int(year)
+        return self._get((Contributions, year), lambda: Contributions(year))
+
+    def preload(self, years: Iterable[int] = SUPPORTED_YEARS) -> None:
+        """Resolve every rate entry for `years` up front, e.g. when a worker starts."""
+        for year in years:
+            self.federal_rate(year)
+            self.contributions(year)
+            for province in ProvinceOrTerritory:
+                self.income_rate(province, year)
+                self.sales_rate(province, year)
+
+    def stats(self) -> RegistryStats:
+        return RegistryStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+rate_registry = RateRegistry()
+preload = rate_registry.preload
+stats = rate_registry.stats
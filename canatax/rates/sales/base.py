@@ -19,3 +19,16 @@ class BaseSalesTaxRate:
     def tax_types(self) -> list[Decimal]:
         return [Decimal(self.GST), Decimal(self.PST), Decimal(self.HST), Decimal(self.QST)]
 
+    @classmethod
+    def decimal_rates(cls) -> tuple[Decimal | None, Decimal | None, Decimal | None, Decimal | None]:
+        """Return GST, PST, HST and QST as exact Decimal fractions, or None for taxes that aren't charged.
+
+        The percentages are converted through their decimal representation, so 9.975 becomes exactly
+        `Decimal('0.09975')` rather than the binary float `9.975 / 100`. Computed once per class.
+        """
+        percents = (cls.GST, cls.PST, cls.HST, cls.QST)
+        rates = cls.__dict__.get("_decimal_rates")
+        if rates is None or rates[0] != percents:
+            rates = (percents, tuple(Decimal(str(percent)).scaleb(-2) if percent else None for percent in percents))
+            cls._decimal_rates = rates
+        return rates[1]
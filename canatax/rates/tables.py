@@ -0,0 +1,272 @@
+"""Declarative rate tables, one JSON file per tax year in `canatax/rates/data/`.
+
+A year's file holds its federal and provincial income tax brackets and basic personal amounts,
+province-specific credits, sales tax rates and CPP/QPP, EI and QPIP contributions. Each file is parsed
+once, on first use, into frozen tables, and the rate classes the calculators use are built from those
+tables and shared. Adding a year means adding `<year>.json`; no code changes.
+
+Numbers are read the way the original rate classes wrote them: JSON numbers stay Python ints and floats
+(bracket rates go through `percent_to_decimal` exactly as before), strings become exact Decimals, and
+`null` is an infinite bracket threshold or a sales tax that isn't charged.
+"""
+import json
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.base import BaseContribution, BaseIncomeTaxRate, PensionContribution, ProvincialIncomeTaxRate
+from canatax.rates.sales.base import BaseSalesTaxRate
+
+
+DATA = Path(__file__).with_name("data")
+
+INCOME_RATE_CLASS_NAMES = {
+    ProvinceOrTerritory.ALBERTA: 'AlbertaIncomeTaxRate',
+    ProvinceOrTerritory.BRITISH_COLUMBIA: 'BritishColumbiaIncomeTaxRate',
+    ProvinceOrTerritory.MANITOBA: 'ManitobaIncomeTaxRate',
+    ProvinceOrTerritory.ONTARIO: 'OntarioIncomeTaxRate',
+    ProvinceOrTerritory.NEW_BRUNSWICK: 'NewBrunswickIncomeTaxRate',
+    ProvinceOrTerritory.NEWFOUNDLAND: 'NewfoundlandIncomeTaxRate',
+    ProvinceOrTerritory.NORTHWEST_TERRITORIES: 'NorthwestTerritoriesIncomeTaxRate',
+    ProvinceOrTerritory.NOVA_SCOTIA: 'NovaScotiaIncomeTaxRate',
+    ProvinceOrTerritory.NUNAVUT: 'NunavutIncomeTaxRate',
+    ProvinceOrTerritory.PRINCE_EDWARD_ISLAND: 'PEIIncomeTaxRate',
+    ProvinceOrTerritory.QUEBEC: 'QuebecIncomeTaxRate',
+    ProvinceOrTerritory.SASKATCHEWAN: 'SaskatchewanIncomeTaxRate',
+    ProvinceOrTerritory.YUKON: 'YukonIncomeTaxRate',
+}
+
+SALES_RATE_CLASS_NAMES = {
+    ProvinceOrTerritory.ALBERTA: 'AlbertaSalesTaxRate',
+    ProvinceOrTerritory.BRITISH_COLUMBIA: 'BritishColumbiaSalesTaxRate',
+    ProvinceOrTerritory.MANITOBA: 'ManitobaSalesTaxRate',
+    ProvinceOrTerritory.ONTARIO: 'OntarioSalesTaxRate',
+    ProvinceOrTerritory.NEW_BRUNSWICK: 'NewBrunswickSalesTaxRate',
+    ProvinceOrTerritory.NEWFOUNDLAND: 'NewfoundlandSalesTaxRate',
+    ProvinceOrTerritory.NORTHWEST_TERRITORIES: 'NorthwestTerritoriesSalesTaxRate',
+    ProvinceOrTerritory.NOVA_SCOTIA: 'NovaScotiaSalesTaxRate',
+    ProvinceOrTerritory.NUNAVUT: 'NunavutSalesTaxRate',
+    ProvinceOrTerritory.PRINCE_EDWARD_ISLAND: 'PEISalesTaxRate',
+    ProvinceOrTerritory.QUEBEC: 'QuebecSalesTaxRate',
+    ProvinceOrTerritory.SASKATCHEWAN: 'SaskatchewanSalesTaxRate',
+    ProvinceOrTerritory.YUKON: 'YukonSalesTaxRate',
+}
+
+# Contribution name in the data file: (class name, base class)
+CONTRIBUTION_CLASSES = {
+    'cpp': ('CPP', PensionContribution),
+    'qpp': ('QPP', PensionContribution),
+    'ei': ('EI', BaseContribution),
+    'ei_quebec': ('EIQuebec', BaseContribution),
+    'qpip': ('QPIP', BaseContribution),
+}
+
+
+def _number(value: Any) -> Any:
+    return Decimal(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class BpaPhaseOut:
+    """A basic personal amount reduced linearly from `maximum` to `minimum` between two net incomes."""
+
+    maximum: Decimal
+    minimum: Decimal
+    phase_out_start: Decimal
+    phase_out_end: Decimal
+    quantum: Decimal | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseOutCredit:
+    """A province-specific credit of `amount` minus `reduction_rate` times net income, never below zero.
+
+    With `capped_at_income` the credit also can't exceed net income (Manitoba's family tax benefit).
+    """
+
+    name: str
+    amount: Decimal
+    reduction_rate: Decimal
+    capped_at_income: bool = False
+
+    def value(self, income: Decimal) -> Decimal:
+        credit = self.amount - (self.reduction_rate * income)
+        if self.capped_at_income:
+            credit = min(credit, income)
+        return max(credit, Decimal('0'))
+
+    def breakpoints(self) -> tuple[Decimal, ...]:
+        """Net incomes where the credit changes slope."""
+        if self.capped_at_income:
+            return (self.amount / (1 + self.reduction_rate), self.amount / self.reduction_rate)
+        return (self.amount / self.reduction_rate,)
+
+
+@dataclass(frozen=True, slots=True)
+class IncomeTable:
+    brackets: tuple[tuple[float | int, float | int], ...]
+    bpa: Decimal | BpaPhaseOut
+    credits: tuple[PhaseOutCredit, ...] = ()
+
+    @classmethod
+    def parse(cls, data: Mapping[str, Any]) -> "IncomeTable":
+        brackets = tuple((rate, float('inf') if threshold is None else threshold) for rate, threshold in data['brackets'])
+        bpa = data['bpa']
+        if isinstance(bpa, Mapping):
+            quantum = bpa.get('quantum')
+            bpa = BpaPhaseOut(
+                Decimal(bpa['max']), Decimal(bpa['min']), Decimal(bpa['phase_out_start']), Decimal(bpa['phase_out_end']),
+                Decimal(quantum) if quantum is not None else None,
+            )
+        else:
+            bpa = Decimal(bpa)
+        credits = tuple(
+            PhaseOutCredit(credit['name'], Decimal(credit['amount']), Decimal(credit['reduction_rate']), bool(credit.get('capped_at_income', False)))
+            for credit in data.get('credits', ())
+        )
+        return cls(brackets, bpa, credits)
+
+
+@dataclass(frozen=True, slots=True)
+class SalesTable:
+    gst: float | int | None
+    pst: float | int | None
+    hst: float | int | None
+    qst: float | int | None
+
+
+@dataclass(frozen=True, slots=True)
+class RateTables:
+    """Every rate for one tax year, as parsed from its data file."""
+
+    year: int
+    federal: IncomeTable
+    provinces: Mapping[ProvinceOrTerritory, IncomeTable]
+    sales: Mapping[ProvinceOrTerritory, SalesTable]
+    contributions: Mapping[str, Mapping[str, Any]]
+    sources: tuple[str, ...] = ()
+
+    @classmethod
+    def parse(cls, data: Mapping[str, Any]) -> "RateTables":
+        income = data['income']
+        return cls(
+            year=int(data['year']),
+            federal=IncomeTable.parse(income['federal']),
+            provinces=MappingProxyType({province: IncomeTable.parse(income[province.value]) for province in ProvinceOrTerritory}),
+            sales=MappingProxyType({
+                province: SalesTable(*(data['sales'][province.value].get(tax, 0) for tax in ('gst', 'pst', 'hst', 'qst')))
+                for province in ProvinceOrTerritory
+            }),
+            contributions=MappingProxyType({
+                name: MappingProxyType({key: _number(value) for key, value in data['contributions'][name].items()})
+                for name in CONTRIBUTION_CLASSES
+            }),
+            sources=tuple(data.get('sources', ())),
+        )
+
+
+@lru_cache(maxsize=None)
+def available_years() -> tuple[int, ...]:
+    """Return the years that have a data file, oldest first."""
+    return tuple(sorted(int(entry.name[:4]) for entry in DATA.iterdir() if re.fullmatch(r'\d{4}\.json', entry.name)))
+
+
+@lru_cache(maxsize=None)
+def load_tables(year: int) -> RateTables:
+    """Parse the data file for `year` once and return its shared tables.
+
+    Raises:
+        NotImplementedError: If there is no data file for `year`.
+    """
+    path = DATA / f'{year}.json'
+    if not path.is_file():
+        raise NotImplementedError(f"Rates for year {year} not implemented.")
+    tables = RateTables.parse(json.loads(path.read_text(encoding='utf-8')))
+    if tables.year != year:
+        raise ValueError(f"{path.name} declares year {tables.year}")
+    return tables
+
+
+def _phase_out_credits(self, income: Decimal) -> Decimal:
+    first, *rest = self._TAX_CREDITS
+    total = first.value(income)
+    for credit in rest:
+        total += credit.value(income)
+    return total
+
+
+def _income_rate_class(name: str, base: type[BaseIncomeTaxRate], table: IncomeTable, year: int) -> type[BaseIncomeTaxRate]:
+    attrs: dict[str, Any] = {
+        '__module__': __name__,
+        '__doc__': f"{year} rates, from `canatax/rates/data/{year}.json`.",
+        'brackets': list(table.brackets),
+        'year': year,
+    }
+    if isinstance(table.bpa, BpaPhaseOut):
+        attrs.update(
+            _BPA_MAX=table.bpa.maximum,
+            _BPA_MIN=table.bpa.minimum,
+            _BPA_PHASE_OUT_START=table.bpa.phase_out_start,
+            _BPA_PHASE_OUT_END=table.bpa.phase_out_end,
+        )
+        if table.bpa.quantum is not None:
+            attrs['_BPA_QUANTUM'] = table.bpa.quantum
+    else:
+        attrs['BPA'] = table.bpa
+    if table.credits:
+        attrs.update(
+            _TAX_CREDITS=table.credits,
+            province_specific_tax_credits=_phase_out_credits,
+            province_specific_tax_credit_breakpoints=tuple(sorted({p for credit in table.credits for p in credit.breakpoints()})),
+        )
+    return type(name, (base,), attrs)
+
+
+@lru_cache(maxsize=None)
+def federal_rate_class(year: int) -> type[BaseIncomeTaxRate]:
+    """Return the federal income tax rate class for `year`, built once from its data file."""
+    return _income_rate_class('FederalIncomeTaxRate', BaseIncomeTaxRate, load_tables(year).federal, year)
+
+
+@lru_cache(maxsize=None)
+def income_rate_class(province: ProvinceOrTerritory, year: int) -> type[ProvincialIncomeTaxRate]:
+    """Return the provincial income tax rate class for the province and `year`, built once from its data file."""
+    return _income_rate_class(INCOME_RATE_CLASS_NAMES[province], ProvincialIncomeTaxRate, load_tables(year).provinces[province], year)
+
+
+@lru_cache(maxsize=None)
+def sales_rate_class(province: ProvinceOrTerritory, year: int) -> type[BaseSalesTaxRate]:
+    """Return the sales tax rate class for the province and `year`, built once from its data file."""
+    table = load_tables(year).sales[province]
+    attrs = {'__module__': __name__, 'year': year, 'GST': table.gst, 'PST': table.pst, 'HST': table.hst, 'QST': table.qst}
+    return type(SALES_RATE_CLASS_NAMES[province], (BaseSalesTaxRate,), attrs)
+
+
+@lru_cache(maxsize=None)
+def contribution_class(name: str, year: int) -> type[BaseContribution]:
+    """Return the `cpp`, `qpp`, `ei`, `ei_quebec` or `qpip` contribution class for `year`."""
+    class_name, base = CONTRIBUTION_CLASSES[name]
+    attrs = {'__module__': __name__, 'year': year, **load_tables(year).contributions[name]}
+    return dataclass(frozen=True)(type(class_name, (base,), attrs))
+
+
+def income_rate_classes(year: int) -> dict[str, type[BaseIncomeTaxRate]]:
+    """Return {class name: class} for the federal and every provincial income tax rate of `year`."""
+    classes = {'FederalIncomeTaxRate': federal_rate_class(year)}
+    classes.update((INCOME_RATE_CLASS_NAMES[province], income_rate_class(province, year)) for province in ProvinceOrTerritory)
+    return classes
+
+
+def sales_rate_classes(year: int) -> dict[str, type[BaseSalesTaxRate]]:
+    """Return {class name: class} for every sales tax rate of `year`."""
+    return {SALES_RATE_CLASS_NAMES[province]: sales_rate_class(province, year) for province in ProvinceOrTerritory}
+
+
+def contribution_classes(year: int) -> dict[str, type[BaseContribution]]:
+    """Return {class name: class} for every contribution of `year`, e.g. `CPP` and `EIQuebec`."""
+    return {class_name: contribution_class(name, year) for name, (class_name, _) in CONTRIBUTION_CLASSES.items()}
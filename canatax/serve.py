@@ -0,0 +1,289 @@
+"""A local HTTP service for the tax calculators, built on the standard library only.
+
+Examples:
+    python -m canatax.serve --port 8000
+    python -m canatax.serve --port 8000 --workers 4 --year 2025 --engine int
+
+Endpoints (all JSON, estimates serialized like `python -m canatax`):
+    GET  /health          {"status": "ok"}
+    POST /income          One object with `IncomeTaxCalculator.calculate` arguments; returns one estimate.
+    POST /sales           One object with `amount`, `province` and optionally `year`; returns one estimate.
+    POST /income/batch    A JSON array of such objects, or JSONL with `Content-Type: application/x-ndjson`.
+    POST /sales/batch     Returns one estimate per line as JSONL, streamed with chunked transfer encoding.
+
+Connections are kept alive (HTTP/1.1). Invalid requests get a 400 with `{"error": ...}`; in a batch, an invalid
+row is answered with `{"row": index, "error": ...}` on its line so the rows before it are not lost. Rate tables
+and compiled plans for the server's year are loaded before the first request is accepted. With `--workers N`,
+N forked processes accept connections on the same listening socket.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from canatax.__main__ import INCOME_FIELDS, SALES_FIELDS, _serialize
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.enums import Engine, ProvinceOrTerritory
+from canatax.exc import CanataxError
+from canatax.rates.registry import SUPPORTED_YEARS, rate_registry
+from canatax.tax_estimate import BaseTaxEstimate
+
+
+STREAM_CHUNK_ROWS = 256
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
+
+def warm_up(year: int, engine: str | Engine = Engine.DECIMAL) -> None:
+    """Resolve the year's rates and compile every province's plans before serving."""
+    rate_registry.preload(years=(year,))
+    for province in ProvinceOrTerritory:
+        IncomeTaxCalculator.compile(province, year, engine)
+        SalesTaxCalculator.compile(province, year)
+
+
+def _arguments(row: Any, fields: tuple[str, ...]) -> dict[str, Any]:
+    if not isinstance(row, dict):
+        raise ValueError("Expected a JSON object")
+    unknown = set(row) - set(fields) - {"year"}
+    if unknown:
+        raise ValueError(f"Unexpected field(s): {', '.join(sorted(unknown))}")
+    return row
+
+
+class EstimateServer(ThreadingHTTPServer):
+    """`ThreadingHTTPServer` answering estimate requests for a default tax year and engine."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], year: int = 2025, engine: str | Engine = Engine.DECIMAL, access_log: bool = False):
+        self.year = int(year)
+        self.engine = Engine(engine)
+        self.access_log = access_log
+        super().__init__(address, EstimateRequestHandler)
+
+    def estimate(self, tax_type: str, row: Any) -> BaseTaxEstimate:
+        """Run one request row through the calculator for `tax_type` ("income" or "sales")."""
+        if tax_type == "income":
+            kwargs = {"year": self.year, "self_employment_income": 0, **_arguments(row, INCOME_FIELDS)}
+            # Income rates for a year without a data file raise NotImplementedError deep in the calculator
+            if int(kwargs["year"]) not in SUPPORTED_YEARS:
+                raise ValueError(f"No income tax rates for {kwargs['year']}; supported years are {', '.join(map(str, SUPPORTED_YEARS))}")
+            return IncomeTaxCalculator.calculate(**kwargs, engine=self.engine)
+        kwargs = _arguments(row, SALES_FIELDS)
+        return SalesTaxCalculator.calculate(**{"year": self.year, **kwargs}, engine=self.engine)
+
+
+class EstimateRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY each keep-alive response waits on a delayed ACK
+    disable_nagle_algorithm = True
+    server: EstimateServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: HTTPStatus, body: Any) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _read_body(self) -> bytes | None:
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+            return None
+        try:
+            size = int(length)
+        except ValueError:
+            size = -1
+        if size < 0:
+            # The body can't be found, so the connection can't be reused; reading -1 would block until the client closes
+            self.close_connection = True
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {length}")
+            return None
+        return self.rfile.read(size)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"No such endpoint: {self.path}")
+
+    def do_POST(self) -> None:
+        # Always drain the body so the connection can be reused, even for an unknown path
+        body = self._read_body()
+        if body is None:
+            return
+        tax_type, _, batch = self.path.strip("/").partition("/")
+        if tax_type not in ("income", "sales") or batch not in ("", "batch"):
+            self._send_error(HTTPStatus.NOT_FOUND, f"No such endpoint: {self.path}")
+            return
+        if batch:
+            self._batch(tax_type, body)
+            return
+        try:
+            estimate = self.server.estimate(tax_type, json.loads(body))
+        except ROW_ERRORS as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, _error_message(e))
+            return
+        self._send_json(HTTPStatus.OK, {key: _serialize(value) for key, value in estimate.to_dict().items()})
+
+    def _rows(self, body: bytes) -> list[Any]:
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type in NDJSON_TYPES:
+            return [line for line in body.splitlines() if line.strip()]
+        rows = json.loads(body)
+        if not isinstance(rows, list):
+            raise ValueError("Expected a JSON array of objects")
+        return rows
+
+    def _batch(self, tax_type: str, body: bytes) -> None:
+        try:
+            rows = self._rows(body)
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        lines = []
+        for line in _estimate_lines(self.server.estimate, tax_type, rows):
+            lines.append(line)
+            if len(lines) == STREAM_CHUNK_ROWS:
+                self._write_chunk(lines)
+                lines = []
+        if lines:
+            self._write_chunk(lines)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, lines: list[str]) -> None:
+        data = "".join(lines).encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+
+ROW_ERRORS = (CanataxError, ValueError, TypeError, NotImplementedError, ArithmeticError)
+"""Errors that fail one request or batch row rather than the connection."""
+
+
+def _error_message(error: Exception) -> str:
+    # Decimal signals stringify as a list of signal classes, which tells the client nothing
+    if isinstance(error, ArithmeticError):
+        return f"Number out of range ({type(error).__name__})"
+    return str(error)
+
+
+def _estimate_lines(estimate: Callable[[str, Any], BaseTaxEstimate], tax_type: str, rows: list[Any]) -> Iterator[str]:
+    """Yield one JSON line per row, with an error object in place of rows that can't be estimated.
+
+    Rows given as bytes are JSONL lines still to be decoded, so one malformed line only fails its own row.
+    """
+    for index, row in enumerate(rows):
+        try:
+            if isinstance(row, bytes):
+                row = json.loads(row)
+            result = {key: _serialize(value) for key, value in estimate(tax_type, row).to_dict().items()}
+        except ROW_ERRORS as e:
+            result = {"row": index, "error": _error_message(e)}
+        yield json.dumps(result) + "\n"
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    year: int = 2025,
+    engine: str | Engine = Engine.DECIMAL,
+    access_log: bool = False,
+    warm: bool = True,
+) -> EstimateServer:
+    """Bind an `EstimateServer` to `host`/`port` (0 picks a free port), warming it up unless `warm` is False.
+
+    Call `serve_forever()` on the result, e.g. in a thread in tests, and `shutdown()` to stop it.
+    """
+    if warm:
+        warm_up(year, engine)
+    return EstimateServer((host, port), year, engine, access_log)
+
+
+def _worker(server: EstimateServer) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def serve(server: EstimateServer, workers: int = 1) -> None:
+    """Serve until interrupted. With more than one worker, forked processes share the listening socket.
+
+    Raises:
+        ValueError: If `workers` is below 1, or above 1 on a platform without `fork`.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if workers == 1:
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+        return
+    # Workers are forked after warm-up, so each starts with the rate tables and plans already loaded
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_worker, args=(server,), daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            process.terminate()
+        server.server_close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m canatax.serve", description="Serve income and sales tax estimates over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on; 0 picks a free one (default 8000).")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes sharing the socket (default 1).")
+    parser.add_argument("--year", type=int, choices=SUPPORTED_YEARS, default=2025, help="Tax year for requests that don't give one (default 2025).")
+    parser.add_argument("--engine", choices=[e.value for e in Engine], default=Engine.DECIMAL.value, help="Arithmetic engine (default decimal).")
+    parser.add_argument("--access-log", action="store_true", help="Log every request to stderr.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        print("--workers above 1 needs os.fork(), which this platform lacks", file=sys.stderr)
+        return 2
+    server = make_server(args.host, args.port, args.year, args.engine, args.access_log)
+    host, port = server.server_address[:2]
+    # Stop cleanly (and take any workers down with us) when a supervisor sends SIGTERM
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"Serving tax estimates on http://{host}:{port} with {args.workers} worker(s), pid {os.getpid()}", file=sys.stderr, flush=True)
+    try:
+        serve(server, args.workers)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
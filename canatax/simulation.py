@@ -0,0 +1,583 @@
+"""Monte Carlo simulation of income tax over sampled or given income draws.
+
+Each draw goes through the same steps as `IncomeTaxPlan.row`: EI, CPP/QPP (self-employed parts included),
+QPIP, net and taxable income, federal and provincial brackets, BPA phase-outs, the CPP/QPP credit and
+provincial credits. The bracket, BPA and provincial credit schedules are the exact piecewise-linear
+functions `IncomeTaxCurve` uses, flattened to float segments, so a whole chunk of draws is evaluated with a
+handful of array operations when NumPy is installed. Without NumPy the same steps run per draw in plain
+Python, which is much slower but needs nothing extra.
+
+Amounts are unrounded floats, so a single draw can differ from `IncomeTaxCalculator.calculate` by the few
+cents `calculate` rounds away. Draws are processed `chunk_size` at a time and folded into running
+statistics and quantile sketches, so memory stays bounded unless `keep_draws=True` asks for every draw back.
+Samplers draw from one RNG seeded with `seed`: the same seed, chunk size and backend give the same draws.
+
+Example:
+    result = simulate(lognormal(62_000, 0.7), 0, "ON", draws=2_000_000, seed=7)
+    result["after_tax_income"].mean, result["total_tax"].quantiles[0.9]
+"""
+import math
+import random
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import cached_property, lru_cache
+from itertools import repeat
+from typing import Any, Callable, NamedTuple
+
+from canatax.calculators.base_calculator import BaseCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.calculators.tax_curve import PiecewiseLinear
+from canatax.enums import ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount
+from canatax.utils import is_column
+
+
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+DEFAULT_RELATIVE_ACCURACY = 0.0001
+"""Quantiles are within this fraction of the exact value (0.01% is $5 on $50,000)."""
+
+INPUT_FIELDS = ("employment_income", "self_employment_income", "rrsp_fhsa_contributions", "other_income")
+FIELDS = ("gross_income", "federal_tax", "provincial_tax", "cpp", "ei", "qpip", "qpp", "total_tax", "after_tax_income")
+"""The simulated amounts, in `IncomeTaxEstimate` field order."""
+
+_MIN_MAGNITUDE = 0.005
+"""Amounts under half a cent are counted as zero by the quantile sketches."""
+
+Sampler = Callable[[Any, int], Any]
+"""Called as `sampler(rng, size)` to draw `size` amounts, using the RNG's `lognormal`, `normal`, `uniform`
+or `integers` methods (NumPy `Generator` names; without NumPy a stand-in with the same methods is passed)."""
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class _PythonRandom:
+    """The few `numpy.random.Generator` methods samplers use, on `random.Random`, returning lists."""
+
+    def __init__(self, seed: int | None):
+        self._random = random.Random(seed)
+
+    def lognormal(self, mean: float, sigma: float, size: int) -> list[float]:
+        draw = self._random.lognormvariate
+        return [draw(mean, sigma) for _ in range(size)]
+
+    def normal(self, loc: float, scale: float, size: int) -> list[float]:
+        draw = self._random.gauss
+        return [draw(loc, scale) for _ in range(size)]
+
+    def uniform(self, low: float, high: float, size: int) -> list[float]:
+        draw = self._random.uniform
+        return [draw(low, high) for _ in range(size)]
+
+    def integers(self, low: int, high: int, size: int) -> list[int]:
+        draw = self._random.randrange
+        return [draw(low, high) for _ in range(size)]
+
+
+def lognormal(median: float | int | Decimal, sigma: float) -> Sampler:
+    """Sample amounts whose logarithm is normal, centred on `median`, e.g. employment income."""
+    mean = math.log(float(median))
+
+    def sample(rng: Any, size: int) -> Any:
+        return rng.lognormal(mean, sigma, size)
+    return sample
+
+
+def uniform(low: float | int | Decimal, high: float | int | Decimal) -> Sampler:
+    """Sample amounts evenly between `low` and `high`."""
+    low, high = float(low), float(high)
+
+    def sample(rng: Any, size: int) -> Any:
+        return rng.uniform(low, high, size)
+    return sample
+
+
+def empirical(values: Sequence[float | int | Decimal]) -> Sampler:
+    """Resample `values` with replacement, e.g. incomes from survey microdata."""
+    values = values.tolist() if hasattr(values, "tolist") else [float(value) for value in values]
+    if not values:
+        raise ValueError("Cannot resample an empty sequence")
+    np = _numpy()
+    pool = np.asarray(values, dtype=float) if np is not None else values
+
+    def sample(rng: Any, size: int) -> Any:
+        picks = rng.integers(0, len(values), size)
+        if isinstance(picks, list):
+            return [values[pick] for pick in picks]
+        return pool[picks]
+    return sample
+
+
+@dataclass(frozen=True)
+class _Segments:
+    """A `PiecewiseLinear` as float columns, for evaluation over many points."""
+
+    xs: tuple[float, ...]
+    ys: tuple[float, ...]
+    slopes: tuple[float, ...]
+
+    @classmethod
+    def from_function(cls, function: PiecewiseLinear) -> "_Segments":
+        return cls(tuple(map(float, function.xs)), tuple(map(float, function.ys)), tuple(map(float, function.slopes)))
+
+    @cached_property
+    def arrays(self) -> tuple[Any, Any, Any]:
+        np = _numpy()
+        return np.asarray(self.xs), np.asarray(self.ys), np.asarray(self.slopes)
+
+
+class _ScalarOps:
+    """Operations on one draw at a time."""
+
+    minimum = staticmethod(min)
+    maximum = staticmethod(max)
+
+    @staticmethod
+    def evaluate(segments: _Segments, x: float) -> float:
+        i = bisect_right(segments.xs, x) - 1
+        return segments.ys[i] + segments.slopes[i] * (x - segments.xs[i])
+
+
+class _ArrayOps:
+    """Operations on a NumPy array of draws."""
+
+    def __init__(self, np: Any):
+        self.minimum = np.minimum
+        self.maximum = np.maximum
+        self._searchsorted = np.searchsorted
+
+    def evaluate(self, segments: _Segments, x: Any) -> Any:
+        xs, ys, slopes = segments.arrays
+        i = self._searchsorted(xs, x, side="right") - 1
+        return ys[i] + slopes[i] * (x - xs[i])
+
+
+@dataclass(frozen=True)
+class _Kernel:
+    """An `IncomeTaxPlan`'s constants as floats, with its tax schedules as segments."""
+
+    ei_max_earnings: float
+    ei_rate: float
+    pension_max_earnings: float
+    pension_exemption: float
+    pension_additional_min: float
+    pension_additional_max: float
+    pension_first_rate: float
+    pension_second_rate: float
+    pension_base_rate_se: float
+    pension_first_additional_rate_se: float
+    pension_second_additional_rate_se: float
+    qpip_max_earnings: float | None
+    qpip_rate: float | None
+    federal_brackets: _Segments
+    provincial_brackets: _Segments
+    federal_bpa: _Segments
+    provincial_bpa: _Segments
+    federal_lowest_rate: float
+    provincial_lowest_rate: float
+    provincial_credits: _Segments
+
+    def estimate(self, ops: Any, employment: Any, self_employment: Any, rrsp_fhsa: Any, other: Any) -> tuple:
+        """Mirror `IncomeTaxPlan.row` without rounding, on floats or arrays; returns amounts in `FIELDS` order."""
+        minimum, maximum, evaluate = ops.minimum, ops.maximum, ops.evaluate
+        gross_income = employment + self_employment + other
+        ei = minimum(employment, self.ei_max_earnings) * self.ei_rate
+
+        base_first_income = maximum(minimum(employment, self.pension_max_earnings) - self.pension_exemption, 0.0)
+        second_income = maximum(minimum(employment, self.pension_additional_max) - self.pension_additional_min, 0.0)
+        total_income = employment + self_employment
+        se_base_first_income = maximum(minimum(total_income, self.pension_max_earnings) - self.pension_exemption, 0.0) - base_first_income
+        se_second_income = maximum(minimum(total_income, self.pension_additional_max) - self.pension_additional_min, 0.0) - second_income
+        se_base_contrib = se_base_first_income * self.pension_base_rate_se
+        se_additional_contrib = se_base_first_income * self.pension_first_additional_rate_se + se_second_income * self.pension_second_additional_rate_se
+        pension_total = base_first_income * self.pension_first_rate + second_income * self.pension_second_rate + se_base_contrib + se_additional_contrib
+        zero = gross_income * 0.0
+        if self.qpip_rate is None:
+            cpp, qpp, qpip = pension_total, zero, zero
+        else:
+            cpp, qpp = zero, pension_total
+            qpip = minimum(gross_income, self.qpip_max_earnings) * self.qpip_rate
+
+        cpp_qpp_nrtc_base = se_base_contrib * 0.5
+        net_income = maximum(gross_income - cpp_qpp_nrtc_base - se_additional_contrib, 0.0)
+        taxable_income = maximum(net_income - rrsp_fhsa, 0.0)
+
+        federal_tax = maximum(evaluate(self.federal_brackets, taxable_income) - evaluate(self.federal_bpa, net_income), 0.0)
+        federal_tax = maximum(federal_tax - cpp_qpp_nrtc_base * self.federal_lowest_rate, 0.0)
+        provincial_tax = maximum(evaluate(self.provincial_brackets, taxable_income) - evaluate(self.provincial_bpa, net_income), 0.0)
+        provincial_tax = maximum(provincial_tax - cpp_qpp_nrtc_base * self.provincial_lowest_rate, 0.0)
+
+        total_tax = federal_tax + provincial_tax + ei + cpp + qpip - evaluate(self.provincial_credits, net_income)
+        return gross_income, federal_tax, provincial_tax, cpp, ei, qpip, qpp, total_tax, net_income - total_tax
+
+
+@lru_cache(maxsize=None)
+def _kernel(province: ProvinceOrTerritory, year: int) -> _Kernel:
+    plan = IncomeTaxPlan.compile(province, year)
+    pension = plan.pension
+    return _Kernel(
+        ei_max_earnings=float(plan.ei_max_earnings),
+        ei_rate=float(plan.ei_rate),
+        pension_max_earnings=float(pension.max_earnings),
+        pension_exemption=float(pension.exemption),
+        pension_additional_min=float(pension.additional_min),
+        pension_additional_max=float(pension.additional_max),
+        pension_first_rate=float(pension.base_rate + pension.first_additional_rate),
+        pension_second_rate=float(pension.second_additional_rate),
+        pension_base_rate_se=float(pension.base_rate_se),
+        pension_first_additional_rate_se=float(pension.first_additional_rate_se),
+        pension_second_additional_rate_se=float(pension.second_additional_rate_se),
+        qpip_max_earnings=float(plan.qpip_max_earnings) if plan.qpip_max_earnings is not None else None,
+        qpip_rate=float(plan.qpip_rate) if plan.qpip_rate is not None else None,
+        federal_brackets=_Segments.from_function(PiecewiseLinear.from_bracket_table(plan.federal_brackets)),
+        provincial_brackets=_Segments.from_function(PiecewiseLinear.from_bracket_table(plan.provincial_brackets)),
+        federal_bpa=_Segments.from_function(PiecewiseLinear.from_bpa_credit(plan.federal_bpa)),
+        provincial_bpa=_Segments.from_function(PiecewiseLinear.from_bpa_credit(plan.provincial_bpa)),
+        federal_lowest_rate=float(plan.federal_bpa.lowest_rate),
+        provincial_lowest_rate=float(plan.provincial_bpa.lowest_rate),
+        provincial_credits=_Segments.from_function(PiecewiseLinear.from_provincial_credits(province, year, plan.provincial_credits)),
+    )
+
+
+def _validate(values: Any, np: Any) -> Any:
+    """Return a chunk of amounts as a float array (or list without NumPy), rejecting invalid ones."""
+    if np is not None:
+        try:
+            values = np.asarray(values, dtype=float)
+        except (TypeError, ValueError) as e:
+            raise InvalidDollarAmount(values) from e
+        invalid = ~(values >= 0) | np.isinf(values)
+        if invalid.any():
+            raise InvalidDollarAmount(values[invalid][0].item())
+        return values
+    floats = []
+    for value in values:
+        try:
+            amount = float(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidDollarAmount(value) from e
+        if not 0 <= amount < math.inf:
+            raise InvalidDollarAmount(value)
+        floats.append(amount)
+    return floats
+
+
+def simulate_chunks(
+    employment_income: Sampler | Sequence[float | int | Decimal] | float | int | Decimal,
+    self_employment_income: Sampler | Sequence[float | int | Decimal] | float | int | Decimal,
+    province: str | ProvinceOrTerritory,
+    year: int = 2025,
+    rrsp_fhsa_contributions: Sampler | Sequence[float | int | Decimal] | float | int | Decimal = 0,
+    other_income: Sampler | Sequence[float | int | Decimal] | float | int | Decimal = 0,
+    draws: int | None = None,
+    seed: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Yield the draws `chunk_size` at a time, as columns named after `INPUT_FIELDS` and `FIELDS`.
+
+    Each income is a sampler (see `lognormal`, `uniform` and `empirical`), a column of draws (a list, tuple or
+    NumPy array) or one amount for every draw. Columns are NumPy float arrays when NumPy is installed and
+    lists of floats otherwise.
+
+    Args:
+        draws (int | None): How many draws to make. Required unless a column of draws is given, whose length
+            it must then match.
+        seed (int | None): Seeds the RNG samplers draw from.
+        chunk_size (int): Draws evaluated at once.
+
+    Raises:
+        InvalidProvinceError: If the province or territory is not valid.
+        InvalidDollarAmount: If any given or sampled amount is invalid.
+        ValueError: If the draw count is missing or columns have different lengths.
+    """
+    kernel = _kernel(BaseCalculator._coerce_province(province), int(year))
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    inputs = dict(zip(INPUT_FIELDS, (employment_income, self_employment_income, rrsp_fhsa_contributions, other_income)))
+    for name, value in inputs.items():
+        if callable(value) or is_column(value):
+            continue
+        inputs[name] = _validate([value], None)[0]
+    for name, value in inputs.items():
+        if callable(value) or not is_column(value):
+            continue
+        if draws is None:
+            draws = len(value)
+        elif len(value) != draws:
+            raise ValueError(f"Column `{name}` has {len(value)} draws, expected {draws}")
+    if draws is None:
+        raise ValueError("Pass `draws` when every income is sampled or fixed")
+
+    np = _numpy()
+    rng = np.random.default_rng(seed) if np is not None else _PythonRandom(seed)
+    ops = _ArrayOps(np) if np is not None else _ScalarOps
+    for start in range(0, draws, chunk_size):
+        size = min(chunk_size, draws - start)
+        chunk = {}
+        for name, value in inputs.items():
+            if callable(value):
+                chunk[name] = _validate(value(rng, size), np)
+            elif is_column(value):
+                chunk[name] = _validate(value[start:start + size], np)
+            elif np is not None:
+                chunk[name] = np.full(size, value)
+            else:
+                chunk[name] = list(repeat(value, size))
+        if np is not None:
+            outputs = kernel.estimate(ops, *chunk.values())
+        else:
+            rows = [kernel.estimate(ops, *incomes) for incomes in zip(*chunk.values())]
+            outputs = [list(column) for column in zip(*rows)]
+        chunk.update(zip(FIELDS, outputs))
+        yield chunk
+
+
+class _QuantileSketch:
+    """Counts of amounts in logarithmic buckets, so any quantile is within a relative accuracy.
+
+    Bucket `i` holds magnitudes in `(gamma ** (i - 1), gamma ** i]`; negative amounts are bucketed by
+    magnitude separately, and amounts under half a cent are counted as zero. With NumPy the counts are
+    arrays starting at a key offset, grown as new keys appear; without it they are dicts.
+    """
+
+    def __init__(self, relative_accuracy: float):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._scale = 1 / math.log(self.gamma)
+        self.positive: dict[int, int] | tuple[int, Any] = {}
+        self.negative: dict[int, int] | tuple[int, Any] = {}
+        self.zero = 0
+
+    def add(self, values: Any, np: Any) -> None:
+        if np is None:
+            scale, log, ceil = self._scale, math.log, math.ceil
+            positive, negative = self.positive, self.negative
+            for value in values:
+                if value > _MIN_MAGNITUDE:
+                    key = ceil(log(value) * scale)
+                    positive[key] = positive.get(key, 0) + 1
+                elif value < -_MIN_MAGNITUDE:
+                    key = ceil(log(-value) * scale)
+                    negative[key] = negative.get(key, 0) + 1
+                else:
+                    self.zero += 1
+            return
+        positive = values[values > _MIN_MAGNITUDE]
+        negative = -values[values < -_MIN_MAGNITUDE]
+        self.zero += len(values) - len(positive) - len(negative)
+        self.positive = self._add_array(self.positive, positive, np)
+        self.negative = self._add_array(self.negative, negative, np)
+
+    def _add_array(self, buckets: dict | tuple[int, Any], magnitudes: Any, np: Any) -> dict | tuple[int, Any]:
+        if not len(magnitudes):
+            return buckets
+        keys = np.ceil(np.log(magnitudes) * self._scale).astype(np.int64)
+        low, high = int(keys.min()), int(keys.max())
+        if isinstance(buckets, dict):
+            return low, np.bincount(keys - low)
+        offset, counts = buckets
+        start, stop = min(offset, low), max(offset + len(counts), high + 1)
+        if (start, stop) != (offset, offset + len(counts)):
+            grown = np.zeros(stop - start, dtype=np.int64)
+            grown[offset - start:offset - start + len(counts)] = counts
+            offset, counts = start, grown
+        added = np.bincount(keys - low)
+        counts[low - offset:low - offset + len(added)] += added
+        return offset, counts
+
+    def _items(self, buckets: dict | tuple[int, Any]) -> list[tuple[int, int]]:
+        """Return `(key, count)` for every non-empty bucket, by ascending key."""
+        if isinstance(buckets, dict):
+            return sorted(buckets.items())
+        offset, counts = buckets
+        keys = counts.nonzero()[0]
+        return list(zip((keys + offset).tolist(), counts[keys].tolist()))
+
+    def quantiles(self, qs: Sequence[float], count: int) -> list[float]:
+        """Return each approximate `q` quantile, interpolating between ranks like `numpy.quantile`'s default."""
+        values, ends = [], []
+        seen = 0
+        for key, bucket_count in reversed(self._items(self.negative)):
+            values.append(-self._value(key))
+            seen += bucket_count
+            ends.append(seen)
+        values.append(0.0)
+        seen += self.zero
+        ends.append(seen)
+        for key, bucket_count in self._items(self.positive):
+            values.append(self._value(key))
+            seen += bucket_count
+            ends.append(seen)
+
+        def at(rank: int) -> float:
+            return values[bisect_right(ends, rank)]
+
+        results = []
+        for q in qs:
+            rank = q * (count - 1)
+            lower, upper = at(math.floor(rank)), at(math.ceil(rank))
+            results.append(lower + (upper - lower) * (rank - math.floor(rank)))
+        return results
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+
+class FieldSummary(NamedTuple):
+    """Statistics of one simulated amount over every draw."""
+
+    count: int
+    mean: float
+    std: float
+    """Population standard deviation."""
+    min: float
+    max: float
+    total: float
+    quantiles: dict[float, float]
+
+
+class _Accumulator:
+    """Running count, mean, sum of squared deviations, extremes and quantile sketch of one amount."""
+
+    def __init__(self, relative_accuracy: float):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = _QuantileSketch(relative_accuracy)
+
+    def add(self, values: Any, np: Any) -> None:
+        count = len(values)
+        if not count:
+            return
+        if np is not None:
+            total = float(values.sum())
+            mean = total / count
+            m2 = float(((values - mean) ** 2).sum())
+            low, high = float(values.min()), float(values.max())
+        else:
+            total = math.fsum(values)
+            mean = total / count
+            m2 = math.fsum((value - mean) ** 2 for value in values)
+            low, high = min(values), max(values)
+        # Chan et al.'s pairwise update keeps the variance accurate over millions of draws
+        combined = self.count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * count / combined
+        self.mean += delta * count / combined
+        self.count = combined
+        self.total += total
+        self.min, self.max = min(self.min, low), max(self.max, high)
+        self.sketch.add(values, np)
+
+    def summary(self, quantiles: Sequence[float]) -> FieldSummary:
+        if not self.count:
+            nan = math.nan
+            return FieldSummary(0, nan, nan, nan, nan, 0.0, {q: nan for q in quantiles})
+        # The sketch's bucket values are clamped to the exact extremes, which 0 and 1 report as they are
+        estimates = self.sketch.quantiles(quantiles, self.count)
+        values = {q: self.min if q == 0 else self.max if q == 1 else min(max(value, self.min), self.max) for q, value in zip(quantiles, estimates)}
+        return FieldSummary(self.count, self.mean, math.sqrt(self.m2 / self.count), self.min, self.max, self.total, values)
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Statistics of every simulated amount, from `simulate()`."""
+
+    province: ProvinceOrTerritory
+    year: int
+    count: int
+    seed: int | None
+    summaries: dict[str, FieldSummary]
+    """A `FieldSummary` per name in `FIELDS`."""
+    draws: dict[str, Any] | None = None
+    """Every draw's inputs and amounts, by `INPUT_FIELDS` and `FIELDS` name, if `keep_draws` was set."""
+
+    def __getitem__(self, field: str) -> FieldSummary:
+        return self.summaries[field]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summaries as plain dicts, e.g. to serve as JSON. Per-draw columns are left out."""
+        return {
+            "province": self.province.value,
+            "year": self.year,
+            "count": self.count,
+            "seed": self.seed,
+            "summaries": {
+                field: {**summary._asdict(), "quantiles": {str(q): value for q, value in summary.quantiles.items()}}
+                for field, summary in self.summaries.items()
+            },
+        }
+
+
+def simulate(
+    employment_income: Sampler | Sequence[float | int | Decimal] | float | int | Decimal,
+    self_employment_income: Sampler | Sequence[float | int | Decimal] | float | int | Decimal,
+    province: str | ProvinceOrTerritory,
+    year: int = 2025,
+    rrsp_fhsa_contributions: Sampler | Sequence[float | int | Decimal] | float | int | Decimal = 0,
+    other_income: Sampler | Sequence[float | int | Decimal] | float | int | Decimal = 0,
+    draws: int | None = None,
+    seed: int | None = None,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    keep_draws: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+) -> SimulationResult:
+    """Simulate income tax over many draws and summarise every amount.
+
+    Takes the same inputs as `simulate_chunks()`. Means, standard deviations, extremes and totals are exact
+    up to float rounding; quantiles come from bounded-size sketches and are within `relative_accuracy` of
+    the exact value, except 0 and 1, which are the exact extremes.
+
+    Args:
+        quantiles (Sequence[float]): Quantiles to report for every amount, each between 0 and 1.
+        keep_draws (bool): Also return every draw's columns in `SimulationResult.draws`. Memory then grows
+            with the number of draws.
+        relative_accuracy (float): Relative error allowed in the quantiles, between 0 and 1.
+
+    Raises:
+        InvalidProvinceError: If the province or territory is not valid.
+        InvalidDollarAmount: If any given or sampled amount is invalid.
+        ValueError: If the draw count is missing, columns have different lengths or a quantile or
+            `relative_accuracy` is out of range.
+    """
+    quantiles = tuple(float(q) for q in quantiles)
+    if any(not 0 <= q <= 1 for q in quantiles):
+        raise ValueError("Quantiles must be between 0 and 1")
+    if not 0 < relative_accuracy < 1:
+        raise ValueError("relative_accuracy must be between 0 and 1")
+    province = BaseCalculator._coerce_province(province)
+    np = _numpy()
+    accumulators = {field: _Accumulator(relative_accuracy) for field in FIELDS}
+    kept = {field: [] for field in INPUT_FIELDS + FIELDS} if keep_draws else None
+    chunks = simulate_chunks(
+        employment_income, self_employment_income, province, year, rrsp_fhsa_contributions, other_income, draws, seed, chunk_size
+    )
+    for chunk in chunks:
+        for field, accumulator in accumulators.items():
+            accumulator.add(chunk[field], np)
+        if kept is not None:
+            for field, values in chunk.items():
+                kept[field].append(values)
+    if kept is not None:
+        join = np.concatenate if np is not None else lambda parts: [value for part in parts for value in part]
+        kept = {field: join(parts) if parts else [] for field, parts in kept.items()}
+    count = accumulators[FIELDS[0]].count
+    return SimulationResult(
+        province=province,
+        year=int(year),
+        count=count,
+        seed=seed,
+        summaries={field: accumulator.summary(quantiles) for field, accumulator in accumulators.items()},
+        draws=kept,
+    )
@@ -1,32 +1,40 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from decimal import Decimal
-from typing import Any
-from canatax.enums import ProvinceOrTerritory
+from functools import cache
+from typing import Any, ClassVar, Iterable, Iterator, TypeVar
+from canatax.enums import ProvinceOrTerritory, RoundingPolicy
 from canatax.utils import to_currency
 
 
-@dataclass
+def _pretty(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return to_currency(value)
+    if isinstance(value, ProvinceOrTerritory):
+        return value.value
+    return value
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+@dataclass(frozen=True, slots=True)
 class BaseTaxEstimate:
 
     province: ProvinceOrTerritory
 
     def _prettify(self, d:dict[str, Any]) -> dict[str,Any]:
-        d2 = {}
-        for k, v in d.items():
-            if isinstance(v, Decimal):
-                d2[k] = to_currency(v)
-            elif isinstance(v, ProvinceOrTerritory):
-                d2[k] = v.value
-            else:
-                d2[k] = v
-        return d2
+        return {k: _pretty(v) for k, v in d.items()}
 
     def to_dict(self, prettify:bool=False) -> dict[str, Any]:
         """Convert the object's attributes to a dictionary representation.
 
+        Values are not copied: estimates are immutable and hold only `Decimal`s and enums.
+
         Args:
             prettify (bool): If True, applies formatting to the dictionary values.
-                            - Floats are formatted as currency strings.
+                            - Decimals are formatted as currency strings.
                             - `ProvinceOrTerritory` enum values are converted to their string representation.
                             Defaults to False.
 
@@ -34,13 +42,18 @@ class BaseTaxEstimate:
             dict[str, Any]: A dictionary containing the object's attributes.
                             If `prettify` is True, the dictionary values are formatted accordingly.
         """
-        d = asdict(self)
         if prettify:
-            d = self._prettify(d)
-        return d
+            return {name: _pretty(getattr(self, name)) for name in _field_names(type(self))}
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+    def to_tuple(self, prettify:bool=False) -> tuple:
+        """Return the object's attribute values in field order, formatted like `to_dict` if `prettify` is True."""
+        if prettify:
+            return tuple(_pretty(getattr(self, name)) for name in _field_names(type(self)))
+        return tuple(getattr(self, name) for name in _field_names(type(self)))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SalesTaxEstimate(BaseTaxEstimate):
 
     before_tax: Decimal
@@ -52,7 +65,26 @@ class SalesTaxEstimate(BaseTaxEstimate):
     after_tax: Decimal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class InvoiceEstimate:
+    """Sales tax for a whole invoice: a `SalesTaxEstimate` per line, in input order, and one for the invoice."""
+
+    province: ProvinceOrTerritory
+    rounding: RoundingPolicy
+    lines: tuple[SalesTaxEstimate, ...]
+    total: SalesTaxEstimate
+
+    def to_dict(self, prettify:bool=False) -> dict[str, Any]:
+        """Convert the invoice to nested dictionaries, formatting values like `BaseTaxEstimate.to_dict` if `prettify` is True."""
+        return {
+            "province": _pretty(self.province) if prettify else self.province,
+            "rounding": self.rounding.value if prettify else self.rounding,
+            "lines": [line.to_dict(prettify) for line in self.lines],
+            "total": self.total.to_dict(prettify),
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class IncomeTaxEstimate(BaseTaxEstimate):
 
     gross_income: Decimal
@@ -63,4 +95,176 @@ class IncomeTaxEstimate(BaseTaxEstimate):
     qpip: Decimal
     qpp: Decimal
     total_tax: Decimal
-    after_tax_income: Decimal
\ No newline at end of file
+    after_tax_income: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class PayrollEstimate(BaseTaxEstimate):
+    """Deductions from one pay cheque. Unlike `IncomeTaxEstimate`, QPP is included in `total_deductions`."""
+
+    gross_pay: Decimal
+    federal_tax: Decimal
+    provincial_tax: Decimal
+    cpp: Decimal
+    ei: Decimal
+    qpip: Decimal
+    qpp: Decimal
+    total_deductions: Decimal
+    net_pay: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class PayrollYearToDate:
+    """An employee's payroll totals so far this year, carried from one pay period to the next.
+
+    `pension` is the CPP or QPP base and first additional contributions, `pension_second` the second
+    additional (CPP2 or QPP2) contributions. Start each year from `PayrollYearToDate()`.
+    """
+
+    periods: int = 0
+    gross_pay: Decimal = Decimal(0)
+    insurable_earnings: Decimal = Decimal(0)
+    qpip_insurable_earnings: Decimal = Decimal(0)
+    pension: Decimal = Decimal(0)
+    pension_second: Decimal = Decimal(0)
+    ei: Decimal = Decimal(0)
+    qpip: Decimal = Decimal(0)
+    federal_tax: Decimal = Decimal(0)
+    provincial_tax: Decimal = Decimal(0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the totals keyed by field name, e.g. to store between pay runs; `PayrollYearToDate(**d)` restores them."""
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+
+ColumnsT = TypeVar("ColumnsT", bound="BaseEstimateColumns")
+
+
+class BaseEstimateColumns:
+    """Column-wise estimates: one list per estimate field, all of the same length."""
+
+    estimate_type: ClassVar[type[BaseTaxEstimate]]
+
+    def __len__(self) -> int:
+        return len(self.province)
+
+    def __getitem__(self, index: int) -> BaseTaxEstimate:
+        return self.estimate_type(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+
+    def __iter__(self) -> Iterator[BaseTaxEstimate]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Return the columns as a dictionary of lists, keyed by field name."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_rows(cls: type[ColumnsT], rows: list[tuple]) -> ColumnsT:
+        """Build columns from row tuples in estimate field order."""
+        columns = [list(column) for column in zip(*rows)] or [[] for _ in fields(cls)]
+        return cls(*columns)
+
+    @classmethod
+    def concat(cls: type[ColumnsT], parts: Iterable[ColumnsT]) -> ColumnsT:
+        """Join several column sets end to end."""
+        columns = {f.name: [] for f in fields(cls)}
+        for part in parts:
+            for name, column in columns.items():
+                column.extend(getattr(part, name))
+        return cls(**columns)
+
+
+@dataclass
+class SalesTaxEstimateColumns(BaseEstimateColumns):
+    """Column-wise results of `SalesTaxCalculator.calculate_many`, one list per `SalesTaxEstimate` field."""
+
+    estimate_type: ClassVar[type[BaseTaxEstimate]] = SalesTaxEstimate
+
+    province: list[ProvinceOrTerritory]
+    before_tax: list[Decimal]
+    gst: list[Decimal]
+    pst: list[Decimal]
+    hst: list[Decimal]
+    qst: list[Decimal]
+    tax_total: list[Decimal]
+    after_tax: list[Decimal]
+
+
+@dataclass
+class IncomeTaxEstimateColumns(BaseEstimateColumns):
+    """Column-wise results of `IncomeTaxCalculator.calculate_many`, one list per `IncomeTaxEstimate` field."""
+
+    estimate_type: ClassVar[type[BaseTaxEstimate]] = IncomeTaxEstimate
+
+    province: list[ProvinceOrTerritory]
+    gross_income: list[Decimal]
+    federal_tax: list[Decimal]
+    provincial_tax: list[Decimal]
+    cpp: list[Decimal]
+    ei: list[Decimal]
+    qpip: list[Decimal]
+    qpp: list[Decimal]
+    total_tax: list[Decimal]
+    after_tax_income: list[Decimal]
+
+
+@dataclass
+class PayrollEstimateColumns(BaseEstimateColumns):
+    """Column-wise results of `PayrollCalculator.calculate_many`, one list per `PayrollEstimate` field."""
+
+    estimate_type: ClassVar[type[BaseTaxEstimate]] = PayrollEstimate
+
+    province: list[ProvinceOrTerritory]
+    gross_pay: list[Decimal]
+    federal_tax: list[Decimal]
+    provincial_tax: list[Decimal]
+    cpp: list[Decimal]
+    ei: list[Decimal]
+    qpip: list[Decimal]
+    qpp: list[Decimal]
+    total_deductions: list[Decimal]
+    net_pay: list[Decimal]
+
+
+@dataclass(frozen=True)
+class IncomeTaxMatrix:
+    """Estimates for the same income profiles in several provinces: one `IncomeTaxEstimateColumns` per province.
+
+    Row `i` of every province's columns is profile `i`, so `matrix.field("after_tax_income")` is a
+    province × profile table.
+    """
+
+    provinces: tuple[ProvinceOrTerritory, ...]
+    rows: tuple[IncomeTaxEstimateColumns, ...]
+
+    def __len__(self) -> int:
+        """The number of profiles."""
+        return len(self.rows[0]) if self.rows else 0
+
+    def __getitem__(self, key: tuple[ProvinceOrTerritory | str, int]) -> IncomeTaxEstimate:
+        """`matrix[province, profile_index]` is one estimate."""
+        province, index = key
+        return self.for_province(province)[index]
+
+    def for_province(self, province: ProvinceOrTerritory | str) -> IncomeTaxEstimateColumns:
+        """Return every profile's estimate in `province`.
+
+        Raises:
+            InvalidProvinceError: If the province or territory is not valid.
+            KeyError: If the province is not in the matrix.
+        """
+        from canatax.calculators.base_calculator import BaseCalculator
+        province = BaseCalculator._coerce_province(province)
+        for candidate, columns in zip(self.provinces, self.rows):
+            if candidate == province:
+                return columns
+        raise KeyError(province)
+
+    def field(self, name: str) -> list[list[Any]]:
+        """Return one estimate field as a list per province (in `provinces` order) of one value per profile."""
+        return [getattr(columns, name) for columns in self.rows]
+
+    def to_dict(self) -> dict[str, dict[str, list[Any]]]:
+        """Return the columns of each province keyed by its two-letter code."""
+        return {province.value: columns.to_dict() for province, columns in zip(self.provinces, self.rows)}
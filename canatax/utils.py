@@ -1,4 +1,5 @@
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Any
 
 
 def to_currency(n:float|Decimal) -> str:
@@ -11,3 +12,51 @@ def percent_to_decimal(n:float|Decimal) -> Decimal:
 
 def decimal_round(n: float | int | Decimal):
     return Decimal(n).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def canonical_amount(n: Decimal) -> Decimal:
+    """Return `n` with two decimal places if it is a whole number of cents, otherwise without trailing zeros.
+
+    The value is unchanged; only the representation is fixed, so engines that reach the same amount by
+    different arithmetic print it the same way.
+    """
+    cents = n.quantize(Decimal("0.01"))
+    return cents if cents == n else n.normalize()
+
+
+def is_column(value: Any) -> bool:
+    """Return True if `value` is a column of values (a sequence or NumPy array) rather than a scalar."""
+    if isinstance(value, (str, bytes)):
+        return False
+    return hasattr(value, "__len__") and hasattr(value, "__iter__")
+
+
+def to_columns(**values: Any) -> tuple[int, dict[str, list]]:
+    """Broadcast a mix of scalars and columns into equal-length lists.
+
+    NumPy arrays are accepted without importing NumPy: anything exposing `tolist()` is converted
+    to a list of native Python scalars first, so `Decimal()` accepts each element.
+
+    Returns:
+        tuple[int, dict[str, list]]: The row count and a list per keyword argument.
+
+    Raises:
+        ValueError: If the columns passed have different lengths.
+    """
+    length = None
+    columns = {}
+    for name, value in values.items():
+        if not is_column(value):
+            continue
+        column = value.tolist() if hasattr(value, "tolist") else list(value)
+        if length is None:
+            length = len(column)
+        elif len(column) != length:
+            raise ValueError(f"Column `{name}` has {len(column)} rows, expected {length}")
+        columns[name] = column
+    if length is None:
+        length = 1
+    for name, value in values.items():
+        if name not in columns:
+            columns[name] = [value] * length
+    return length, {name: columns[name] for name in values}
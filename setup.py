@@ -10,8 +10,9 @@ setup(
     author_email='firstflush@protonmail.com',
     url='https://github.com/firstflush/canatax',
     license='MIT',
-    packages=find_packages(exclude=["tests*", "*.tests"]),
+    packages=find_packages(exclude=["tests*", "*.tests", "benchmarks*"]),
     include_package_data=True,
+    package_data={'canatax.rates': ['data/*.json']},
     install_requires=[],
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,90 @@
+from decimal import Decimal
+import unittest
+
+from canatax import InvalidDollarAmount, InvalidProvinceError
+from canatax.calculators import IncomeTaxCalculator
+from canatax.calculators.contribution_optimizer import ContributionAdvice, SavingsCurve
+
+
+PROFILES = [(120000, 0, "ON"), (45000, 20000, "QC"), (300000, 0, "BC"), (62000.5, 8000, "NS")]
+
+
+class TestSavingsCurve(unittest.TestCase):
+
+    def test_matches_calculate(self):
+        for employment, self_employment, province in PROFILES:
+            curve = IncomeTaxCalculator.rrsp_fhsa_savings_curve(employment, self_employment, province, other_income=1200)
+            self.assertIsInstance(curve, SavingsCurve)
+            baseline = IncomeTaxCalculator.calculate(employment, self_employment, province, other_income=1200).total_tax
+            contributions = [0, 1000, 7777.77, 25000, 60000, 500000]
+            for contribution, saved in zip(contributions, curve.evaluate(contributions)):
+                with self.subTest(province=province, contribution=contribution):
+                    estimate = IncomeTaxCalculator.calculate(employment, self_employment, province, 2025, contribution, 1200)
+                    self.assertAlmostEqual(saved, baseline - estimate.total_tax, delta=Decimal("0.05"))
+
+    def test_breakpoints_are_bracket_thresholds_below_net_income(self):
+        curve = IncomeTaxCalculator.rrsp_fhsa_savings_curve(120000, 0, "AB")
+        net = curve.net_income
+        # 2025 federal thresholds 57375 and 114750; Alberta's first, 151234, is above net income
+        for threshold in (57375, 114750):
+            self.assertIn(net - threshold, curve.breakpoints)
+        self.assertTrue(all(0 < point < net for point in curve.breakpoints))
+        self.assertEqual(len(curve.marginal_rates), len(curve.breakpoints) + 1)
+        self.assertEqual(curve.marginal_rates[-1], 0)
+        self.assertEqual(list(curve.marginal_rates), sorted(curve.marginal_rates, reverse=True))
+
+    def test_no_income(self):
+        curve = IncomeTaxCalculator.rrsp_fhsa_savings_curve(0, 0, "MB")
+        self.assertEqual(curve.breakpoints, ())
+        self.assertEqual(curve.evaluate([1000]), [0])
+
+
+class TestOptimizeRrspFhsa(unittest.TestCase):
+
+    def test_cap_and_min_rate(self):
+        capped = IncomeTaxCalculator.optimize_rrsp_fhsa(120000, 0, "ON", cap=31560)
+        self.assertIsInstance(capped, ContributionAdvice)
+        self.assertEqual(capped.contribution, Decimal("31560.00"))
+        estimate = IncomeTaxCalculator.calculate(120000, 0, "ON", rrsp_fhsa_contributions=31560)
+        self.assertEqual(capped.total_tax, estimate.total_tax)
+        self.assertEqual(capped.after_tax_income, estimate.after_tax_income)
+        self.assertEqual(capped.tax_saved, IncomeTaxCalculator.calculate(120000, 0, "ON").total_tax - estimate.total_tax)
+
+        curve = IncomeTaxCalculator.rrsp_fhsa_savings_curve(120000, 0, "ON")
+        advice = IncomeTaxCalculator.optimize_rrsp_fhsa(120000, 0, "ON", min_rate=0.3)
+        # Stops at the first breakpoint past which a dollar saves less than 30 cents
+        index = next(i for i, rate in enumerate(curve.marginal_rates) if rate < Decimal("0.3"))
+        self.assertEqual(advice.contribution, curve.breakpoints[index - 1].quantize(Decimal("0.01")))
+        self.assertGreaterEqual(advice.marginal_rate, Decimal("0.3"))
+
+    def test_unlimited_contribution_stops_where_tax_is_gone(self):
+        advice = IncomeTaxCalculator.optimize_rrsp_fhsa(80000, 0, "SK")
+        self.assertLess(advice.contribution, IncomeTaxCalculator.rrsp_fhsa_savings_curve(80000, 0, "SK").net_income)
+        more = IncomeTaxCalculator.calculate(80000, 0, "SK", rrsp_fhsa_contributions=advice.contribution + 1000)
+        self.assertEqual(more.total_tax, advice.total_tax)
+
+    def test_nothing_to_save(self):
+        advice = IncomeTaxCalculator.optimize_rrsp_fhsa(0, 0, "AB", cap=5000)
+        self.assertEqual((advice.contribution, advice.tax_saved, advice.marginal_rate), (0, 0, 0))
+
+    def test_many_matches_single(self):
+        employment = [30000, 95000, 180000]
+        caps = [None, 10000, 31560]
+        results = IncomeTaxCalculator.optimize_rrsp_fhsa_many(employment, 0, ["ON", "qc", "BC"], cap=caps, min_rate=0.25)
+        expected = [
+            IncomeTaxCalculator.optimize_rrsp_fhsa(income, 0, province, cap=cap, min_rate=0.25)
+            for income, province, cap in zip(employment, ["ON", "QC", "BC"], caps)
+        ]
+        self.assertEqual(results, expected)
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidProvinceError):
+            IncomeTaxCalculator.optimize_rrsp_fhsa(50000, 0, "ZZ")
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.optimize_rrsp_fhsa(-1, 0, "ON")
+        with self.assertRaises(ValueError):
+            IncomeTaxCalculator.optimize_rrsp_fhsa_many([50000, 60000], [0, 0, 0], "ON")
+
+
+if __name__ == '__main__':
+    unittest.main()
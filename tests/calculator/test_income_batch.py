@@ -0,0 +1,52 @@
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+from canatax.tax_estimate import IncomeTaxEstimate, IncomeTaxEstimateColumns
+
+
+class TestIncomeCalculateMany(unittest.TestCase):
+
+    def test_matches_calculate(self):
+        employment = [0, 45000, 80000.55, 250000, 30000]
+        self_employment = [0, 10000, 0, 50000, 90000]
+        provinces = ["BC", ProvinceOrTerritory.QUEBEC, "mb", "ON", "QC"]
+        for year in (2024, 2025):
+            with self.subTest(year=year):
+                columns = IncomeTaxCalculator.calculate_many(
+                    employment_income=employment,
+                    self_employment_income=self_employment,
+                    province=provinces,
+                    year=year,
+                    rrsp_fhsa_contributions=5000,
+                )
+                self.assertIsInstance(columns, IncomeTaxEstimateColumns)
+                self.assertEqual(len(columns), len(employment))
+                for i, estimate in enumerate(columns):
+                    expected = IncomeTaxCalculator.calculate(employment[i], self_employment[i], provinces[i], year=year, rrsp_fhsa_contributions=5000)
+                    self.assertIsInstance(estimate, IncomeTaxEstimate)
+                    self.assertEqual(estimate, expected)
+
+    def test_scalar_broadcast(self):
+        columns = IncomeTaxCalculator.calculate_many(employment_income=(50000, 60000), self_employment_income=0, province="AB")
+        self.assertEqual(columns.province, [ProvinceOrTerritory.ALBERTA] * 2)
+        self.assertEqual(set(columns.to_dict()), {"province", "gross_income", "federal_tax", "provincial_tax", "cpp", "ei", "qpip", "qpp", "total_tax", "after_tax_income"})
+
+    def test_empty(self):
+        columns = IncomeTaxCalculator.calculate_many(employment_income=[], self_employment_income=[], province="AB")
+        self.assertEqual(len(columns), 0)
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            IncomeTaxCalculator.calculate_many(employment_income=[1, 2], self_employment_income=[1, 2, 3], province="AB")
+
+    def test_invalid_values(self):
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.calculate_many(employment_income=[1, -2], self_employment_income=0, province="AB")
+        with self.assertRaises(InvalidProvinceError):
+            IncomeTaxCalculator.calculate_many(employment_income=[1, 2], self_employment_income=0, province=["AB", "ZZ"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+from dataclasses import FrozenInstanceError
+import unittest
+
+from canatax import InvalidDollarAmount, InvalidProvinceError
+from canatax.calculators import IncomeTaxCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.enums import ProvinceOrTerritory
+from canatax.tax_estimate import IncomeTaxMatrix
+
+
+EMPLOYMENT = [0, 18000.5, 55000, 98000, 260000]
+SELF_EMPLOYMENT = [0, 12000, 0, 40000, 5000]
+RRSP = [0, 0, 3000, 10000, 31560]
+
+
+class TestCompareProvinces(unittest.TestCase):
+
+    def test_matches_calculate_everywhere(self):
+        for year in (2024, 2025):
+            matrix = IncomeTaxCalculator.compare_provinces(EMPLOYMENT, SELF_EMPLOYMENT, year, RRSP, other_income=1500)
+            self.assertEqual(matrix.provinces, tuple(ProvinceOrTerritory))
+            self.assertEqual(len(matrix), len(EMPLOYMENT))
+            for province in ProvinceOrTerritory:
+                for index, incomes in enumerate(zip(EMPLOYMENT, SELF_EMPLOYMENT, RRSP)):
+                    with self.subTest(year=year, province=province, index=index):
+                        expected = IncomeTaxCalculator.calculate(incomes[0], incomes[1], province, year, incomes[2], 1500)
+                        self.assertEqual(matrix[province, index], expected)
+
+    def test_single_profile_and_subset(self):
+        matrix = IncomeTaxCalculator.compare_provinces(85000, provinces=["qc", "AB", ProvinceOrTerritory.ALBERTA])
+        self.assertIsInstance(matrix, IncomeTaxMatrix)
+        self.assertEqual(matrix.provinces, (ProvinceOrTerritory.QUEBEC, ProvinceOrTerritory.ALBERTA))
+        after_tax = matrix.field("after_tax_income")
+        self.assertEqual(after_tax, [
+            [IncomeTaxCalculator.calculate(85000, 0, "QC").after_tax_income],
+            [IncomeTaxCalculator.calculate(85000, 0, "AB").after_tax_income],
+        ])
+        self.assertEqual(set(matrix.to_dict()), {"QC", "AB"})
+        self.assertEqual(matrix.for_province("AB"), matrix.for_province(ProvinceOrTerritory.ALBERTA))
+        self.assertEqual(matrix["qc", 0], matrix[ProvinceOrTerritory.QUEBEC, 0])
+        self.assertIs(matrix.for_province("ab"), matrix.for_province("AB"))
+        with self.assertRaises(KeyError):
+            matrix.for_province("ON")
+        with self.assertRaises(InvalidProvinceError):
+            matrix.for_province("ZZ")
+        with self.assertRaises(FrozenInstanceError):
+            matrix.provinces = ()
+
+    def test_single_province(self):
+        for province in ("on", ProvinceOrTerritory.ONTARIO):
+            with self.subTest(province=province):
+                matrix = IncomeTaxCalculator.compare_provinces([60000, 90000], provinces=province)
+                self.assertEqual(matrix.provinces, (ProvinceOrTerritory.ONTARIO,))
+                self.assertEqual(list(matrix.for_province("ON")), list(IncomeTaxCalculator.calculate_many([60000, 90000], 0, "ON")))
+
+    def test_federal_part_is_shared(self):
+        ontario = IncomeTaxPlan.compile("ON", 2025)
+        self.assertEqual(ontario.shared_key, IncomeTaxPlan.compile("NU", 2025).shared_key)
+        self.assertNotEqual(ontario.shared_key, IncomeTaxPlan.compile("QC", 2025).shared_key)
+        part = ontario.federal_part(70000, 10000)
+        self.assertEqual(IncomeTaxPlan.compile("NU", 2025).provincial_row(part), IncomeTaxPlan.compile("NU", 2025).row(70000, 10000))
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidProvinceError):
+            IncomeTaxCalculator.compare_provinces(50000, provinces=["ON", "ZZ"])
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.compare_provinces([50000, -1])
+        with self.assertRaises(ValueError):
+            IncomeTaxCalculator.compare_provinces([50000, 60000], [0, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+from dataclasses import FrozenInstanceError
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.enums import ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+
+
+PROFILES = [
+    (employment, self_employment, rrsp_fhsa, other)
+    for employment in (0, 0.004, 15000, 52886.49, 71300, 81200.5, 125000, 198000, 260000, 1250000)
+    for self_employment in (0, 2500.25, 77000)
+    for rrsp_fhsa, other in ((0, 0), (8000, 1200.75))
+]
+
+
+class TestIncomeTaxPlan(unittest.TestCase):
+
+    def test_matches_calculate(self):
+        for year in (2024, 2025):
+            for province in ProvinceOrTerritory:
+                plan = IncomeTaxCalculator.compile(province, year)
+                with self.subTest(province=province, year=year):
+                    for employment, self_employment, rrsp_fhsa, other in PROFILES:
+                        expected = IncomeTaxCalculator.calculate(employment, self_employment, province, year, rrsp_fhsa, other)
+                        self.assertEqual(plan(employment, self_employment, rrsp_fhsa, other), expected)
+
+    def test_plans_are_shared_and_immutable(self):
+        plan = IncomeTaxCalculator.compile("on", 2025)
+        self.assertIsInstance(plan, IncomeTaxPlan)
+        self.assertIs(plan, IncomeTaxCalculator.compile(ProvinceOrTerritory.ONTARIO, "2025"))
+        with self.assertRaises(FrozenInstanceError):
+            plan.ei_rate = 0
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidProvinceError):
+            IncomeTaxCalculator.compile("ZZ")
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.compile("ON")(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+from decimal import Decimal
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.calculators.int_engine import IntIncomeTaxPlan, to_cents
+from canatax.enums import Engine, ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+from canatax.utils import decimal_round
+
+
+YEARS = (2024, 2025)
+
+
+def income_sweep(plan):
+    """Incomes across the whole range, plus a cent either side of every bracket, cap and phase-out bound."""
+    incomes = [Decimal(n) + Decimal('0.37') for n in range(0, 600_000, 3_331)]
+    incomes += [Decimal('0.005'), Decimal('0.004999'), Decimal(1_250_000), Decimal('95439534942239.55')]
+    edges = list(plan.federal_brackets.thresholds) + list(plan.provincial_brackets.thresholds)
+    edges += [plan.pension.max_earnings, plan.pension.additional_max, plan.ei_max_earnings]
+    edges += [plan.federal_bpa.phase_out_start, plan.federal_bpa.phase_out_end, plan.provincial_bpa.phase_out_start, plan.provincial_bpa.phase_out_end]
+    for edge in edges:
+        if edge is not None and edge.is_finite():
+            incomes += [edge - Decimal('0.01'), edge, edge + Decimal('0.01')]
+    return incomes
+
+
+class TestIntEngine(unittest.TestCase):
+
+    def test_income_matches_decimal_engine(self):
+        mixes = [(0, 0, 0), (12_345.67, 0, 0), (0, 6_000, 1_000.5), (95_000.11, 3_500.5, 250)]
+        for year in YEARS:
+            for province in ProvinceOrTerritory:
+                decimal_plan = IncomeTaxCalculator.compile(province, year)
+                int_plan = IncomeTaxCalculator.compile(province, year, engine="int")
+                self.assertIsInstance(int_plan, IntIncomeTaxPlan)
+                with self.subTest(province=province, year=year):
+                    for income in income_sweep(decimal_plan):
+                        for self_employment, rrsp_fhsa, other in mixes:
+                            self.assertEqual(int_plan(income, self_employment, rrsp_fhsa, other), decimal_plan(income, self_employment, rrsp_fhsa, other))
+                            self.assertEqual(int_plan(self_employment, income, rrsp_fhsa, other), decimal_plan(self_employment, income, rrsp_fhsa, other))
+
+    def test_same_representation_as_decimal_engine(self):
+        # assertEqual compares Decimals by value; serialized estimates must also print the same
+        mixes = [(0, 0, 0), (0, 6_000, 1_000.5), (95_000.11, 3_500.57, 250)]
+        for year in YEARS:
+            for province in ProvinceOrTerritory:
+                decimal_plan = IncomeTaxCalculator.compile(province, year)
+                int_plan = IncomeTaxCalculator.compile(province, year, engine="int")
+                with self.subTest(province=province, year=year):
+                    for income in income_sweep(decimal_plan)[::7]:
+                        for self_employment, rrsp_fhsa, other in mixes:
+                            expected = decimal_plan(income, self_employment, rrsp_fhsa, other).to_dict()
+                            actual = int_plan(income, self_employment, rrsp_fhsa, other).to_dict()
+                            self.assertEqual({key: str(value) for key, value in actual.items()}, {key: str(value) for key, value in expected.items()})
+        estimate = IncomeTaxCalculator.calculate(60_000, 0, "ON", engine="int")
+        self.assertEqual((str(estimate.qpp), str(estimate.after_tax_income)), ("0", str(IncomeTaxCalculator.calculate(60_000, 0, "ON").after_tax_income)))
+        self.assertEqual(estimate.after_tax_income.as_tuple().exponent, -2)
+        for amount in (0, 19.99, 25.54385753, 100):
+            self.assertEqual(str(SalesTaxCalculator.calculate(amount, "QC", engine="int").to_dict()), str(SalesTaxCalculator.calculate(amount, "QC").to_dict()))
+
+    def test_calculate_engine_switch(self):
+        for year in YEARS:
+            for province in ProvinceOrTerritory:
+                with self.subTest(province=province, year=year):
+                    self.assertEqual(
+                        IncomeTaxCalculator.calculate(85_000.25, 12_000, province, year, 4_000, 300, engine="int"),
+                        IncomeTaxCalculator.calculate(85_000.25, 12_000, province, year, 4_000, 300),
+                    )
+        columns = IncomeTaxCalculator.calculate_many([1_000, 90_000], 0, ["QC", "MB"], engine=Engine.INT)
+        self.assertEqual(list(columns), list(IncomeTaxCalculator.calculate_many([1_000, 90_000], 0, ["QC", "MB"])))
+
+    def test_sales_matches_decimal_engine(self):
+        amounts = [0, 0.01, 0.1, 1, 19.99, 25.54385753, 100, 333.33, 1_000_000, 95385923235223]
+        amounts += [Decimal(n) / 100 for n in range(0, 100_000, 53)]
+        for year in YEARS:
+            for province in ProvinceOrTerritory:
+                with self.subTest(province=province, year=year):
+                    for amount in amounts:
+                        self.assertEqual(SalesTaxCalculator.calculate(amount, province, year, engine="int"), SalesTaxCalculator.calculate(amount, province, year))
+
+    def test_to_cents(self):
+        for amount in [0, 1, 0.005, 0.015, 2.675, 1e-9, Decimal('0.125'), Decimal('3.14159'), '12.345', True]:
+            with self.subTest(amount=amount):
+                self.assertEqual(Decimal(to_cents(amount)) / 100, decimal_round(Decimal(amount)))
+
+    def test_invalid_input(self):
+        for amount in [-1, -0.5, None, 'asdf', float('inf'), float('nan')]:
+            with self.subTest(amount=amount):
+                with self.assertRaises(InvalidDollarAmount):
+                    IncomeTaxCalculator.calculate(amount, 0, "ON", engine="int")
+                with self.assertRaises(InvalidDollarAmount):
+                    SalesTaxCalculator.calculate(amount, "ON", engine="int")
+        with self.assertRaises(InvalidProvinceError):
+            IncomeTaxCalculator.calculate(1, 0, "ZZ", engine="int")
+        with self.assertRaises(ValueError):
+            IncomeTaxCalculator.calculate(1, 0, "ON", engine="float")
+
+
+if __name__ == '__main__':
+    unittest.main()
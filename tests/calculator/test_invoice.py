@@ -0,0 +1,72 @@
+from decimal import Decimal
+import unittest
+
+from canatax.calculators import SalesTaxCalculator
+from canatax.calculators.invoice import LineItem
+from canatax.enums import ProvinceOrTerritory, RoundingPolicy, TaxCategory
+from canatax.exc import InvalidDollarAmount
+
+
+CART = [
+    LineItem(19.99, 3),
+    (0.333, 7),
+    {"amount": 4.49, "quantity": Decimal("2.5"), "category": "pst_exempt"},
+    LineItem(12.5, 1, TaxCategory.EXEMPT),
+    (1249.95, 1, None),
+]
+
+
+class TestInvoice(unittest.TestCase):
+
+    def test_per_line_matches_calculate(self):
+        for year in (2024, 2025):
+            for province in ProvinceOrTerritory:
+                with self.subTest(province=province, year=year):
+                    invoice = SalesTaxCalculator.calculate_invoice(CART, province, year)
+                    for i in (0, 1, 4):
+                        amount, quantity = CART[i][0], CART[i][1]
+                        expected = SalesTaxCalculator.calculate(Decimal(amount) * Decimal(quantity), province, year)
+                        self.assertEqual(invoice.lines[i], expected)
+                    for field in ("gst", "pst", "hst", "qst", "tax_total", "before_tax"):
+                        self.assertEqual(getattr(invoice.total, field), sum(getattr(line, field) for line in invoice.lines))
+
+    def test_categories(self):
+        invoice = SalesTaxCalculator.calculate_invoice(CART, "BC")
+        pst_exempt, exempt = invoice.lines[2], invoice.lines[3]
+        self.assertEqual((pst_exempt.gst, pst_exempt.pst), (Decimal("0.56"), Decimal("0.00")))
+        self.assertEqual(exempt.tax_total, Decimal("0.00"))
+        self.assertEqual(exempt.after_tax, Decimal("12.50"))
+
+    def test_per_invoice_rounding(self):
+        # 0.10 at 5% is half a cent per line: rounded per line that is 0.01 each, per invoice 0.05 in total
+        items = [(Decimal("0.10"), 1)] * 10
+        per_line = SalesTaxCalculator.calculate_invoice(items, "AB", rounding="per_line")
+        per_invoice = SalesTaxCalculator.calculate_invoice(items, "AB", rounding=RoundingPolicy.PER_INVOICE)
+        self.assertEqual(per_line.total.gst, Decimal("0.10"))
+        self.assertEqual(per_invoice.total.gst, Decimal("0.05"))
+        self.assertEqual(sum(line.gst for line in per_invoice.lines), Decimal("0.05"))
+        for province in ProvinceOrTerritory:
+            invoice = SalesTaxCalculator.calculate_invoice(CART, province, rounding="per_invoice")
+            with self.subTest(province=province):
+                for field in ("gst", "pst", "hst", "qst", "tax_total"):
+                    self.assertEqual(getattr(invoice.total, field), sum(getattr(line, field) for line in invoice.lines))
+
+    def test_empty_and_invalid(self):
+        invoice = SalesTaxCalculator.calculate_invoice([], "ON")
+        self.assertEqual(invoice.lines, ())
+        self.assertEqual(invoice.total.after_tax, Decimal("0.00"))
+        with self.assertRaises(InvalidDollarAmount):
+            SalesTaxCalculator.calculate_invoice([(10, -1)], "ON")
+        with self.assertRaises(ValueError):
+            SalesTaxCalculator.calculate_invoice([(10, 1, "luxury")], "ON")
+
+    def test_to_dict(self):
+        data = SalesTaxCalculator.calculate_invoice(CART[:1], "ON").to_dict(prettify=True)
+        self.assertEqual(data["province"], "ON")
+        self.assertEqual(data["rounding"], "per_line")
+        self.assertEqual(data["lines"][0]["hst"], "7.80")
+        self.assertEqual(data["total"]["after_tax"], "67.77")
+
+
+if __name__ == '__main__':
+    unittest.main()
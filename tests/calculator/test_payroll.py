@@ -0,0 +1,125 @@
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+import unittest
+
+from canatax import InvalidDollarAmount, InvalidProvinceError
+from canatax.calculators import IncomeTaxCalculator, PayrollCalculator
+from canatax.enums import PayPeriod, ProvinceOrTerritory
+from canatax.tax_estimate import PayrollEstimate, PayrollEstimateColumns, PayrollYearToDate
+
+
+def _run_year(salary, province, pay_period, year=2025):
+    periods = PayPeriod(pay_period).periods_per_year
+    stubs = []
+    ytd = None
+    for _ in range(periods):
+        stub, ytd = PayrollCalculator.calculate(Decimal(salary) / periods, province, pay_period, year, ytd)
+        stubs.append(stub)
+    return stubs, ytd
+
+
+class TestPayrollCalculator(unittest.TestCase):
+
+    def test_return_types(self):
+        stub, ytd = PayrollCalculator.calculate(3000, "ON")
+        self.assertIsInstance(stub, PayrollEstimate)
+        self.assertIsInstance(ytd, PayrollYearToDate)
+        self.assertEqual(ytd.periods, 1)
+        self.assertEqual(ytd.gross_pay, Decimal(3000))
+        self.assertEqual(stub.net_pay, stub.gross_pay - stub.total_deductions)
+
+    def test_contributions_stop_at_the_annual_maximums(self):
+        plan = PayrollCalculator.compile("ON", 2025, "biweekly")
+        for pay_period in PayPeriod:
+            with self.subTest(pay_period=pay_period):
+                stubs, ytd = _run_year(250000, "ON", pay_period)
+                self.assertEqual(ytd.pension, plan.pension_max)
+                self.assertEqual(ytd.pension_second, plan.second_max)
+                self.assertEqual(ytd.ei, plan.ei_max)
+                self.assertEqual(sum(stub.cpp for stub in stubs), plan.pension_max + plan.second_max)
+                # Caps are hit mid-year and nothing is withheld afterwards
+                self.assertEqual(stubs[-1].cpp, 0)
+                self.assertEqual(stubs[-1].ei, 0)
+                self.assertGreater(stubs[0].cpp, 0)
+
+    def test_cap_reached_in_a_partial_period(self):
+        plan = PayrollCalculator.compile("ON", 2025, "monthly")
+        ytd = PayrollYearToDate(periods=11, gross_pay=Decimal(60000), insurable_earnings=Decimal(60000), ei=plan.ei_max - Decimal(10))
+        stub, ytd = plan(15000, ytd)
+        self.assertEqual(stub.ei, Decimal(10))
+        self.assertEqual(ytd.ei, plan.ei_max)
+        self.assertEqual(ytd.insurable_earnings, plan.ei_max_earnings)
+        # Only the earnings above the first ceiling attract CPP2
+        self.assertEqual(ytd.pension_second, ((Decimal(75000) - plan.second_min_earnings) * plan.second_rate).quantize(Decimal('0.01')))
+
+    def test_annual_totals_match_the_income_tax_estimate(self):
+        for province in ProvinceOrTerritory:
+            for salary in (45000, 95000, 180000):
+                with self.subTest(province=province, salary=salary):
+                    _, ytd = _run_year(salary, province, "biweekly")
+                    estimate = IncomeTaxCalculator.calculate(salary, 0, province)
+                    self.assertAlmostEqual(ytd.federal_tax, estimate.federal_tax, delta=Decimal(1))
+                    self.assertAlmostEqual(ytd.provincial_tax, estimate.provincial_tax, delta=Decimal(1))
+                    self.assertAlmostEqual(ytd.pension + ytd.pension_second, estimate.cpp + estimate.qpp, delta=Decimal(1))
+                    self.assertAlmostEqual(ytd.ei, estimate.ei, delta=Decimal(1))
+                    self.assertAlmostEqual(ytd.qpip, estimate.qpip, delta=Decimal(1))
+
+    def test_quebec_withholds_qpp_and_qpip(self):
+        stub, ytd = PayrollCalculator.calculate(4000, "QC", "semi_monthly")
+        self.assertEqual(stub.cpp, 0)
+        self.assertGreater(stub.qpp, 0)
+        self.assertGreater(stub.qpip, 0)
+        self.assertEqual(stub.total_deductions, stub.federal_tax + stub.provincial_tax + stub.qpp + stub.ei + stub.qpip)
+        stub, _ = PayrollCalculator.calculate(4000, "ON", "semi_monthly")
+        self.assertEqual((stub.qpp, stub.qpip), (0, 0))
+
+    def test_every_field_has_two_decimal_places(self):
+        for province, gross_pay in (("ON", 100), ("ON", 4000), ("QC", 100), ("QC", 4000)):
+            stub, _ = PayrollCalculator.calculate(gross_pay, province, "weekly")
+            for field, value in stub.to_dict().items():
+                if isinstance(value, Decimal):
+                    with self.subTest(province=province, gross_pay=gross_pay, field=field):
+                        self.assertEqual(value.as_tuple().exponent, -2, str(value))
+
+    def test_rrsp_fhsa_contributions_reduce_tax_only(self):
+        without, _ = PayrollCalculator.calculate(4000, "BC")
+        with_rrsp, _ = PayrollCalculator.calculate(4000, "BC", rrsp_fhsa_contributions=500)
+        self.assertLess(with_rrsp.federal_tax, without.federal_tax)
+        self.assertEqual((with_rrsp.cpp, with_rrsp.ei), (without.cpp, without.ei))
+
+    def test_calculate_many_matches_calculate(self):
+        pay = [1200, 3500.5, 9000, 0]
+        provinces = ["ON", "QC", "AB", "MB"]
+        periods = ["weekly", "biweekly", "semi_monthly", "monthly"]
+        _, previous = PayrollCalculator.calculate_many(pay, provinces, periods)
+        columns, totals = PayrollCalculator.calculate_many(pay, provinces, periods, ytd=previous)
+        self.assertIsInstance(columns, PayrollEstimateColumns)
+        self.assertEqual(len(columns), 4)
+        for index, (amount, province, period) in enumerate(zip(pay, provinces, periods)):
+            ytd = previous[index]
+            stub, expected = PayrollCalculator.calculate(amount, province, period, ytd=ytd)
+            self.assertEqual(columns[index], stub)
+            self.assertEqual(totals[index], expected)
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidProvinceError):
+            PayrollCalculator.calculate(1000, "XX")
+        with self.assertRaises(ValueError):
+            PayrollCalculator.calculate(1000, "ON", "daily")
+        with self.assertRaises(InvalidDollarAmount):
+            PayrollCalculator.calculate(-1, "ON")
+        with self.assertRaises(ValueError):
+            PayrollCalculator.calculate_many([1000, 2000], ["ON", "QC", "AB"])
+
+    def test_plans_are_shared_and_immutable(self):
+        plan = PayrollCalculator.compile("NS", 2025, PayPeriod.WEEKLY)
+        self.assertIs(plan, PayrollCalculator.compile(ProvinceOrTerritory.NOVA_SCOTIA, 2025, "weekly"))
+        with self.assertRaises(FrozenInstanceError):
+            plan.ei_rate = Decimal(0)
+        _, ytd = plan(1000)
+        with self.assertRaises(FrozenInstanceError):
+            ytd.ei = Decimal(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -78,5 +78,26 @@ class TestSalesTaxCalculator(unittest.TestCase):
 
 
 
+class TestCompiledSalesTaxCalculator(unittest.TestCase):
+
+    def test_exact_rates(self):
+        from canatax.rates.sales.base import BaseSalesTaxRate
+        rate = SalesTaxCalculator.compile("QC", 2025).tax_rate
+        self.assertEqual(rate.decimal_rates(), (Decimal('0.05'), None, None, Decimal('0.09975')))
+        self.assertIs(rate.decimal_rates(), rate.decimal_rates())
+        self.assertEqual(BaseSalesTaxRate.decimal_rates(), (None, None, None, None))
+        # 9.975% of $20 is exactly $1.995, which a binary-float rate rounded down to $1.99
+        self.assertEqual(SalesTaxCalculator.calculate(20, "QC").qst, Decimal('2.00'))
+
+    def test_compiled_calculators_are_shared_and_immutable(self):
+        calculator = SalesTaxCalculator.compile("on", 2025)
+        self.assertIs(calculator, SalesTaxCalculator.compile(ProvinceOrTerritory.ONTARIO, "2025"))
+        self.assertEqual(calculator(19.99), SalesTaxCalculator.calculate(19.99, "ON"))
+        with self.assertRaises(AttributeError):
+            calculator.province = ProvinceOrTerritory.QUEBEC
+        with self.assertRaises(AttributeError):
+            SalesTaxCalculator("BC").year = 2024
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,50 @@
+from decimal import Decimal
+import unittest
+
+from canatax.calculators import SalesTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+
+
+CENT = Decimal("0.01")
+
+
+class TestReverseSalesTax(unittest.TestCase):
+
+    def test_round_trip(self):
+        for year in (2024, 2025):
+            for province in ProvinceOrTerritory:
+                # Forward totals for every pre-tax amount up to $15, then reverse each total
+                forward = {}
+                for cents in range(1501):
+                    estimate = SalesTaxCalculator.calculate(Decimal(cents) * CENT, province, year)
+                    forward[estimate.after_tax] = estimate
+                with self.subTest(province=province, year=year):
+                    for cents in range(0, 1501, 2):
+                        total = Decimal(cents) * CENT
+                        estimate = SalesTaxCalculator.reverse(total, province, year)
+                        self.assertEqual(estimate.after_tax, total)
+                        self.assertEqual(estimate.before_tax + estimate.tax_total, total)
+                        if total in forward:
+                            self.assertEqual(estimate, forward[total])
+                        else:
+                            # Unreachable total: taxes of the largest pre-tax amount that stays under it
+                            below = forward[max(t for t in forward if t < total)]
+                            self.assertEqual((estimate.gst, estimate.pst, estimate.hst, estimate.qst), (below.gst, below.pst, below.hst, below.qst))
+
+    def test_reverse_many(self):
+        totals = [113, 0, 56.49, Decimal("1000000.01")]
+        provinces = ["ON", "QC", "BC", "AB"]
+        columns = SalesTaxCalculator.reverse_many(totals, provinces)
+        self.assertEqual(list(columns), [SalesTaxCalculator.reverse(t, p) for t, p in zip(totals, provinces)])
+        self.assertEqual(SalesTaxCalculator.reverse(113, "ON").before_tax, Decimal("100.00"))
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidDollarAmount):
+            SalesTaxCalculator.reverse(-1, "ON")
+        with self.assertRaises(InvalidProvinceError):
+            SalesTaxCalculator.reverse(10, "XX")
+
+
+if __name__ == '__main__':
+    unittest.main()
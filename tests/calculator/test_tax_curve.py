@@ -0,0 +1,116 @@
+from decimal import Decimal
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator
+from canatax.calculators.income_plan import IncomeTaxPlan
+from canatax.calculators.tax_curve import PiecewiseLinear
+from canatax.enums import ProvinceOrTerritory
+from canatax.exc import InvalidDollarAmount
+
+
+INCOMES = list(range(0, 420_001, 4_999)) + [55_867, 177_882, 200_000, 253_414]
+MIXES = [
+    {},
+    {"employment_share": Decimal("0.6"), "self_employment_share": Decimal("0.4")},
+    {"employment_share": 0, "self_employment_share": 1, "employment_income": 30000, "other_income": 5000, "rrsp_fhsa_contributions": 8000},
+]
+# The curve is unrounded; `calculate` rounds contributions and tax to the cent along the way
+TOLERANCE = Decimal("0.05")
+
+
+class TestIncomeTaxCurve(unittest.TestCase):
+
+    def test_matches_calculate_within_rounding(self):
+        for year in (2024, 2025):
+            for province in ProvinceOrTerritory:
+                for mix in MIXES:
+                    curve = IncomeTaxCalculator.tax_curve(province, year, **mix)
+                    values = curve.evaluate(INCOMES)
+                    with self.subTest(province=province, year=year, mix=mix):
+                        for i, x in enumerate(INCOMES):
+                            expected = IncomeTaxCalculator.calculate(
+                                Decimal(mix.get("employment_income", 0)) + Decimal(mix.get("employment_share", 1)) * x,
+                                Decimal(mix.get("self_employment_share", 0)) * x,
+                                province,
+                                year,
+                                mix.get("rrsp_fhsa_contributions", 0),
+                                mix.get("other_income", 0),
+                            )
+                            self.assertLessEqual(abs(values["total_tax"][i] - expected.total_tax), TOLERANCE)
+                            self.assertLessEqual(abs(values["after_tax_income"][i] - expected.after_tax_income), TOLERANCE)
+                            self.assertEqual(values["gross_income"][i], expected.gross_income)
+
+    def test_breakpoints_and_marginal_rates(self):
+        curve = IncomeTaxCalculator.tax_curve("AB", 2025)
+        self.assertEqual(len(curve.marginal_rates), len(curve.breakpoints) + 1)
+        self.assertEqual(list(curve.breakpoints), sorted(curve.breakpoints))
+        # Federal brackets, Alberta's first bracket and the federal BPA phase-out
+        for threshold in (57375, 114750, 151234, 177882, 253414):
+            self.assertIn(Decimal(threshold), curve.breakpoints)
+        # Top bracket: 33% federal plus 15% Alberta
+        self.assertAlmostEqual(curve.marginal_rates[-1], Decimal("0.48"), places=12)
+        values = curve.evaluate([Decimal(60000)])
+        self.assertEqual(values["marginal_rate"][0], curve.marginal_rates[list(curve.breakpoints).index(Decimal(57375)) + 1])
+        self.assertEqual(values["effective_rate"][0], values["total_tax"][0] / 60000)
+
+    def test_evaluates_unsorted_points_in_input_order(self):
+        curve = IncomeTaxCalculator.tax_curve("QC", 2024)
+        points = [250_000, 0, 90_000.5, 40_000]
+        values = curve.evaluate(points)["total_tax"]
+        self.assertEqual(values, [curve.evaluate([p])["total_tax"][0] for p in points])
+
+    def test_piecewise_linear_building_blocks(self):
+        plan = IncomeTaxPlan.compile("ON", 2025)
+        brackets = PiecewiseLinear.from_bracket_table(plan.federal_brackets)
+        for income in (0, 30000, 57375, 120000, 300000):
+            self.assertAlmostEqual(brackets.evaluate([Decimal(income)])[0], plan.federal_brackets.tax(Decimal(income)), places=9)
+        self.assertEqual(brackets.decimal_segments[0], tuple(Decimal(floor) for floor in plan.federal_brackets.floors))
+        self.assertEqual(brackets.segment_index(brackets.xs[1]), 1)
+        self.assertEqual(brackets.segment_index(brackets.xs[1] - 1), 0)
+        bpa = PiecewiseLinear.from_bpa_credit(plan.federal_bpa)
+        for net_income in (0, 160000, 200000, 260000):
+            self.assertAlmostEqual(bpa.evaluate([Decimal(net_income)])[0], plan.federal_bpa.credit(Decimal(net_income)), places=9)
+
+    def test_curves_are_shared(self):
+        self.assertIs(IncomeTaxCalculator.tax_curve("on"), IncomeTaxCalculator.tax_curve(ProvinceOrTerritory.ONTARIO, 2025, 1.0))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            IncomeTaxCalculator.tax_curve("ON", employment_share=0)
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.tax_curve("ON", other_income=-1)
+
+
+
+class TestGrossUp(unittest.TestCase):
+
+    def assertSmallestIncome(self, target, income, estimate):
+        self.assertGreaterEqual(estimate(income).after_tax_income, target)
+        if income > 0:
+            self.assertLess(estimate(income - Decimal("0.01")).after_tax_income, target)
+
+    def test_returns_smallest_income_reaching_target(self):
+        for year in (2024, 2025):
+            for province in ProvinceOrTerritory:
+                with self.subTest(province=province, year=year):
+                    for target in (0, 1, 12_345.67, 50_000, 98_765.43, 150_000, 310_000.01):
+                        income = IncomeTaxCalculator.gross_up(target, province, year)
+                        self.assertSmallestIncome(target, income, lambda x: IncomeTaxCalculator.calculate(x, 0, province, year))
+
+    def test_income_mix(self):
+        mix = {"employment_share": 0, "self_employment_share": 1, "employment_income": 40000, "rrsp_fhsa_contributions": 5000}
+        for target in (20_000, 60_000, 120_000):
+            income = IncomeTaxCalculator.gross_up(target, "QC", 2025, **mix)
+            self.assertSmallestIncome(target, income, lambda x: IncomeTaxCalculator.calculate(40000, x, "QC", 2025, 5000))
+
+    def test_many(self):
+        targets = [70_000, 0, 25_000.5]
+        self.assertEqual(IncomeTaxCalculator.gross_up_many(targets, "MB"), [IncomeTaxCalculator.gross_up(t, "MB") for t in targets])
+
+    def test_invalid_target(self):
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.gross_up(-5, "ON")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+from canatax import aio
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.exc import InvalidDollarAmount
+
+
+PROVINCES = ["AB", "BC", "MB", "NB", "NL", "NS", "NT", "NU", "ON", "PE", "QC", "SK", "YK"]
+ROWS = [(1_000 * i + 0.5, (i % 3) * 7_000, PROVINCES[i % len(PROVINCES)], i % 2 * 1_500) for i in range(83)]
+
+
+async def _stream(rows, pulled=None):
+    for row in rows:
+        if pulled is not None:
+            pulled.append(row)
+        await asyncio.sleep(0)
+        yield row
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+
+    def expected_income(self):
+        return [IncomeTaxCalculator.calculate(*row[:3], rrsp_fhsa_contributions=row[3]) for row in ROWS]
+
+    async def test_single_estimates_run_inline(self):
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, "run_in_executor") as run_in_executor:
+            estimate = await aio.calculate_income(85000, 0, "ON", rrsp_fhsa_contributions=2000)
+            sales = await aio.calculate_sales(19.99, "QC")
+        run_in_executor.assert_not_called()
+        self.assertEqual(estimate, IncomeTaxCalculator.calculate(85000, 0, "ON", rrsp_fhsa_contributions=2000))
+        self.assertEqual(sales, SalesTaxCalculator.calculate(19.99, "QC"))
+
+    async def test_income_batch_from_async_iterator(self):
+        estimates = [estimate async for estimate in aio.iter_income_batch(_stream(ROWS), chunk_size=10)]
+        self.assertEqual(estimates, self.expected_income())
+
+    async def test_batch_from_plain_iterable_on_processes(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            columns = await aio.calculate_income_batch(ROWS, chunk_size=16, executor=executor, engine="int")
+        self.assertEqual(list(columns), self.expected_income())
+
+    async def test_sales_batch_with_mappings(self):
+        rows = [{"amount": i * 3.33, "province": PROVINCES[i % len(PROVINCES)]} for i in range(40)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            columns = await aio.calculate_sales_batch(_stream(rows), chunk_size=7, executor=executor)
+        self.assertEqual(list(columns), [SalesTaxCalculator.calculate(row["amount"], row["province"]) for row in rows])
+
+    async def test_input_is_read_only_as_fast_as_it_is_consumed(self):
+        pulled = []
+        chunks = aio.iter_income_chunks(_stream(ROWS, pulled), chunk_size=5, max_in_flight=2)
+        first = await anext(chunks)
+        self.assertEqual(len(first), 5)
+        # The chunk just yielded and the one still in flight; nothing beyond
+        self.assertEqual(len(pulled), 10)
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(pulled), 10)
+        await chunks.aclose()
+
+    async def test_errors_propagate(self):
+        with self.assertRaises(InvalidDollarAmount):
+            [estimate async for estimate in aio.iter_income_batch([(1, 0, "ON"), (-1, 0, "ON")], chunk_size=1)]
+        with self.assertRaises(ValueError):
+            await aio.calculate_income_batch(ROWS, chunk_size=0)
+        with self.assertRaises(ValueError):
+            await anext(aio.iter_sales_chunks([(1, "ON")], max_in_flight=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
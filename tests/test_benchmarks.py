@@ -0,0 +1,20 @@
+import unittest
+
+from benchmarks.run import compare, run
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_compare_flags_only_cases_over_threshold(self):
+        baseline = {"a": 10.0, "b": 10.0, "c": 10.0}
+        results = {"a": 12.0, "b": 13.0, "c": 8.0, "new": 99.0}
+        self.assertEqual(compare(results, baseline, threshold=25), [("b", 10.0, 13.0)])
+
+    def test_run_times_every_province_for_a_case(self):
+        results = run(only="sales.calculate.2025", years=(2025,), repeat=1, number=1)
+        self.assertEqual(len(results), 13)
+        self.assertTrue(all(us > 0 for us in results.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+from decimal import Decimal, ROUND_HALF_UP
+import unittest
+
+from canatax.calculators import BaseCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.base import BracketTable
+from canatax.rates.income.tax_rates import rates_2024, rates_2025
+from canatax.utils import percent_to_decimal
+
+
+def linear_calculate_tax(brackets, income: Decimal) -> Decimal:
+    """The original bracket walk, kept as a reference for the compiled table."""
+    tax_owed = Decimal(0)
+    previous_threshold = Decimal(0)
+    for rate, threshold in brackets:
+        if income > threshold:
+            tax_owed += (Decimal(threshold) - Decimal(previous_threshold)) * percent_to_decimal(rate)
+            previous_threshold = threshold
+        else:
+            tax_owed += (income - Decimal(previous_threshold)) * percent_to_decimal(rate)
+            break
+    return tax_owed.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def rate_classes():
+    for year, module in ((2024, rates_2024), (2025, rates_2025)):
+        yield year, module.FederalIncomeTaxRate
+        for province in ProvinceOrTerritory:
+            yield year, BaseCalculator.get_income_rate_class(province, year)
+
+
+class TestBracketTable(unittest.TestCase):
+
+    def test_matches_linear_walk(self):
+        incomes = [Decimal(0), Decimal('0.01'), Decimal('1234.567891')]
+        incomes += [Decimal(n) + Decimal('0.37') for n in range(0, 1_300_000, 997)]
+        for year, klass in rate_classes():
+            rate = klass()
+            thresholds = [Decimal(t) for _, t in klass.brackets if t != float('inf')]
+            edges = [t + delta for t in thresholds for delta in (Decimal('-0.01'), Decimal(0), Decimal('0.01'))]
+            with self.subTest(year=year, rate=klass.__name__):
+                for income in incomes + edges:
+                    self.assertEqual(rate.calculate_tax(income), linear_calculate_tax(klass.brackets, income))
+
+    def test_table_is_cached_per_class(self):
+        for year, klass in rate_classes():
+            with self.subTest(year=year, rate=klass.__name__):
+                self.assertIs(klass.bracket_table(), klass.bracket_table())
+                self.assertEqual(klass().lowest_rate, percent_to_decimal(klass.brackets[0][0]))
+
+    def test_finite_last_bracket(self):
+        table = BracketTable.from_brackets([(10, 100), (20, 200)])
+        self.assertEqual(table.tax(Decimal(500)), table.tax(Decimal(200)))
+        self.assertEqual(table.bracket_index(Decimal(100)), 0)
+        self.assertEqual(table.bracket_index(Decimal('100.01')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+from threading import Thread
+import unittest
+
+from canatax.cache import EstimateCache
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+
+
+class TestEstimateCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = EstimateCache(maxsize=2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 0)
+        cache.get("c", lambda: 3)
+        self.assertEqual(cache.get("a", lambda: 0), 1)
+        self.assertEqual(cache.get("b", lambda: 20), 20)
+        self.assertEqual(cache.cache_info(), (2, 4, 2, 2))
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+        with self.assertRaises(ValueError):
+            EstimateCache(maxsize=0)
+
+    def test_thread_safety(self):
+        cache = EstimateCache(maxsize=50)
+        threads = [Thread(target=lambda: [cache.get(i % 80, lambda: i) for i in range(2_000)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 16_000)
+        self.assertLessEqual(info.currsize, 50)
+
+
+class TestCalculatorCache(unittest.TestCase):
+
+    def setUp(self):
+        IncomeTaxCalculator.enable_cache(maxsize=128)
+        SalesTaxCalculator.enable_cache(maxsize=128)
+        self.addCleanup(IncomeTaxCalculator.disable_cache)
+        self.addCleanup(SalesTaxCalculator.disable_cache)
+
+    def test_income_normalized_key(self):
+        first = IncomeTaxCalculator.calculate(80_000, 0, "on")
+        second = IncomeTaxCalculator.calculate(80_000.001, 0.0, "ON", rrsp_fhsa_contributions=Decimal(0))
+        self.assertEqual(IncomeTaxCalculator.cache_info().hits, 1)
+        self.assertEqual(first, second)
+        IncomeTaxCalculator.disable_cache()
+        self.assertEqual(first, IncomeTaxCalculator.calculate(80_000, 0, "ON"))
+        self.assertIsNone(IncomeTaxCalculator.cache_info())
+
+    def test_engines_and_amount_representations_are_cached_apart(self):
+        decimal = IncomeTaxCalculator.calculate(60_000, 0, "ON")
+        integer = IncomeTaxCalculator.calculate(60_000, 0, "ON", engine="int")
+        self.assertEqual(IncomeTaxCalculator.cache_info().misses, 2)
+        self.assertIs(IncomeTaxCalculator.calculate(60_000, 0, "ON", engine="int"), integer)
+        self.assertIs(IncomeTaxCalculator.calculate(60_000, 0, "ON"), decimal)
+        SalesTaxCalculator.calculate(100, "ON", engine="int")
+        self.assertEqual(SalesTaxCalculator.cache_info().misses, 1)
+        SalesTaxCalculator.calculate(100, "ON")
+        self.assertEqual(SalesTaxCalculator.cache_info().misses, 2)
+        self.assertEqual(str(SalesTaxCalculator.calculate(Decimal("100.00"), "ON").before_tax), "100.00")
+        self.assertEqual(str(SalesTaxCalculator.calculate(100, "ON").before_tax), "100")
+
+    def test_results_are_frozen(self):
+        first = SalesTaxCalculator.calculate(100, "BC")
+        with self.assertRaises(FrozenInstanceError):
+            first.gst = Decimal(-1)
+        self.assertIs(SalesTaxCalculator.calculate(100, "BC"), first)
+        self.assertEqual(SalesTaxCalculator.cache_info().hits, 1)
+        SalesTaxCalculator.cache_clear()
+        self.assertEqual(SalesTaxCalculator.cache_info().currsize, 0)
+
+    def test_invalid_inputs_still_raise(self):
+        with self.assertRaises(InvalidDollarAmount):
+            IncomeTaxCalculator.calculate(-1, 0, "ON")
+        with self.assertRaises(InvalidProvinceError):
+            SalesTaxCalculator.calculate(1, "ZZ")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from decimal import Decimal
+
+from canatax.__main__ import main
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def run_cli(self, *argv: str) -> tuple[int, str]:
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            code = main(list(argv))
+        return code, stderr.getvalue()
+
+    def test_income_csv_with_column_mapping(self):
+        with open(self.path("in.csv"), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "salary", "prov"])
+            writer.writerow(["a", "80000", "BC"])
+            writer.writerow(["b", "120000.50", "qc"])
+        code, stderr = self.run_cli(
+            "income", self.path("in.csv"), "-o", self.path("out.csv"),
+            "--column", "employment_income=salary", "--column", "province=prov", "--keep", "id",
+        )
+        self.assertEqual(code, 0)
+        self.assertIn("rows/s", stderr)
+        with open(self.path("out.csv"), newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["id"] for row in rows], ["a", "b"])
+        expected = IncomeTaxCalculator.calculate("120000.50", 0, "QC")
+        self.assertEqual(rows[1]["province"], "QC")
+        self.assertEqual(Decimal(rows[1]["total_tax"]), expected.total_tax)
+
+    def test_sales_jsonl(self):
+        with open(self.path("in.jsonl"), "w") as f:
+            f.write(json.dumps({"amount": 19.99}) + "\n\n")
+            f.write(json.dumps({"amount": "100", "province": "AB"}) + "\n")
+        code, _ = self.run_cli("sales", self.path("in.jsonl"), "-o", self.path("out.jsonl"), "--province", "ON", "--engine", "int", "--quiet")
+        self.assertEqual(code, 0)
+        with open(self.path("out.jsonl")) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(Decimal(rows[0]["hst"]), SalesTaxCalculator.calculate(19.99, "ON").hst)
+        self.assertEqual(rows[1]["province"], "AB")
+
+    def test_invalid_rows(self):
+        with open(self.path("in.jsonl"), "w") as f:
+            f.write(json.dumps({"amount": -1, "province": "ON"}) + "\n")
+            f.write(json.dumps({"amount": 1, "province": "ON"}) + "\n")
+        code, stderr = self.run_cli("sales", self.path("in.jsonl"), "-o", self.path("out.jsonl"))
+        self.assertEqual(code, 1)
+        self.assertIn("Row 1", stderr)
+        code, stderr = self.run_cli("sales", self.path("in.jsonl"), "-o", self.path("out.jsonl"), "--skip-invalid")
+        self.assertEqual(code, 0)
+        self.assertIn("1 skipped", stderr)
+
+    def test_malformed_jsonl_lines(self):
+        with open(self.path("bad.jsonl"), "w") as f:
+            f.write(json.dumps({"employment_income": 60000, "province": "ON"}) + "\n")
+            f.write('{"employment_income": 60000,\n')
+            f.write("[1, 2]\n")
+            f.write(json.dumps({"employment_income": 70000, "province": "AB"}) + "\n")
+        code, stderr = self.run_cli("income", self.path("bad.jsonl"), "-o", self.path("out.jsonl"))
+        self.assertEqual(code, 1)
+        self.assertIn("Row 2", stderr)
+        code, stderr = self.run_cli("--input-format", "jsonl", "--skip-invalid", "income", self.path("bad.jsonl"), "-o", self.path("out.jsonl"))
+        self.assertEqual(code, 0)
+        self.assertIn("Processed 2 rows (2 skipped)", stderr)
+        with open(self.path("out.jsonl")) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["province"] for row in rows], ["ON", "AB"])
+
+    def test_unhashable_province(self):
+        with open(self.path("in.jsonl"), "w") as f:
+            f.write(json.dumps({"employment_income": 60000, "province": ["ON"]}) + "\n")
+            f.write(json.dumps({"employment_income": 60000, "province": {"code": "ON"}}) + "\n")
+            f.write(json.dumps({"employment_income": 60000, "province": "ON"}) + "\n")
+        code, stderr = self.run_cli("income", self.path("in.jsonl"), "-o", self.path("out.jsonl"))
+        self.assertEqual(code, 1)
+        self.assertIn("Row 1", stderr)
+        code, stderr = self.run_cli("income", self.path("in.jsonl"), "-o", self.path("out.jsonl"), "--skip-invalid")
+        self.assertEqual(code, 0)
+        self.assertIn("Processed 1 rows (2 skipped)", stderr)
+
+    def test_unsupported_income_year(self):
+        with open(self.path("in.csv"), "w") as f:
+            f.write("employment_income,province\n60000,ON\n")
+        with self.assertRaises(SystemExit) as raised:
+            self.run_cli("income", self.path("in.csv"), "-o", self.path("out.csv"), "--year", "2023")
+        self.assertEqual(raised.exception.code, 2)
+        # Sales rates for other years fall back to the latest ones, as in `SalesTaxCalculator`
+        with open(self.path("in.csv"), "w") as f:
+            f.write("amount,province\n10,ON\n")
+        code, _ = self.run_cli("sales", self.path("in.csv"), "-o", self.path("out.csv"), "--year", "2023")
+        self.assertEqual(code, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
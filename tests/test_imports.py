@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Generous enough for a cold run that compiles bytecode on a busy machine; importing the calculators
+# eagerly used to take well over 100 ms.
+IMPORT_BUDGET_US = 50_000
+
+
+def _python(*args: str) -> str:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    process = subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, cwd=ROOT, env=env)
+    return process.stdout + process.stderr
+
+
+def _modules_after(code: str) -> set[str]:
+    """Run `code` in a fresh interpreter and return the canatax modules it imported."""
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(m for m in sys.modules if m.startswith('canatax'))))"
+    return set(json.loads(_python("-c", script).splitlines()[-1]))
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_canatax_loads_nothing_else(self):
+        self.assertEqual(_modules_after("import canatax"), {"canatax"})
+
+    def test_names_resolve_on_first_use(self):
+        modules = _modules_after(
+            "import canatax\n"
+            "assert canatax.IncomeTaxCalculator.__name__ == 'IncomeTaxCalculator'\n"
+            "assert 'SalesTaxCalculator' in dir(canatax)\n"
+            "from canatax import InvalidProvinceError"
+        )
+        self.assertIn("canatax.calculators.income_calculator", modules)
+        self.assertNotIn("canatax.calculators.int_engine", modules)
+        self.assertNotIn("canatax.calculators.tax_curve", modules)
+
+    def test_unknown_attribute_raises(self):
+        import canatax
+        with self.assertRaises(AttributeError):
+            canatax.NotACalculator
+
+    def test_only_the_year_used_is_loaded(self):
+        code = (
+            "from canatax import IncomeTaxCalculator\n"
+            "from canatax.rates import tables\n"
+            "IncomeTaxCalculator.calculate(60000, 0, 'ON', 2025)\n"
+            "print(tables.load_tables.cache_info().currsize)"
+        )
+        self.assertEqual(_python("-c", code).split(), ["1"])
+        modules = _modules_after(code)
+        self.assertFalse({m for m in modules if m.endswith(("rates_2024", "rates_2025"))})
+
+    def test_import_time(self):
+        """`python -X importtime -c "import canatax"` stays within budget."""
+        report = _python("-X", "importtime", "-c", "import canatax")
+        cumulative = [int(line.split("|")[1]) for line in report.splitlines() if line.rstrip().endswith("| canatax")]
+        self.assertEqual(len(cumulative), 1, report)
+        self.assertLess(cumulative[0], IMPORT_BUDGET_US)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import threading
+import unittest
+
+from canatax import InvalidDollarAmount, InvalidProvinceError
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.metrics import MetricsRegistry, metrics
+from canatax.profiling import add_hook, remove_hook
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        IncomeTaxCalculator.enable_metrics(self.registry)
+        SalesTaxCalculator.enable_metrics(self.registry)
+        self.addCleanup(IncomeTaxCalculator.disable_metrics)
+        self.addCleanup(SalesTaxCalculator.disable_metrics)
+
+    def test_default_registry(self):
+        IncomeTaxCalculator.disable_metrics()
+        self.assertIs(IncomeTaxCalculator.enable_metrics(), metrics)
+
+    def test_counts_by_calculator_province_year_and_engine(self):
+        for _ in range(3):
+            IncomeTaxCalculator.calculate(60000, 0, "ON")
+        IncomeTaxCalculator.calculate(60000, 0, "qc", 2024, engine="int")
+        SalesTaxCalculator.calculate(10, "BC")
+        estimates = self.registry.to_dict()["estimates"]
+        self.assertEqual(estimates, [
+            {"calculator": "IncomeTaxCalculator", "province": "ON", "year": 2025, "engine": "decimal", "count": 3},
+            {"calculator": "IncomeTaxCalculator", "province": "QC", "year": 2024, "engine": "int", "count": 1},
+            {"calculator": "SalesTaxCalculator", "province": "BC", "year": 2025, "engine": "decimal", "count": 1},
+        ])
+        latency = {(row["calculator"], row["engine"]): row for row in self.registry.to_dict()["latency_seconds"]}
+        self.assertEqual(latency["IncomeTaxCalculator", "decimal"]["count"], 3)
+        self.assertEqual(latency["IncomeTaxCalculator", "decimal"]["buckets"]["+Inf"], 3)
+        self.assertGreater(latency["IncomeTaxCalculator", "decimal"]["sum"], 0)
+
+    def test_validation_failures(self):
+        with self.assertRaises(InvalidProvinceError):
+            IncomeTaxCalculator.calculate(60000, 0, "ZZ")
+        with self.assertRaises(InvalidDollarAmount):
+            SalesTaxCalculator.calculate(-5, "ON")
+        with self.assertRaises(InvalidDollarAmount):
+            SalesTaxCalculator.calculate("abc", "ON")
+        self.assertEqual(self.registry.to_dict()["validation_errors"], [
+            {"calculator": "IncomeTaxCalculator", "error": "InvalidProvinceError", "count": 1},
+            {"calculator": "SalesTaxCalculator", "error": "InvalidDollarAmount", "count": 2},
+        ])
+        self.assertEqual(self.registry.to_dict()["estimates"], [])
+
+    def test_threads_record_without_losing_counts(self):
+        def work():
+            for _ in range(200):
+                SalesTaxCalculator.calculate(19.99, "QC")
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        del threads
+        self.assertEqual(self.registry.to_dict()["estimates"][0]["count"], 1600)
+
+    def test_prometheus_text(self):
+        IncomeTaxCalculator.calculate(60000, 0, "ON")
+        with self.assertRaises(InvalidProvinceError):
+            SalesTaxCalculator.calculate(1, "XX")
+        text = self.registry.to_prometheus()
+        self.assertIn('canatax_estimates_total{calculator="IncomeTaxCalculator",province="ON",year="2025",engine="decimal"} 1\n', text)
+        self.assertIn('canatax_validation_errors_total{calculator="SalesTaxCalculator",error="InvalidProvinceError"} 1\n', text)
+        self.assertIn('canatax_estimate_duration_seconds_bucket{calculator="IncomeTaxCalculator",engine="decimal",le="+Inf"} 1\n', text)
+        self.assertIn('canatax_estimate_duration_seconds_count{calculator="IncomeTaxCalculator",engine="decimal"} 1\n', text)
+        self.assertIn("# TYPE canatax_estimate_duration_seconds histogram", text)
+
+    def test_stage_histograms(self):
+        add_hook(self.registry.observe_stage)
+        try:
+            IncomeTaxCalculator.calculate(60000, 0, "ON")
+        finally:
+            remove_hook(self.registry.observe_stage)
+        stages = {row["stage"]: row["count"] for row in self.registry.to_dict()["stage_seconds"]}
+        self.assertEqual(stages["total"], 1)
+        self.assertEqual(stages["_cpp"], 1)
+
+    def test_reset_and_disable(self):
+        SalesTaxCalculator.calculate(10, "BC")
+        self.registry.reset()
+        self.assertEqual(self.registry.to_dict()["estimates"], [])
+        SalesTaxCalculator.disable_metrics()
+        SalesTaxCalculator.calculate(10, "BC")
+        self.assertEqual(self.registry.to_dict()["estimates"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
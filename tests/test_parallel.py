@@ -0,0 +1,87 @@
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.exc import InvalidDollarAmount, InvalidProvinceError
+from canatax.parallel import _run, _warm_up_income, calculate_income_batch, calculate_sales_batch, iter_income_batch
+
+
+PROVINCES = ["AB", "BC", "MB", "NB", "NL", "NS", "NT", "NU", "ON", "PE", "QC", "SK", "YK"]
+ROWS = [(1_000 * i + 0.5, (i % 3) * 7_000, PROVINCES[i % len(PROVINCES)], i % 2 * 1_500) for i in range(157)]
+
+
+class TestParallel(unittest.TestCase):
+
+    def expected_income(self):
+        return [IncomeTaxCalculator.calculate(*row[:3], rrsp_fhsa_contributions=row[3]) for row in ROWS]
+
+    def test_income_batch_in_order(self):
+        columns = calculate_income_batch(ROWS, workers=2, chunk_size=10)
+        self.assertEqual(list(columns), self.expected_income())
+
+    def test_income_batch_in_process_and_int_engine(self):
+        columns = calculate_income_batch(ROWS, workers=1, chunk_size=64, engine="int")
+        self.assertEqual(list(columns), self.expected_income())
+
+    def test_unordered_streaming(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            chunks = list(iter_income_batch(iter(ROWS), chunk_size=16, ordered=False, executor=executor))
+        self.assertEqual(sorted(offset for offset, _ in chunks), list(range(0, len(ROWS), 16)))
+        results = [None] * len(ROWS)
+        for offset, columns in chunks:
+            results[offset:offset + len(columns)] = list(columns)
+        self.assertEqual(results, self.expected_income())
+
+    def test_slow_head_chunk_stops_submission(self):
+        release = threading.Event()
+        consumed = []
+
+        def rows():
+            for i in range(1_000):
+                consumed.append(i)
+                yield i
+
+        def estimate(chunk, year, engine):
+            if chunk[0] == 0:
+                release.wait(10)
+            return chunk
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = []
+            consumer = threading.Thread(target=lambda: results.extend(_run(estimate, _warm_up_income, rows(), 2, 10, 2025, "decimal", True, executor)))
+            consumer.start()
+            time.sleep(0.3)
+            # workers=2 allows 4 chunks in flight, the blocked head included
+            self.assertLessEqual(len(consumed), 4 * 10 + 1)
+            release.set()
+            consumer.join(10)
+        self.assertEqual([offset for offset, _ in results], list(range(0, 1_000, 10)))
+
+    def test_sales_batch_with_mappings(self):
+        rows = [{"amount": i * 3.33, "province": PROVINCES[i % len(PROVINCES)]} for i in range(40)]
+        columns = calculate_sales_batch(rows, workers=2, chunk_size=7)
+        self.assertEqual(list(columns), [SalesTaxCalculator.calculate(row["amount"], row["province"]) for row in rows])
+
+    def test_sales_batch_for_a_year_without_contribution_data(self):
+        rows = [(10, "ON")] * 5
+        columns = calculate_sales_batch(rows, workers=2, chunk_size=2, year=2023)
+        self.assertEqual(list(columns), [SalesTaxCalculator.calculate(10, "ON", 2023)] * 5)
+        with self.assertRaises(NotImplementedError):
+            calculate_income_batch([(60_000, 0, "ON")], workers=2, year=2023)
+
+    def test_errors_propagate(self):
+        with self.assertRaises(InvalidDollarAmount):
+            calculate_income_batch([(1, 0, "ON"), (-1, 0, "ON")], workers=2, chunk_size=1)
+        with self.assertRaises(ValueError):
+            calculate_income_batch(ROWS, workers=1, chunk_size=0)
+
+    def test_exceptions_pickle(self):
+        error = pickle.loads(pickle.dumps(InvalidProvinceError("ZZ")))
+        self.assertEqual(str(error), str(InvalidProvinceError("ZZ")))
+
+
+if __name__ == '__main__':
+    unittest.main()
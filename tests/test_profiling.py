@@ -0,0 +1,75 @@
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.profiling import StageProfiler, add_hook, remove_hook
+
+
+ON = ProvinceOrTerritory.ONTARIO
+QC = ProvinceOrTerritory.QUEBEC
+
+
+class TestProfiling(unittest.TestCase):
+
+    def tearDown(self):
+        self.assertEqual(IncomeTaxCalculator._stage_hooks, ())
+
+    def test_stages_are_counted_per_province_and_year(self):
+        with StageProfiler() as profiler:
+            estimates = [IncomeTaxCalculator.calculate(50000 + i, 4000, "ON") for i in range(5)]
+            IncomeTaxCalculator.calculate(70000, 0, "QC", 2024)
+        self.assertEqual(estimates, [IncomeTaxCalculator.calculate(50000 + i, 4000, "ON") for i in range(5)])
+        stats = profiler.stats()
+        for stage in ("setup", "total", "_ei", "_cpp", "_qpip", "_self_employed_cpp_qpp_components",
+                      "federal.calculate_tax", "federal.get_bpa", "provincial.calculate_tax", "provincial.get_bpa",
+                      "provincial.province_specific_tax_credits"):
+            with self.subTest(stage=stage):
+                self.assertEqual(stats[ON, 2025, stage].calls, 5)
+                self.assertEqual(stats[QC, 2024, stage].calls, 1)
+        self.assertLessEqual(stats[ON, 2025, "_ei"].seconds, stats[ON, 2025, "total"].seconds)
+
+    def test_nothing_is_recorded_when_inactive(self):
+        profiler = StageProfiler()
+        IncomeTaxCalculator.calculate(50000, 0, "ON")
+        self.assertEqual(profiler.stats(), {})
+        with profiler:
+            IncomeTaxCalculator.calculate(50000, 0, "ON", engine="int")
+        IncomeTaxCalculator.calculate(50000, 0, "ON")
+        self.assertEqual(set(profiler.stats()), {(ON, 2025, "total")})
+
+    def test_hooks(self):
+        calls = []
+        hook = lambda *args: calls.append(args)
+        add_hook(hook)
+        try:
+            IncomeTaxCalculator.calculate(50000, 0, "AB")
+        finally:
+            remove_hook(hook)
+        self.assertIn("total", [stage for stage, *_ in calls])
+        self.assertTrue(all(province == ProvinceOrTerritory.ALBERTA and year == 2025 for _, province, year, _ in calls))
+        with self.assertRaises(ValueError):
+            remove_hook(hook)
+
+    def test_hooks_are_removed_on_error(self):
+        with self.assertRaises(ValueError):
+            with StageProfiler():
+                raise ValueError
+
+    def test_summary_table(self):
+        with StageProfiler() as profiler:
+            IncomeTaxCalculator.calculate(50000, 0, "ON")
+            IncomeTaxCalculator.calculate(50000, 0, "BC")
+        rows = profiler.summary(group_by=())
+        self.assertEqual((rows[0].stage, rows[0].calls, rows[0].share), ("total", 2, 1.0))
+        self.assertTrue(all(row.province is None and row.year is None for row in rows))
+        table = profiler.table()
+        self.assertIn("provincial.get_bpa", table)
+        self.assertEqual(sum(line.startswith(("ON ", "BC ")) for line in table.splitlines()), 2 * 11)
+        with self.assertRaises(ValueError):
+            profiler.summary(group_by=("stage",))
+        profiler.reset()
+        self.assertEqual(profiler.summary(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+import json
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from canatax.calculators import IncomeTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates import tables
+from canatax.rates.income.tax_rates import rates_2025
+from canatax.rates.registry import SUPPORTED_YEARS, rate_registry
+
+
+class TestRateTables(unittest.TestCase):
+
+    def test_years_come_from_data_files(self):
+        self.assertEqual(SUPPORTED_YEARS, tables.available_years())
+        self.assertTrue({2024, 2025} <= set(SUPPORTED_YEARS))
+
+    def test_tables_are_parsed_once_and_frozen(self):
+        table = tables.load_tables(2025)
+        self.assertIs(table, tables.load_tables(2025))
+        with self.assertRaises(FrozenInstanceError):
+            table.year = 2026
+        with self.assertRaises(TypeError):
+            table.provinces[ProvinceOrTerritory.ONTARIO] = None
+        with self.assertRaises(NotImplementedError):
+            tables.load_tables(1999)
+
+    def test_classes_are_shared(self):
+        self.assertIs(rates_2025.OntarioIncomeTaxRate, tables.income_rate_class(ProvinceOrTerritory.ONTARIO, 2025))
+        self.assertIs(type(rate_registry.income_rate(ProvinceOrTerritory.ONTARIO, 2025)), rates_2025.OntarioIncomeTaxRate)
+        self.assertIs(type(rate_registry.contributions(2025).cpp), tables.contribution_class('cpp', 2025))
+
+    def test_manitoba_credits(self):
+        rate = rate_registry.income_rate(ProvinceOrTerritory.MANITOBA, 2025)
+        self.assertTrue(rate.has_province_specific_tax_credits())
+        # Family tax benefit 2065 - 900, personal tax credit 195 - 100
+        self.assertEqual(rate.province_specific_tax_credits(Decimal(10000)), Decimal(1260))
+        # The family tax benefit can't exceed income
+        self.assertEqual(rate.province_specific_tax_credits(Decimal(1000)), Decimal(1000) + Decimal(185))
+        self.assertEqual(rate.province_specific_tax_credits(Decimal(30000)), Decimal(0))
+        self.assertEqual(rate.province_specific_tax_credit_breakpoints, (Decimal(2065) / Decimal('1.09'), Decimal(19500), Decimal(2065) / Decimal('0.09')))
+        self.assertFalse(rate_registry.income_rate(ProvinceOrTerritory.MANITOBA, 2024).has_province_specific_tax_credits())
+
+    def test_new_year_needs_only_a_data_file(self):
+        data = json.loads((tables.DATA / '2025.json').read_text(encoding='utf-8'))
+        data['year'] = 2031
+        data['income']['ON']['bpa'] = '20000'
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / '2031.json').write_text(json.dumps(data))
+            with mock.patch.object(tables, 'DATA', Path(directory)):
+                self.assertEqual(tables.available_years.__wrapped__(), (2031,))
+                rate = tables.income_rate_class(ProvinceOrTerritory.ONTARIO, 2031)
+        self.assertEqual(rate.get_bpa(Decimal(50000)), Decimal(20000))
+        self.assertEqual(rate.brackets, rates_2025.OntarioIncomeTaxRate.brackets)
+        self.assertIsNot(rate, rates_2025.OntarioIncomeTaxRate)
+
+    def test_estimates_for_every_year(self):
+        for year in SUPPORTED_YEARS:
+            for province in ProvinceOrTerritory:
+                with self.subTest(year=year, province=province):
+                    estimate = IncomeTaxCalculator.calculate(85000, 5000, province, year)
+                    self.assertGreater(estimate.total_tax, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
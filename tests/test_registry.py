@@ -0,0 +1,53 @@
+from dataclasses import FrozenInstanceError
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.rates.income.current_contributions import Contributions
+from canatax.rates.registry import RateRegistry, SUPPORTED_YEARS, income_rate_class, rate_registry
+
+
+class TestRateRegistry(unittest.TestCase):
+
+    def test_entries_are_shared(self):
+        registry = RateRegistry()
+        first = registry.income_rate(ProvinceOrTerritory.ONTARIO, 2025)
+        self.assertIs(first, registry.income_rate(ProvinceOrTerritory.ONTARIO, 2025))
+        self.assertIsNot(first, registry.income_rate(ProvinceOrTerritory.ONTARIO, 2024))
+        self.assertIs(registry.contributions(2024), registry.contributions("2024"))
+        stats = registry.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (2, 3, 3))
+
+    def test_preload(self):
+        registry = RateRegistry()
+        registry.preload(years=SUPPORTED_YEARS)
+        misses = registry.stats().misses
+        self.assertEqual(misses, len(SUPPORTED_YEARS) * (2 + 2 * len(ProvinceOrTerritory)))
+        for year in SUPPORTED_YEARS:
+            for province in ProvinceOrTerritory:
+                self.assertIsInstance(registry.income_rate(province, year), income_rate_class(province, year))
+        self.assertEqual(registry.stats().misses, misses)
+        registry.clear()
+        self.assertEqual(registry.stats().size, 0)
+
+    def test_unsupported_contribution_year(self):
+        registry = RateRegistry()
+        with self.assertRaises(NotImplementedError):
+            registry.contributions(1999)
+        self.assertEqual(registry.stats().size, 0)
+
+    def test_contributions_are_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            Contributions(2025).cpp = None
+
+    def test_calculators_use_registry(self):
+        income = IncomeTaxCalculator(50000, 0, "QC", year=2024)
+        self.assertIs(income.federal_tax_rate, rate_registry.federal_rate(2024))
+        self.assertIs(income.provincial_tax_rate, rate_registry.income_rate(ProvinceOrTerritory.QUEBEC, 2024))
+        self.assertIs(income.contributions, rate_registry.contributions(2024))
+        sales = SalesTaxCalculator("QC")
+        self.assertIs(sales.tax_rate, rate_registry.sales_rate(ProvinceOrTerritory.QUEBEC, 2025))
+
+
+if __name__ == '__main__':
+    unittest.main()
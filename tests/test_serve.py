@@ -0,0 +1,162 @@
+import http.client
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from canatax.__main__ import _serialize
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.serve import build_parser, make_server
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _expected(estimate) -> dict:
+    return {key: _serialize(value) for key, value in estimate.to_dict().items()}
+
+
+class TestServe(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = make_server(port=0, year=2025)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=10)
+        self.addCleanup(self.connection.close)
+
+    def request(self, method: str, path: str, body=None, content_type="application/json"):
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+        self.connection.request(method, path, body=body, headers={"Content-Type": content_type})
+        response = self.connection.getresponse()
+        return response, response.read()
+
+    def test_single_estimates_on_one_connection(self):
+        response, body = self.request("POST", "/income", {"employment_income": 85000, "province": "ON", "rrsp_fhsa_contributions": 2000})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(body), _expected(IncomeTaxCalculator.calculate(85000, 0, "ON", rrsp_fhsa_contributions=2000)))
+        # Same socket, kept alive
+        socket = self.connection.sock
+        response, body = self.request("POST", "/sales", {"amount": "19.99", "province": "QC", "year": 2024})
+        self.assertEqual(response.status, 200)
+        self.assertIs(self.connection.sock, socket)
+        self.assertEqual(json.loads(body), _expected(SalesTaxCalculator.calculate("19.99", "QC", 2024)))
+
+    def test_batch_streams_jsonl(self):
+        rows = [{"employment_income": 1000 * i, "self_employment_income": 500, "province": "BC"} for i in range(600)]
+        response, body = self.request("POST", "/income/batch", rows)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(lines, [_expected(IncomeTaxCalculator.calculate(1000 * i, 500, "BC")) for i in range(600)])
+
+    def test_batch_from_jsonl_with_bad_rows(self):
+        body = b'{"amount": 10, "province": "ON"}\n{"amount": -1, "province": "ON"}\nnot json\n{"amount": 5, "province": "AB"}\n'
+        response, body = self.request("POST", "/sales/batch", body, content_type="application/x-ndjson")
+        self.assertEqual(response.status, 200)
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0], _expected(SalesTaxCalculator.calculate(10, "ON")))
+        self.assertEqual([line["row"] for line in lines[1:3]], [1, 2])
+        self.assertEqual(lines[3], _expected(SalesTaxCalculator.calculate(5, "AB")))
+
+    def test_errors(self):
+        response, body = self.request("POST", "/income", {"employment_income": 1000, "province": "ZZ"})
+        self.assertEqual(response.status, 400)
+        self.assertIn("ZZ", json.loads(body)["error"])
+        response, body = self.request("POST", "/income", {"employment_income": 1000, "province": "ON", "bonus": 5})
+        self.assertEqual(response.status, 400)
+        response, body = self.request("POST", "/sales/batch", {"amount": 1})
+        self.assertEqual(response.status, 400)
+        response, _ = self.request("POST", "/payroll", {})
+        self.assertEqual(response.status, 404)
+        response, body = self.request("GET", "/health")
+        self.assertEqual((response.status, json.loads(body)), (200, {"status": "ok"}))
+
+    def test_invalid_content_length(self):
+        for length in ("abc", "-1"):
+            with self.subTest(length=length):
+                connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=10)
+                self.addCleanup(connection.close)
+                connection.putrequest("POST", "/sales")
+                connection.putheader("Content-Length", length)
+                connection.endheaders()
+                response = connection.getresponse()
+                self.assertEqual(response.status, 400)
+                self.assertIn("Content-Length", json.loads(response.read())["error"])
+                self.assertTrue(response.will_close)
+
+    def test_numbers_out_of_range(self):
+        response, body = self.request("POST", "/sales", {"amount": "1e30", "province": "ON"})
+        self.assertEqual(response.status, 400)
+        self.assertIn("out of range", json.loads(body)["error"])
+        response, _ = self.request("POST", "/income", '{"employment_income": 1000, "province": "ON", "year": 1e400}')
+        self.assertEqual(response.status, 400)
+        rows = [{"amount": 10, "province": "ON"}, {"amount": 1e308, "province": "ON"}, {"amount": 5, "province": "AB"}]
+        response, body = self.request("POST", "/sales/batch", rows)
+        self.assertEqual(response.status, 200)
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(lines[0], _expected(SalesTaxCalculator.calculate(10, "ON")))
+        self.assertEqual(lines[1]["row"], 1)
+        self.assertEqual(lines[2], _expected(SalesTaxCalculator.calculate(5, "AB")))
+
+    def test_unsupported_default_year(self):
+        with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit) as raised:
+            build_parser().parse_args(["--year", "2023"])
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("--year", stderr.getvalue())
+
+    def test_unsupported_year(self):
+        response, body = self.request("POST", "/income", {"employment_income": 60000, "province": "ON", "year": 2023})
+        self.assertEqual(response.status, 400)
+        self.assertIn("2023", json.loads(body)["error"])
+        rows = [{"employment_income": 60000, "province": "ON"}, {"employment_income": 60000, "province": "ON", "year": 2023},
+                {"employment_income": 70000, "province": "AB"}]
+        response, body = self.request("POST", "/income/batch", rows)
+        self.assertEqual(response.status, 200)
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(lines[0], _expected(IncomeTaxCalculator.calculate(60000, 0, "ON")))
+        self.assertEqual(lines[1]["row"], 1)
+        self.assertEqual(lines[2], _expected(IncomeTaxCalculator.calculate(70000, 0, "AB")))
+        # The connection survives
+        response, _ = self.request("GET", "/health")
+        self.assertEqual(response.status, 200)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "worker processes need fork")
+class TestServeWorkers(unittest.TestCase):
+
+    def test_workers_share_the_socket(self):
+        env = dict(os.environ, PYTHONPATH=str(ROOT))
+        process = subprocess.Popen(
+            [sys.executable, "-m", "canatax.serve", "--port", "0", "--workers", "2"],
+            stderr=subprocess.PIPE, text=True, env=env, cwd=ROOT,
+        )
+        self.addCleanup(process.wait, 10)
+        self.addCleanup(process.terminate)
+        banner = process.stderr.readline()
+        self.assertIn("2 worker(s)", banner)
+        host, port = banner.split("http://")[1].split()[0].rsplit(":", 1)
+        for _ in range(4):
+            connection = http.client.HTTPConnection(host, int(port), timeout=10)
+            connection.request("POST", "/sales", body=json.dumps({"amount": 100, "province": "ON"}))
+            response = connection.getresponse()
+            self.assertEqual(json.loads(response.read())["tax_total"], "13.00")
+            connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import statistics
+import unittest
+from unittest import mock
+
+from canatax import InvalidDollarAmount, InvalidProvinceError
+from canatax import simulation
+from canatax.calculators import IncomeTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+from canatax.simulation import FIELDS, empirical, lognormal, simulate, simulate_chunks, uniform
+
+
+HAS_NUMPY = simulation._numpy() is not None
+
+_rng = random.Random(3)
+EMPLOYMENT = [round(_rng.lognormvariate(11, 0.8), 2) for _ in range(400)]
+SELF_EMPLOYMENT = [round(_rng.uniform(0, 40000), 2) if _rng.random() < 0.3 else 0 for _ in range(400)]
+RRSP = [round(_rng.uniform(0, 15000), 2) if _rng.random() < 0.3 else 0 for _ in range(400)]
+
+
+class SimulationTests:
+    """Run against whichever backend the subclass selects."""
+
+    def test_draws_match_calculate(self):
+        for province in ProvinceOrTerritory:
+            for year in (2024, 2025):
+                result = simulate(EMPLOYMENT, SELF_EMPLOYMENT, province, year, RRSP, 1000, keep_draws=True, chunk_size=150)
+                columns = IncomeTaxCalculator.calculate_many(EMPLOYMENT, SELF_EMPLOYMENT, province, year, RRSP, 1000)
+                for field in FIELDS:
+                    with self.subTest(province=province, year=year, field=field):
+                        for simulated, exact in zip(result.draws[field], getattr(columns, field)):
+                            self.assertAlmostEqual(simulated, float(exact), delta=0.05)
+
+    def test_statistics_and_quantiles(self):
+        result = simulate(EMPLOYMENT, 0, "ON", quantiles=(0, 0.1, 0.5, 0.9, 1), keep_draws=True, chunk_size=64)
+        after_tax = list(result.draws["after_tax_income"])
+        summary = result["after_tax_income"]
+        self.assertEqual(summary.count, len(EMPLOYMENT))
+        self.assertAlmostEqual(summary.mean, statistics.fmean(after_tax), places=6)
+        self.assertAlmostEqual(summary.std, statistics.pstdev(after_tax), places=6)
+        self.assertAlmostEqual(summary.total, sum(after_tax), places=3)
+        self.assertEqual((summary.quantiles[0], summary.quantiles[1]), (min(after_tax), max(after_tax)))
+        exact = statistics.quantiles(after_tax, n=10, method="inclusive")
+        for q, expected in ((0.1, exact[0]), (0.5, exact[4]), (0.9, exact[8])):
+            self.assertAlmostEqual(summary.quantiles[q], expected, delta=expected * 2e-4)
+        self.assertIsNone(simulate(EMPLOYMENT, 0, "ON").draws)
+
+    def test_seeded_samplers_are_reproducible(self):
+        first = simulate(lognormal(60000, 0.6), uniform(0, 5000), "QC", draws=5000, seed=11, chunk_size=1000)
+        second = simulate(lognormal(60000, 0.6), uniform(0, 5000), "QC", draws=5000, seed=11, chunk_size=1000)
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertNotEqual(first.to_dict(), simulate(lognormal(60000, 0.6), 0, "QC", draws=5000, seed=12).to_dict())
+        self.assertEqual(first["qpip"].count, 5000)
+        self.assertEqual(first["cpp"].max, 0)
+        self.assertGreater(first["qpp"].mean, 0)
+
+    def test_empirical_sampler_and_chunks(self):
+        chunks = list(simulate_chunks(empirical([30000, 90000]), 0, "AB", draws=250, seed=1, chunk_size=100))
+        self.assertEqual([len(chunk["total_tax"]) for chunk in chunks], [100, 100, 50])
+        self.assertEqual({float(value) for chunk in chunks for value in chunk["employment_income"]}, {30000.0, 90000.0})
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidProvinceError):
+            simulate(50000, 0, "ZZ", draws=10)
+        with self.assertRaises(InvalidDollarAmount):
+            simulate([50000, -1], 0, "ON")
+        with self.assertRaises(InvalidDollarAmount):
+            simulate([50000, "abc"], 0, "ON")
+        with self.assertRaises(ValueError):
+            simulate(lognormal(50000, 0.5), 0, "ON")
+        with self.assertRaises(ValueError):
+            simulate([50000, 60000], [0, 0, 0], "ON")
+        with self.assertRaises(ValueError):
+            simulate(50000, 0, "ON", draws=10, quantiles=(1.5,))
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class TestNumpySimulation(SimulationTests, unittest.TestCase):
+    pass
+
+
+class TestPythonSimulation(SimulationTests, unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(simulation, "_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class TestBackendsAgree(unittest.TestCase):
+
+    def test_same_summaries(self):
+        fast = simulate(EMPLOYMENT, SELF_EMPLOYMENT, "NS", 2025, RRSP)
+        with mock.patch.object(simulation, "_numpy", return_value=None):
+            slow = simulate(EMPLOYMENT, SELF_EMPLOYMENT, "NS", 2025, RRSP)
+        for field in FIELDS:
+            with self.subTest(field=field):
+                self.assertAlmostEqual(fast[field].mean, slow[field].mean, places=6)
+                for q, value in fast[field].quantiles.items():
+                    self.assertAlmostEqual(value, slow[field].quantiles[q], places=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
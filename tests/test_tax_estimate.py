@@ -0,0 +1,36 @@
+from dataclasses import FrozenInstanceError, asdict
+from decimal import Decimal
+import unittest
+
+from canatax.calculators import IncomeTaxCalculator, SalesTaxCalculator
+from canatax.enums import ProvinceOrTerritory
+
+
+class TestTaxEstimate(unittest.TestCase):
+
+    def setUp(self):
+        self.estimates = [IncomeTaxCalculator.calculate(91_234.56, 5_000, "QC"), SalesTaxCalculator.calculate(1234.5, "BC")]
+
+    def test_slotted_and_frozen(self):
+        for estimate in self.estimates:
+            with self.subTest(estimate=type(estimate).__name__):
+                self.assertFalse(hasattr(estimate, "__dict__"))
+                with self.assertRaises(FrozenInstanceError):
+                    estimate.province = ProvinceOrTerritory.ONTARIO
+                self.assertEqual(hash(estimate), hash(type(estimate)(*estimate.to_tuple())))
+
+    def test_to_dict_and_to_tuple(self):
+        for estimate in self.estimates:
+            with self.subTest(estimate=type(estimate).__name__):
+                self.assertEqual(estimate.to_dict(), asdict(estimate))
+                self.assertEqual(estimate.to_tuple(), tuple(asdict(estimate).values()))
+                pretty = estimate.to_dict(prettify=True)
+                self.assertEqual(pretty, estimate._prettify(asdict(estimate)))
+                self.assertEqual(estimate.to_tuple(prettify=True), tuple(pretty.values()))
+        self.assertEqual(self.estimates[1].to_dict(prettify=True)["before_tax"], "1,234.50")
+        self.assertEqual(self.estimates[1].to_dict(prettify=True)["province"], "BC")
+        self.assertIsInstance(self.estimates[1].to_dict()["gst"], Decimal)
+
+
+if __name__ == '__main__':
+    unittest.main()